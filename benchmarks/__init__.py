@@ -0,0 +1,9 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Performance benchmarks of `comver` run on synthetic repositories.
+
+Consult `/benchmarks/README.md` for more information.
+"""
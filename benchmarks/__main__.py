@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Run the benchmarks (see `python -m benchmarks --help`)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import tempfile
+
+from benchmarks import generate, run
+
+
+def parser() -> argparse.ArgumentParser:
+    """Create the parser of the benchmarks.
+
+    Returns:
+        The parser.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark comver on synthetic repositories.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000],
+        help="Number of commits of the repositories (e.g. 10000 100000)",
+    )
+    parser.add_argument(
+        "--shapes",
+        nargs="+",
+        choices=list(generate.SHAPES),
+        default=list(generate.SHAPES),
+        help="Shapes of the repositories (default: all)",
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=[*run.CASES, *run.STARTUP],
+        default=[*run.CASES, *run.STARTUP],
+        help="Measured cases (default: all)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of repeats of every case (default: 3)",
+    )
+    parser.add_argument(
+        "--directory",
+        type=pathlib.Path,
+        default=pathlib.Path(tempfile.gettempdir()) / "comver-benchmarks",
+        help="Directory the repositories are generated in (and reused)",
+    )
+    parser.add_argument(
+        "--output",
+        type=pathlib.Path,
+        help="Path the JSON report is written to",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=pathlib.Path,
+        help="JSON report compared against (exit code 1 on regression)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown treated as regression (default: 0.1)",
+    )
+    return parser
+
+
+def measure(parsed: argparse.Namespace) -> list[run.Result]:
+    """Generate the repositories and measure the cases.
+
+    Args:
+        parsed:
+            Parsed arguments of the benchmarks.
+
+    Returns:
+        Measured results.
+
+    """
+    results: list[run.Result] = []
+    for size in parsed.sizes:
+        for shape in parsed.shapes:
+            repository = generate.generate(
+                parsed.directory, generate.SHAPES[shape], size
+            )
+            for name in parsed.cases:
+                if (case := run.CASES.get(name)) is not None:
+                    result = run.measure(name, case, repository, parsed.repeat)
+                    print(result, file=sys.stderr)  # noqa: T201
+                    results.append(result)
+
+    # Startup does not depend on the repository
+    results.extend(
+        run.measure(name, run.STARTUP[name], pathlib.Path("-"), parsed.repeat)
+        for name in parsed.cases
+        if name in run.STARTUP
+    )
+    return results
+
+
+def main(args: list[str] | None = None) -> None:
+    """Run the benchmarks and compare them against the baseline.
+
+    Args:
+        args:
+            Arguments of the benchmarks.
+            Default: `sys.argv[1:]`.
+
+    """
+    parsed = parser().parse_args(args)
+    results = measure(parsed)
+
+    report = json.dumps(run.report(results), indent=4)
+    if parsed.output is None:
+        print(report)  # noqa: T201
+    else:
+        parsed.output.write_text(report)
+
+    if parsed.baseline is not None:
+        baseline = json.loads(parsed.baseline.read_text())
+        lines = run.compare(results, baseline, parsed.threshold)
+        print("\n".join(lines), file=sys.stderr)  # noqa: T201
+        sys.exit(any(line.startswith("REGRESSION") for line in lines))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Deterministic synthetic repositories created by `git fast-import`.
+
+Repositories of the same shape and size are identical (same shas)
+across runs and machines, hence their timings are comparable.
+
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import random
+import subprocess
+import typing
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+    from collections.abc import Iterator
+
+EPOCH = 1_700_000_000
+"""Timestamp of the first commit."""
+
+AUTHORS = (
+    b"Alice <alice@example.com>",
+    b"Bob <bob@example.com>",
+    b"dependabot[bot] <support@github.com>",
+)
+"""Authors of the commits (chosen at random)."""
+
+PREFIXES = (
+    b"feat: ",
+    b"fix: ",
+    b"fix: ",
+    b"chore: ",
+    b"docs: ",
+    b"refactor: ",
+    b"feat!: ",
+)
+"""Prefixes of the commit messages (chosen at random)."""
+
+BUFFER = 1 << 20
+"""Number of bytes of the stream written to `git` at once."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Shape:
+    """Shape of the generated repository.
+
+    Attributes:
+        files:
+            Number of files in the tree (spread over directories).
+        merge_every:
+            Every n-th commit merges a side branch commit (`0` disables).
+        body_lines:
+            Number of lines in the body of every message.
+
+    """
+
+    files: int = 100
+    merge_every: int = 0
+    body_lines: int = 0
+
+
+SHAPES: dict[str, Shape] = {
+    "linear": Shape(),
+    "wide": Shape(files=20_000),
+    "merges": Shape(merge_every=3),
+    "long-messages": Shape(body_lines=40),
+}
+"""Shapes of the benchmarked repositories keyed by their names."""
+
+
+def path(index: int) -> bytes:
+    """Get the path of the file.
+
+    Every tenth file is documentation (e.g. excluded by path rules).
+
+    Args:
+        index:
+            Index of the file.
+
+    Returns:
+        Path of the file.
+
+    """
+    root = b"docs" if index % 10 == 0 else b"src"
+    return b"%s/module%d/file%d.py" % (root, index // 100, index)
+
+
+def data(content: bytes) -> bytes:
+    """Encode the content as `fast-import` data command.
+
+    Args:
+        content:
+            Content (e.g. message or file).
+
+    Returns:
+        Data command.
+
+    """
+    return b"data %d\n%s\n" % (len(content), content)
+
+
+def message(rng: random.Random, index: int, shape: Shape) -> bytes:
+    """Create the commit message.
+
+    Args:
+        rng:
+            Seeded random number generator.
+        index:
+            Index of the commit.
+        shape:
+            Shape of the repository.
+
+    Returns:
+        Commit message.
+
+    """
+    header = b"%schange %d" % (rng.choice(PREFIXES), index)
+    if not shape.body_lines:
+        return header
+    body = b"\n".join(
+        b"Line %d of the message body explaining the change." % line
+        for line in range(shape.body_lines)
+    )
+    return b"%s\n\n%s" % (header, body)
+
+
+def commit(  # noqa: PLR0913, PLR0917
+    rng: random.Random,
+    index: int,
+    shape: Shape,
+    ref: bytes,
+    parents: tuple[int, ...],
+    files: list[int],
+) -> bytes:
+    """Create the `fast-import` commit command.
+
+    Args:
+        rng:
+            Seeded random number generator.
+        index:
+            Index of the commit (used as its mark).
+        shape:
+            Shape of the repository.
+        ref:
+            Branch the commit is created on.
+        parents:
+            Marks of the parents (first one is the `from` parent).
+        files:
+            Indices of the files modified by the commit.
+
+    Returns:
+        Commit command.
+
+    """
+    identity = b"%s %d +0000" % (rng.choice(AUTHORS), EPOCH + index)
+    lines = [
+        b"commit %s\nmark :%d\nauthor %s\ncommitter %s\n"
+        % (ref, index, identity, identity),
+        data(message(rng, index, shape)),
+    ]
+    if parents:
+        lines.append(b"from :%d\n" % parents[0])
+    lines.extend(b"merge :%d\n" % parent for parent in parents[1:])
+    for file in files:
+        lines.append(b"M 100644 inline %s\n" % path(file))
+        lines.append(data(b"# %d changed in %d\n" % (file, index)))
+    lines.append(b"\n")
+    return b"".join(lines)
+
+
+def stream(shape: Shape, commits: int, seed: int = 0) -> Iterator[bytes]:
+    """Generate `fast-import` stream of the repository.
+
+    The first commit creates every file, the following ones modify
+    up to three files each.
+
+    Args:
+        shape:
+            Shape of the repository.
+        commits:
+            Number of commits on the main branch (merged side branch
+            commits are not counted).
+        seed:
+            Seed of the random number generator.
+
+    Yields:
+        Commands of the stream.
+
+    """
+    rng = random.Random(seed)  # noqa: S311
+    mark = 1
+    yield commit(
+        rng, mark, shape, b"refs/heads/main", (), list(range(shape.files))
+    )
+
+    for index in range(1, commits):
+        head = mark
+        parents: tuple[int, ...] = (head,)
+        if shape.merge_every and index % shape.merge_every == 0:
+            mark += 1
+            files = [rng.randrange(shape.files)]
+            yield commit(rng, mark, shape, b"refs/heads/side", (head,), files)
+            parents = (head, mark)
+        mark += 1
+        files = [rng.randrange(shape.files) for _ in range(rng.randint(1, 3))]
+        yield commit(rng, mark, shape, b"refs/heads/main", parents, files)
+
+
+def generate(
+    directory: pathlib.Path, shape: Shape, commits: int, seed: int = 0
+) -> pathlib.Path:
+    """Create the repository (reused if already generated).
+
+    Args:
+        directory:
+            Directory the repositories are generated in.
+        shape:
+            Shape of the repository.
+        commits:
+            Number of commits on the main branch.
+        seed:
+            Seed of the random number generator.
+
+    Returns:
+        Path to the repository.
+
+    """
+    name = next(name for name, value in SHAPES.items() if value == shape)
+    repository = directory / f"{name}-{commits}-{seed}"
+    if (repository / ".git" / "comver-benchmark").exists():
+        return repository
+
+    repository.mkdir(parents=True, exist_ok=True)
+    _git(repository, "init", "--quiet", "--initial-branch=main")
+    _import(repository, stream(shape, commits, seed))
+
+    # Index is populated, paths are diffed against it
+    _git(repository, "reset", "--quiet", "--hard", "main")
+    (repository / ".git" / "comver-benchmark").touch()
+    return repository
+
+
+def _import(repository: pathlib.Path, commands: Iterator[bytes]) -> None:
+    """Feed the stream to `git fast-import`.
+
+    Args:
+        repository:
+            Path to the repository.
+        commands:
+            Commands of the stream.
+
+    Raises:
+        CalledProcessError:
+            If `git fast-import` fails.
+
+    """
+    with subprocess.Popen(
+        ["git", "fast-import", "--quiet"],  # noqa: S607
+        cwd=repository,
+        stdin=subprocess.PIPE,
+    ) as process:
+        stdin = typing.cast("typing.IO[bytes]", process.stdin)
+        buffer: list[bytes] = []
+        size = 0
+        for command in commands:
+            buffer.append(command)
+            size += len(command)
+            if size >= BUFFER:
+                stdin.write(b"".join(buffer))
+                buffer, size = [], 0
+        stdin.write(b"".join(buffer))
+        stdin.close()
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, "fast-import")
+
+
+def _git(repository: pathlib.Path, *args: str) -> None:
+    """Run `git` command in the repository.
+
+    Args:
+        repository:
+            Path to the repository.
+        *args:
+            Arguments of `git`.
+
+    """
+    subprocess.run(["git", *args], cwd=repository, check=True)  # noqa: S603, S607
@@ -0,0 +1,245 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Benchmark cases, their measurement and comparison with a baseline."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import importlib.metadata
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import typing
+
+import comver
+
+from comver import plugin
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+    from collections.abc import Callable, Mapping
+
+Case = typing.Callable[["pathlib.Path"], typing.Callable[[], object]]
+"""Prepares the measured callable given path to the repository."""
+
+
+def _from_messages(repository: pathlib.Path) -> Callable[[], object]:
+    """Classify messages of the repository (read beforehand).
+
+    Args:
+        repository:
+            Path to the repository.
+
+    Returns:
+        Measured callable.
+
+    """
+    output = subprocess.run(
+        ["git", "log", "--reverse", "-z", "--format=%B"],  # noqa: S607
+        cwd=repository,
+        capture_output=True,
+        check=True,
+    ).stdout.decode()
+    messages = [message for message in output.split("\0") if message]
+    return lambda: list(comver.Version.from_messages(messages))
+
+
+def _from_git(**kwargs: typing.Any) -> Case:
+    """Calculate versions of the repository.
+
+    Args:
+        **kwargs:
+            Keyword arguments of `from_git` (e.g. rules).
+
+    Returns:
+        The benchmark case.
+
+    """
+
+    def case(repository: pathlib.Path) -> Callable[[], object]:
+        return lambda: list(
+            comver.Version.from_git(repository=str(repository), **kwargs)
+        )
+
+    return case
+
+
+def _plugin(repository: pathlib.Path) -> Callable[[], object]:
+    """Calculate version by the `pdm` plugin.
+
+    Args:
+        repository:
+            Path to the repository.
+
+    Returns:
+        Measured callable.
+
+    """
+
+    def measured() -> object:
+        # Configuration is read from the working directory
+        with contextlib.chdir(repository):
+            return plugin.pdm(repository=str(repository))
+
+    return measured
+
+
+def _startup(_: pathlib.Path) -> Callable[[], object]:
+    """Start the CLI (independent of the repository).
+
+    Returns:
+        Measured callable.
+
+    """
+    return lambda: subprocess.run(
+        [sys.executable, "-m", "comver", "--help"],
+        capture_output=True,
+        check=True,
+    )
+
+
+CASES: dict[str, Case] = {
+    "from_messages": _from_messages,
+    "from_git": _from_git(),
+    "from_git/paths": _from_git(path_excludes=["^docs/"]),
+    "from_git/authors": _from_git(author_name_excludes=[r"\[bot\]$"]),
+    "from_git/gitpython": _from_git(backend="gitpython"),
+    "plugin": _plugin,
+}
+"""Cases measured for every repository keyed by their names."""
+
+STARTUP: dict[str, Case] = {"cli/startup": _startup}
+"""Cases measured once (independent of the repository)."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Result:
+    """Timings of the benchmark case.
+
+    Attributes:
+        case:
+            Name of the case.
+        repository:
+            Name of the repository (e.g. `linear-10000-0`).
+        best:
+            Fastest of the repeats (in seconds).
+        median:
+            Median of the repeats (in seconds).
+        repeat:
+            Number of repeats.
+
+    """
+
+    case: str
+    repository: str
+    best: float
+    median: float
+    repeat: int
+
+    @property
+    def key(self) -> str:
+        """Identifier of the result (compared against baseline).
+
+        Returns:
+            Case and repository names.
+
+        """
+        return f"{self.case}@{self.repository}"
+
+
+def measure(
+    name: str, case: Case, repository: pathlib.Path, repeat: int
+) -> Result:
+    """Measure the case.
+
+    Args:
+        name:
+            Name of the case.
+        case:
+            The benchmark case.
+        repository:
+            Path to the repository.
+        repeat:
+            Number of repeats.
+
+    Returns:
+        Timings of the case.
+
+    """
+    measured = case(repository)
+    timings: list[float] = []
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        measured()
+        timings.append(time.perf_counter() - start)
+    return Result(
+        name,
+        repository.name,
+        min(timings),
+        statistics.median(timings),
+        len(timings),
+    )
+
+
+def report(results: list[Result]) -> dict[str, typing.Any]:
+    """Create JSON serializable report of the results.
+
+    Args:
+        results:
+            Measured results.
+
+    Returns:
+        Report with the environment and the results.
+
+    """
+    return {
+        "comver": importlib.metadata.version("comver"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [dataclasses.asdict(result) for result in results],
+    }
+
+
+def compare(
+    results: list[Result],
+    baseline: Mapping[str, typing.Any],
+    threshold: float,
+) -> list[str]:
+    """Compare the results against the baseline report.
+
+    Best timings are compared, as they are the least noisy.
+
+    Args:
+        results:
+            Measured results.
+        baseline:
+            Report created by [`report`][benchmarks.run.report].
+        threshold:
+            Relative slowdown treated as a regression (e.g. `0.1`).
+
+    Returns:
+        Lines describing every compared result (regressions
+        are prefixed by `REGRESSION`).
+
+    """
+    previous = {
+        Result(**result).key: Result(**result) for result in baseline["results"]
+    }
+    lines: list[str] = []
+    for result in results:
+        if (old := previous.get(result.key)) is None:
+            continue
+        ratio = result.best / old.best
+        prefix = "REGRESSION " if ratio > 1 + threshold else ""
+        lines.append(
+            f"{prefix}{result.key}: {old.best:.4f}s -> "
+            f"{result.best:.4f}s ({ratio:.2f}x)"
+        )
+    return lines
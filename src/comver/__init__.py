@@ -18,7 +18,7 @@ Important:
 
 from __future__ import annotations
 
-from comver import error, plugin, type_definitions
+from comver import error, plugin, stats, type_definitions
 from comver._version import Version, _version
 
 __version__ = _version
@@ -29,5 +29,6 @@ __all__: list[str] = [
     "__version__",
     "error",
     "plugin",
+    "stats",
     "type_definitions",
 ]
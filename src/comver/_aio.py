@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Asynchronous `git` subprocesses (used by the `asyncio` API).
+
+`git` is run via `asyncio.create_subprocess_exec` and its output
+is parsed incrementally (as by the `subprocess`
+[backend][comver._backend]), hence the event loop is never blocked
+and many repositories can be versioned concurrently.
+
+Subprocesses are killed when the consumer stops early (e.g. the task
+is cancelled or the generator is closed).
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import typing
+
+from comver import _backend, _lazy
+
+if typing.TYPE_CHECKING:
+    import os
+
+    from collections.abc import AsyncIterator, Callable, Mapping
+
+    import git
+else:
+    git = _lazy.module("git")
+
+T = typing.TypeVar("T")
+P = typing.ParamSpec("P")
+
+CHUNK = 1 << 16
+"""Number of bytes read from the subprocess at once."""
+
+
+async def blocking(  # noqa: UP047
+    function: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+) -> T:
+    """Run the blocking function (e.g. reading via `GitPython`) in a thread.
+
+    Args:
+        function:
+            Function which would block the event loop.
+        *args:
+            Positional arguments of the function.
+        **kwargs:
+            Keyword arguments of the function.
+
+    Returns:
+        Result of the function.
+
+    """
+    return await asyncio.to_thread(function, *args, **kwargs)
+
+
+@contextlib.asynccontextmanager
+async def process(
+    directory: str | os.PathLike[str], *args: str
+) -> AsyncIterator[asyncio.subprocess.Process]:
+    """Run `git` subprocess, killing it if not finished on exit.
+
+    Args:
+        directory:
+            Directory the subprocess is run in.
+        *args:
+            Arguments of `git`.
+
+    Raises:
+        GitCommandError:
+            If `git` exits with a non-zero code.
+
+    Yields:
+        The running subprocess (its `stdout` is piped).
+
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "git",
+        *args,
+        cwd=directory,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        yield proc
+    finally:
+        if proc.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            # Shielded so the subprocess is reaped even when cancelled
+            _ = await asyncio.shield(proc.wait())
+
+    if proc.returncode:
+        stderr = b"" if proc.stderr is None else await proc.stderr.read()
+        raise git.GitCommandError(["git", *args], proc.returncode, stderr)
+
+
+async def split(
+    proc: asyncio.subprocess.Process,
+) -> AsyncIterator[bytes]:
+    """Incrementally split NUL-separated output of the subprocess.
+
+    Args:
+        proc:
+            The subprocess (with piped `stdout`).
+
+    Yields:
+        Consecutive NUL-separated tokens.
+
+    """
+    stdout = typing.cast("asyncio.StreamReader", proc.stdout)
+    # Pieces of the token spanning many chunks are joined only
+    # once it is terminated (linear time for huge messages)
+    pieces: list[bytes] = []
+    while chunk := await stdout.read(CHUNK):
+        if b"\0" not in chunk:
+            pieces.append(chunk)
+            continue
+        first, *tokens, last = chunk.split(b"\0")
+        yield b"".join([*pieces, first])
+        for token in tokens:
+            yield token
+        pieces = [last]
+    _ = await proc.wait()
+    if remainder := b"".join(pieces):
+        yield remainder
+
+
+async def log(
+    directory: str | os.PathLike[str],
+    rev: str,
+    flags: Mapping[str, bool | int],
+) -> AsyncIterator[_backend.Record]:
+    """Yield commits reachable from `rev` (oldest first).
+
+    Args:
+        directory:
+            Directory of the repository.
+        rev:
+            Revision whose ancestors are walked.
+        flags:
+            Flags of `git rev-list` (traversal mode and horizon).
+
+    Yields:
+        Consecutive commits.
+
+    """
+    fields: list[bytes] = []
+    async with process(directory, *_backend.walk(flags, rev)) as proc:
+        async for token in split(proc):
+            fields.append(token)
+            if len(fields) == len(_backend.FIELDS):
+                yield _backend.Record.from_fields(fields)
+                fields.clear()
+
+
+async def changed(
+    directory: str | os.PathLike[str], sha: str
+) -> list[str | None]:
+    """Get paths changed by the commit.
+
+    Tip:
+        Output is equivalent to
+        [`comver._regex.match.changed`][comver._regex.match.changed].
+
+    Args:
+        directory:
+            Directory of the repository.
+        sha:
+            Full sha of the commit.
+
+    Returns:
+        Changed paths (source paths of renames and copies).
+
+    """
+    async with process(directory, *_backend.diff(sha)) as proc:
+        tokens = [token async for token in split(proc)]
+    return _backend.source_paths(tokens)
@@ -0,0 +1,979 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Backends reading the `git` repository during the history walk.
+
+Each backend implements the [`Backend`][comver._backend.Backend] protocol:
+
+- `subprocess` (default) runs `git` plumbing commands directly and parses
+    their NUL-separated output (no per-object overhead)
+- `gitpython` reads the objects via `GitPython`
+- `pygit2` uses `libgit2` bindings (requires `pygit2` to be installed)
+
+The backend is chosen by the `backend` argument (or configuration option),
+falling back to the `COMVER_BACKEND` environment variable.
+
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import itertools
+import os
+import subprocess
+import typing
+
+from importlib.util import find_spec
+
+from comver import _lazy, _profile, error
+
+if typing.TYPE_CHECKING:
+    from collections.abc import (
+        Generator,
+        Iterable,
+        Iterator,
+        Mapping,
+        Sequence,
+    )
+
+    import git
+else:
+    git = _lazy.module("git")
+
+CHUNK = 1 << 20
+"""Number of bytes read from the subprocess at once."""
+
+FIELDS = ("%H", "%P", "%an", "%ae", "%ct", "%B")
+"""Fields of each commit output by `git rev-list` (NUL separated)."""
+
+BACKENDS = ("subprocess", "gitpython", "pygit2")
+"""Names of available backends (the first one is the default)."""
+
+Raw = bytes | memoryview | str
+"""Field of the commit (not decoded if read from `git` output)."""
+
+
+class Record(typing.NamedTuple):
+    """Commit read by the backend.
+
+    Important:
+        Fields are kept raw (e.g. slices of the `git rev-list` output buffer)
+        and decoded only when accessed, hence fields not inspected
+        by any rule (e.g. author email) are never decoded.
+
+    Attributes:
+        sha:
+            Full sha of the commit.
+        raw_parents:
+            Space separated full shas of the parents.
+        raw_author_name:
+            Name of the author.
+        raw_author_email:
+            Email of the author.
+        raw_time:
+            Commit time (seconds since epoch).
+        raw_message:
+            Raw message of the commit.
+
+    """
+
+    sha: str
+    raw_parents: Raw
+    raw_author_name: Raw
+    raw_author_email: Raw
+    raw_time: Raw
+    raw_message: Raw
+
+    @classmethod
+    def from_fields(cls, fields: Sequence[Raw]) -> Record:
+        """Create the record from the `git rev-list` output.
+
+        Args:
+            fields:
+                Values of [`FIELDS`][comver._backend.FIELDS]
+                (see [`walk`][comver._backend.walk]).
+
+        Returns:
+            The record.
+
+        """
+        sha, *rest = fields
+        # Newline terminating the previous commit precedes the sha
+        return cls(text(sha).lstrip("\n"), *rest)
+
+    @property
+    def parents(self) -> tuple[str, ...]:
+        """Full shas of the parents."""
+        return tuple(text(self.raw_parents).split())
+
+    @property
+    def author_name(self) -> str:
+        """Name of the author."""
+        return text(self.raw_author_name)
+
+    @property
+    def author_email(self) -> str:
+        """Email of the author."""
+        return text(self.raw_author_email)
+
+    @property
+    def time(self) -> int:
+        """Commit time (seconds since epoch)."""
+        return int(text(self.raw_time))
+
+    @property
+    def message(self) -> str:
+        """Raw message of the commit."""
+        return text(self.raw_message)
+
+    def commit(
+        self, repository: git.Repo, message: str | None = None
+    ) -> git.Commit:
+        """Create `GitPython` commit.
+
+        Note:
+            Author is decoded when accessed, other attributes not read
+            by the backend (e.g. committer) are read by `GitPython`
+            lazily.
+
+        Args:
+            repository:
+                The `git` repository.
+            message:
+                Decoded message of the commit (if already decoded).
+                Default: Read lazily.
+
+        Returns:
+            The commit.
+
+        """
+        return git.Commit(
+            repository,
+            bytes.fromhex(self.sha),
+            author=author_type()(self.raw_author_name, self.raw_author_email),
+            committed_date=self.time,
+            message=message,
+            parents=[
+                git.Commit(repository, bytes.fromhex(parent))
+                for parent in self.parents
+            ],
+        )
+
+
+@functools.cache
+def author_type() -> type[git.Actor]:
+    """Create (once) the type of authors decoded on access.
+
+    Note:
+        The type is created on first use, as subclassing `git.Actor`
+        imports `GitPython`.
+
+    Returns:
+        Subclass of `git.Actor` keeping raw name and email.
+
+    """
+
+    class Author(git.Actor):
+        """Author of the commit decoded on access."""
+
+        __slots__: tuple[str, ...] = ("raw_email", "raw_name")
+
+        def __init__(  # pyright: ignore [reportMissingSuperCall]
+            self, raw_name: Raw, raw_email: Raw
+        ) -> None:
+            """Initialize the author.
+
+            Args:
+                raw_name:
+                    Raw name of the author.
+                raw_email:
+                    Raw email of the author.
+
+            """
+            self.raw_name: Raw = raw_name
+            self.raw_email: Raw = raw_email
+
+        @property
+        def name(self) -> str:  # pyright: ignore [reportIncompatibleVariableOverride]
+            """Name of the author."""
+            return text(self.raw_name)
+
+        @property
+        def email(self) -> str:  # pyright: ignore [reportIncompatibleVariableOverride]
+            """Email of the author."""
+            return text(self.raw_email)
+
+    return Author
+
+
+class Backend(typing.Protocol):
+    """Operations on the repository used during the history walk."""
+
+    def commits(
+        self,
+        rev: str | Sequence[str],
+        flags: Mapping[str, bool | int],
+        since: str | None = None,
+    ) -> Iterator[Record]:
+        """Yield commits reachable from `rev` (oldest first).
+
+        Args:
+            rev:
+                Full sha of the commit whose ancestors are walked
+                (or many of them, walking the union of their histories).
+            flags:
+                Flags of `git rev-list` (traversal mode and horizon).
+            since:
+                Full sha of the commit whose ancestors are not walked.
+                Default: Whole history is walked.
+
+        """
+        ...  # pragma: no cover
+
+    def count(
+        self,
+        rev: str,
+        flags: Mapping[str, bool | int],
+        since: str | None = None,
+    ) -> int:
+        """Count commits reachable from `rev` (as walked by `commits`).
+
+        Args:
+            rev:
+                Full sha of the commit whose ancestors are counted.
+            flags:
+                Flags of `git rev-list` (traversal mode and horizon).
+            since:
+                Full sha of the commit whose ancestors are not counted.
+                Default: Whole history is counted.
+
+        """
+        ...  # pragma: no cover
+
+    def changed(self, sha: str) -> list[str | None]:
+        """Get paths changed by the commit.
+
+        See [`comver._regex.match.changed`][comver._regex.match.changed].
+
+        Args:
+            sha:
+                Full sha of the commit.
+
+        """
+        ...  # pragma: no cover
+
+    def resolve(self, rev: str) -> str:
+        """Get full sha of the commit pointed to by the revision.
+
+        Args:
+            rev:
+                Any revision (e.g. branch, tag or `HEAD~3`).
+
+        """
+        ...  # pragma: no cover
+
+    def is_ancestor(self, ancestor: str, rev: str) -> bool:
+        """Check whether `ancestor` is an ancestor of `rev`.
+
+        Note:
+            Missing commits are not ancestors of anything.
+
+        Args:
+            ancestor:
+                Sha of the possible ancestor.
+            rev:
+                Sha of the descendant.
+
+        """
+        ...  # pragma: no cover
+
+
+class Subprocess:
+    """Backend running `git` plumbing commands."""
+
+    def __init__(self, repository: git.Repo) -> None:
+        """Initialize the backend.
+
+        Args:
+            repository:
+                The `git` repository.
+
+        """
+        self.directory: str = str(repository.working_dir)
+
+    def commits(
+        self,
+        rev: str | Sequence[str],
+        flags: Mapping[str, bool | int],
+        since: str | None = None,
+    ) -> Iterator[Record]:
+        """Yield commits reachable from `rev` (oldest first).
+
+        Args:
+            rev:
+                Full sha of the commit whose ancestors are walked
+                (or many of them, walking the union of their histories).
+            flags:
+                Flags of `git rev-list` (traversal mode and horizon).
+            since:
+                Full sha of the commit whose ancestors are not walked.
+                Default: Whole history is walked.
+
+        Returns:
+            Iterator of consecutive commits.
+
+        """
+        return self.log(flags, *revisions(rev, since))
+
+    def log(
+        self, flags: Mapping[str, bool | int], *revisions: str
+    ) -> Iterator[Record]:
+        """Yield commits selected by the revisions (oldest first).
+
+        Args:
+            flags:
+                Flags of `git rev-list` (traversal mode and horizon).
+            *revisions:
+                Revisions as understood by `git rev-list`
+                (e.g. `old..new` or `new --not --all`).
+
+        Yields:
+            Consecutive commits.
+
+        """
+        fields: list[Raw] = []
+        for token in self._stream(*walk(flags, *revisions)):
+            fields.append(token)
+            if len(fields) == len(FIELDS):
+                yield Record.from_fields(fields)
+                fields.clear()
+
+    def count(
+        self,
+        rev: str,
+        flags: Mapping[str, bool | int],
+        since: str | None = None,
+    ) -> int:
+        """Count commits reachable from `rev` (as walked by `commits`).
+
+        Args:
+            rev:
+                Full sha of the commit whose ancestors are counted.
+            flags:
+                Flags of `git rev-list` (traversal mode and horizon).
+            since:
+                Full sha of the commit whose ancestors are not counted.
+                Default: Whole history is counted.
+
+        Returns:
+            Number of commits.
+
+        """
+        return int(
+            self._run(
+                "rev-list", "--count", *options(flags), *revisions(rev, since)
+            )
+        )
+
+    def changed(self, sha: str) -> list[str | None]:
+        """Get paths changed by the commit.
+
+        Args:
+            sha:
+                Full sha of the commit.
+
+        Returns:
+            Changed paths.
+
+        """
+        return source_paths(self._stream(*diff(sha)))
+
+    def resolve(self, rev: str) -> str:
+        """Get full sha of the commit pointed to by the revision.
+
+        Args:
+            rev:
+                Any revision (e.g. branch, tag or `HEAD~3`).
+
+        Returns:
+            Full sha of the commit.
+
+        """
+        return self._run("rev-parse", "--verify", f"{rev}^{{commit}}").strip()
+
+    def is_ancestor(self, ancestor: str, rev: str) -> bool:
+        """Check whether `ancestor` is an ancestor of `rev`.
+
+        Args:
+            ancestor:
+                Sha of the possible ancestor.
+            rev:
+                Sha of the descendant.
+
+        Returns:
+            `True` if `ancestor` is reachable from `rev`.
+
+        """
+        return (
+            subprocess.run(  # noqa: S603
+                ["git", "merge-base", "--is-ancestor", ancestor, rev],  # noqa: S607
+                cwd=self.directory,
+                capture_output=True,
+                check=False,
+            ).returncode
+            == 0
+        )
+
+    def _run(self, *args: str) -> str:
+        """Run `git` command.
+
+        Args:
+            *args:
+                Arguments of `git`.
+
+        Raises:
+            GitCommandError:
+                If `git` exits with a non-zero code.
+
+        Returns:
+            Standard output of the command.
+
+        """
+        result = subprocess.run(  # noqa: S603
+            ["git", *args],  # noqa: S607
+            cwd=self.directory,
+            capture_output=True,
+            check=False,
+        )
+        if result.returncode:
+            raise git.GitCommandError(
+                ["git", *args], result.returncode, result.stderr
+            )
+        _profile.count("bytes", len(result.stdout))
+        return result.stdout.decode()
+
+    def _stream(self, *args: str) -> Iterator[bytes | memoryview]:
+        """Incrementally split NUL-separated output of `git` command.
+
+        Note:
+            The subprocess is killed if the consumer stops early.
+
+        Tip:
+            Tokens are slices of the read buffers (not copied), only tokens
+            spanning consecutive buffers are joined.
+
+        Args:
+            *args:
+                Arguments of `git`.
+
+        Raises:
+            GitCommandError:
+                If `git` exits with a non-zero code.
+
+        Yields:
+            Consecutive NUL-separated tokens.
+
+        """
+        with subprocess.Popen(  # noqa: S603
+            ["git", *args],  # noqa: S607
+            cwd=self.directory,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ) as process:
+            stdout = typing.cast("typing.IO[bytes]", process.stdout)
+            remainder: list[memoryview] = []
+            try:
+                while chunk := stdout.read1(CHUNK):  # pyright: ignore [reportAttributeAccessIssue]
+                    _profile.count("bytes", len(chunk))
+                    remainder = yield from tokens(chunk, remainder)
+            except BaseException:
+                process.kill()
+                raise
+            stderr = typing.cast("typing.IO[bytes]", process.stderr).read()
+        if process.returncode:
+            raise git.GitCommandError(
+                ["git", *args], process.returncode, stderr
+            )
+        if remainder:
+            yield b"".join(remainder)
+
+
+class GitPython:
+    """Backend reading the objects via `GitPython`."""
+
+    def __init__(self, repository: git.Repo) -> None:
+        """Initialize the backend.
+
+        Args:
+            repository:
+                The `git` repository.
+
+        """
+        self.repository: git.Repo = repository
+
+    def commits(
+        self,
+        rev: str | Sequence[str],
+        flags: Mapping[str, bool | int],
+        since: str | None = None,
+    ) -> Iterator[Record]:
+        """Yield commits reachable from `rev` (oldest first).
+
+        Args:
+            rev:
+                Full sha of the commit whose ancestors are walked
+                (or many of them, walking the union of their histories).
+            flags:
+                Flags of `git rev-list` (traversal mode and horizon).
+            since:
+                Full sha of the commit whose ancestors are not walked.
+                Default: Whole history is walked.
+
+        Yields:
+            Consecutive commits.
+
+        """
+        for commit in self.repository.iter_commits(
+            revisions(rev, since), reverse=True, **flags
+        ):
+            yield Record(
+                commit.hexsha,
+                " ".join(parent.hexsha for parent in commit.parents),
+                str(commit.author.name),
+                str(commit.author.email),
+                str(commit.committed_date),
+                str(commit.message),
+            )
+
+    def count(
+        self,
+        rev: str,
+        flags: Mapping[str, bool | int],
+        since: str | None = None,
+    ) -> int:
+        """Count commits reachable from `rev` (as walked by `commits`).
+
+        Args:
+            rev:
+                Full sha of the commit whose ancestors are counted.
+            flags:
+                Flags of `git rev-list` (traversal mode and horizon).
+            since:
+                Full sha of the commit whose ancestors are not counted.
+                Default: Whole history is counted.
+
+        Returns:
+            Number of commits.
+
+        """
+        return int(
+            self.repository.git.rev_list(
+                "--count", *revisions(rev, since), **flags
+            )
+        )
+
+    def changed(self, sha: str) -> list[str | None]:
+        """Get paths changed by the commit.
+
+        Args:
+            sha:
+                Full sha of the commit.
+
+        Returns:
+            Changed paths.
+
+        """
+        return [diff.a_path for diff in self.repository.commit(sha).diff()]
+
+    def resolve(self, rev: str) -> str:
+        """Get full sha of the commit pointed to by the revision.
+
+        Args:
+            rev:
+                Any revision (e.g. branch, tag or `HEAD~3`).
+
+        Returns:
+            Full sha of the commit.
+
+        """
+        return self.repository.commit(rev).hexsha
+
+    def is_ancestor(self, ancestor: str, rev: str) -> bool:
+        """Check whether `ancestor` is an ancestor of `rev`.
+
+        Args:
+            ancestor:
+                Sha of the possible ancestor.
+            rev:
+                Sha of the descendant.
+
+        Returns:
+            `True` if `ancestor` is reachable from `rev`.
+
+        """
+        try:
+            return self.repository.is_ancestor(ancestor, rev)
+        except git.GitCommandError:
+            return False
+
+
+class Pygit2:
+    """Backend using `libgit2` bindings.
+
+    Note:
+        Commits of concurrent branches with equal commit times
+        may be walked in a different order than by `git` itself.
+
+    """
+
+    def __init__(self, repository: git.Repo) -> None:
+        """Initialize the backend.
+
+        Args:
+            repository:
+                The `git` repository.
+
+        """
+        self.pygit2: typing.Any = importlib.import_module("pygit2")
+        self.repository: typing.Any = self.pygit2.Repository(
+            str(repository.git_dir)
+        )
+
+    def commits(
+        self,
+        rev: str | Sequence[str],
+        flags: Mapping[str, bool | int],
+        since: str | None = None,
+    ) -> Iterator[Record]:
+        """Yield commits reachable from `rev` (oldest first).
+
+        Args:
+            rev:
+                Full sha of the commit whose ancestors are walked
+                (or many of them, walking the union of their histories).
+            flags:
+                Flags of `git rev-list` (traversal mode and horizon).
+            since:
+                Full sha of the commit whose ancestors are not walked.
+                Default: Whole history is walked.
+
+        Note:
+            Commits older than `max_age` are filtered out by their
+            committer date (`git` also skips their ancestors).
+
+        Yields:
+            Consecutive commits.
+
+        """
+        sort = self.pygit2.enums.SortMode
+        max_count = flags.get("max_count")
+        first, *rest = [rev] if isinstance(rev, str) else rev
+        walker = self.repository.walk(
+            first,
+            # The newest commits are counted, hence reversed afterwards
+            sort.TOPOLOGICAL | sort.TIME | (0 if max_count else sort.REVERSE),
+        )
+        for tip in rest:
+            walker.push(tip)
+        if since is not None:
+            walker.hide(since)
+        if flags.get("first_parent"):
+            walker.simplify_first_parent()
+        commits = (
+            commit
+            for commit in walker
+            if (not flags.get("merges") or len(commit.parent_ids) > 1)
+            and commit.commit_time >= flags.get("max_age", 0)
+        )
+        if max_count:
+            commits = reversed(list(itertools.islice(commits, max_count)))
+        for commit in commits:
+            yield Record(
+                str(commit.id),
+                " ".join(str(parent) for parent in commit.parent_ids),
+                commit.author.name,
+                commit.author.email,
+                str(commit.commit_time),
+                commit.message,
+            )
+
+    def count(
+        self,
+        rev: str,
+        flags: Mapping[str, bool | int],
+        since: str | None = None,
+    ) -> int:
+        """Count commits reachable from `rev` (as walked by `commits`).
+
+        Args:
+            rev:
+                Full sha of the commit whose ancestors are counted.
+            flags:
+                Flags of `git rev-list` (traversal mode and horizon).
+            since:
+                Full sha of the commit whose ancestors are not counted.
+                Default: Whole history is counted.
+
+        Returns:
+            Number of commits.
+
+        """
+        return sum(1 for _ in self.commits(rev, flags, since))
+
+    def changed(self, sha: str) -> list[str | None]:
+        """Get paths changed by the commit.
+
+        Args:
+            sha:
+                Full sha of the commit.
+
+        Returns:
+            Changed paths.
+
+        """
+        # Same as `git diff <sha> --cached -M`
+        changes = self.repository.index.diff_to_tree(self.repository[sha].tree)
+        changes.find_similar()
+        return [delta.old_file.path for delta in changes.deltas]
+
+    def resolve(self, rev: str) -> str:
+        """Get full sha of the commit pointed to by the revision.
+
+        Args:
+            rev:
+                Any revision (e.g. branch, tag or `HEAD~3`).
+
+        Returns:
+            Full sha of the commit.
+
+        """
+        return str(
+            self.repository.revparse_single(rev).peel(self.pygit2.Commit).id
+        )
+
+    def is_ancestor(self, ancestor: str, rev: str) -> bool:
+        """Check whether `ancestor` is an ancestor of `rev`.
+
+        Args:
+            ancestor:
+                Sha of the possible ancestor.
+            rev:
+                Sha of the descendant.
+
+        Returns:
+            `True` if `ancestor` is reachable from `rev`.
+
+        """
+        try:
+            return ancestor == rev or self.repository.descendant_of(
+                rev, ancestor
+            )
+        except (KeyError, ValueError, self.pygit2.GitError):
+            return False
+
+
+def load(repository: git.Repo, backend: str | None = None) -> Backend:
+    """Create the backend.
+
+    Args:
+        repository:
+            The `git` repository.
+        backend:
+            Name of the backend (one of [`BACKENDS`][comver._backend.BACKENDS]).
+            Default: `COMVER_BACKEND` environment variable OR `subprocess`.
+
+    Raises:
+        BackendUnavailableError:
+            If the backend is unknown or its dependencies are not installed.
+
+    Returns:
+        The backend.
+
+    """
+    backend = backend or os.environ.get("COMVER_BACKEND") or BACKENDS[0]
+    if backend == "subprocess":
+        return Subprocess(repository)
+    if backend == "gitpython":
+        return GitPython(repository)
+    if backend == "pygit2" and find_spec("pygit2") is not None:
+        return Pygit2(repository)
+    raise error.BackendUnavailableError(backend)
+
+
+def options(flags: Mapping[str, bool | int]) -> list[str]:
+    """Convert keyword flags (as used by `GitPython`) to CLI options.
+
+    Args:
+        flags:
+            Flags, e.g. `{"first_parent": True, "max_count": 100}`.
+
+    Returns:
+        Options, e.g. `["--first-parent", "--max-count=100"]`.
+
+    """
+    return [
+        f"--{flag.replace('_', '-')}"
+        if value is True
+        else f"--{flag.replace('_', '-')}={value}"
+        for flag, value in flags.items()
+        if value
+    ]
+
+
+def revisions(rev: str | Sequence[str], since: str | None = None) -> list[str]:
+    """Get `git rev-list` revisions of the walked commits.
+
+    Args:
+        rev:
+            Full sha of the commit whose ancestors are walked (or many).
+        since:
+            Full sha of the commit whose ancestors are not walked.
+            Default: Whole history is walked.
+
+    Returns:
+        Revisions, e.g. `["<rev>", "^<since>"]`.
+
+    """
+    tips = [rev] if isinstance(rev, str) else list(rev)
+    return tips if since is None else [*tips, f"^{since}"]
+
+
+def walk(flags: Mapping[str, bool | int], *revisions: str) -> tuple[str, ...]:
+    """Get arguments of `git` outputting commits selected by the revisions.
+
+    Note:
+        Plumbing `git rev-list` is used, as the output of `git log`
+        depends on the user configuration (e.g. `log.showSignature`
+        or notes). Messages are re-encoded to UTF-8 no matter
+        the `i18n.logOutputEncoding`.
+
+    Warning:
+        `--no-commit-header` requires `git` 2.33 or newer.
+
+    Args:
+        flags:
+            Flags of `git rev-list` (traversal mode and horizon).
+        *revisions:
+            Revisions as understood by `git rev-list`.
+
+    Returns:
+        Arguments of `git` outputting NUL-terminated
+        [`FIELDS`][comver._backend.FIELDS] of every commit (oldest
+        first), followed by a newline (parsed by
+        [`Record.from_fields`][comver._backend.Record.from_fields]).
+
+    """
+    return (
+        "rev-list",
+        "--reverse",
+        "--no-commit-header",
+        "--encoding=UTF-8",
+        f"--format={'%x00'.join(FIELDS)}%x00",
+        *options(flags),
+        *revisions,
+        "--",
+    )
+
+
+def diff(sha: str) -> tuple[str, ...]:
+    """Get arguments of `git` diffing the commit (as `GitPython` does).
+
+    Args:
+        sha:
+            Full sha of the commit.
+
+    Returns:
+        Arguments of `git` outputting NUL-separated raw diff
+        (parsed by [`source_paths`][comver._backend.source_paths]).
+
+    """
+    return (
+        "diff",
+        sha,
+        "--cached",
+        "--abbrev=40",
+        "--full-index",
+        "-M",
+        "--raw",
+        "-z",
+        "--no-color",
+    )
+
+
+def text(field: Raw) -> str:
+    """Decode the field (if not decoded already).
+
+    Args:
+        field:
+            Raw field.
+
+    Returns:
+        Decoded field (undecodable bytes are replaced).
+
+    """
+    if isinstance(field, str):
+        return field
+    return str(field, "utf-8", "replace")
+
+
+def tokens(
+    chunk: bytes, remainder: list[memoryview]
+) -> Generator[bytes | memoryview, None, list[memoryview]]:
+    """Yield complete NUL-separated tokens of the read buffer.
+
+    Args:
+        chunk:
+            Buffer read from the subprocess.
+        remainder:
+            Pieces of the token started in the previous buffers.
+
+    Yields:
+        Slices of the buffer (or joined pieces of the token spanning
+        consecutive buffers).
+
+    Returns:
+        Pieces of the token not terminated in this buffer.
+
+    """
+    view = memoryview(chunk)
+    start = 0
+    while (end := chunk.find(b"\0", start)) != -1:
+        if remainder:
+            yield b"".join([*remainder, view[start:end]])
+            remainder = []
+        else:
+            yield view[start:end]
+        start = end + 1
+    if start < len(chunk):
+        remainder = [*remainder, view[start:]]
+    return remainder
+
+
+def source_paths(tokens: Iterable[Raw]) -> list[str | None]:
+    """Parse source paths of the NUL-separated raw diff.
+
+    Args:
+        tokens:
+            Consecutive NUL-separated tokens of the diff.
+
+    Returns:
+        Source paths of the changes (renames and copies are followed
+        by two paths, the second one is skipped).
+
+    """
+    paths: list[str | None] = []
+    expected, skipped = False, False
+    for token in tokens:
+        if expected:
+            paths.append(text(token))
+            expected = False
+        elif skipped:
+            skipped = False
+        elif (meta := text(token)).startswith(":"):
+            expected = True
+            skipped = meta.split()[-1][:1] in {"R", "C"}
+    return paths
@@ -0,0 +1,541 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""On-disk checkpoints of version calculations.
+
+Checkpoints are stored inside the `.git` directory (under `comver/`),
+one file per configuration, so no cache ever leaks into the working tree
+and every set of rules gets its own checkpoints. Next to them
+a [history index][comver._index] of every yielded commit is kept
+(and optionally a [SQLite history store][comver._store]).
+
+A checkpoint is only recorded at a commit whose whole ancestry was
+walked up to this point (the walked prefix has exactly one tip),
+which for merge-based workflows are commits on the first-parent chain.
+All checkpoints therefore lie on a single ancestry chain, which allows
+a binary search once the history was rewritten (e.g. rebase or a force
+push).
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import pathlib
+import sqlite3
+import tempfile
+import typing
+
+from comver import _index, _lazy, _profile, _store
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    import git
+
+    from comver._backend import Backend
+    from comver._version import Version
+    from comver.type_definitions import OptionalStringsOrPatterns
+else:
+    git = _lazy.module("git")
+
+FORMAT = 1
+"""Version of the on-disk format, bumped on incompatible changes."""
+
+RULES = (
+    "message_includes",
+    "message_excludes",
+    "path_includes",
+    "path_excludes",
+    "author_name_includes",
+    "author_name_excludes",
+    "author_email_includes",
+    "author_email_excludes",
+    "major_regexes",
+    "minor_regexes",
+    "patch_regexes",
+)
+"""Names of the rules the cache [`key`][comver._cache.key] is built from."""
+
+INTERVAL = 1000
+"""Default number of walked commits between consecutive checkpoints."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Checkpoint:
+    """State of the version calculation after walking a given commit.
+
+    Attributes:
+        sha:
+            Commit up to which (inclusive) the history was walked.
+        version:
+            Version (`major`, `minor`, `patch`) after walking `sha`.
+        commit:
+            Sha of the last yielded commit (may differ from `sha` when
+            filtering is used), `None` if nothing was yielded yet.
+        position:
+            Number of commits walked (filtered ones included).
+        yielded:
+            Number of `VersionCommit`s yielded up to this point.
+
+    """
+
+    sha: str
+    version: tuple[int, int, int]
+    commit: str | None
+    position: int
+    yielded: int
+
+
+def key(
+    traversal: str | None = None,
+    max_message_size: int | None = None,
+    scopes: Mapping[str, str] | None = None,
+    base: Mapping[str, typing.Any] | None = None,
+    **rules: OptionalStringsOrPatterns,
+) -> str:
+    """Create a cache key unique to the rules used for calculation.
+
+    Args:
+        traversal:
+            Traversal mode of the history (only non-default modes
+            change the key).
+        max_message_size:
+            Maximal number of matched characters of messages
+            (changes the key only if set).
+        scopes:
+            Sections of messages scanned by the message rules
+            (changes the key only if set).
+        base:
+            History horizon and the version before it
+            (changes the key only if set).
+        **rules:
+            Regexes used for calculation (e.g. `path_includes`),
+            either strings or compiled patterns.
+
+    Returns:
+        Hex digest identifying the rules.
+
+    """
+    normalized: dict[str, typing.Any] = {
+        name: None
+        if regexes is None
+        else [getattr(regex, "pattern", regex) for regex in regexes]
+        for name, regexes in rules.items()
+    }
+    if traversal not in {None, "all"}:
+        normalized["traversal"] = traversal
+    if max_message_size is not None:
+        normalized["max_message_size"] = max_message_size
+    if scopes:
+        normalized["scopes"] = dict(scopes)
+    if base:
+        normalized["base"] = dict(base)
+    # Dates parsed by TOML (e.g. `since`) are stringified
+    stringified = json.dumps([FORMAT, normalized], sort_keys=True, default=str)
+    return hashlib.sha256(stringified.encode()).hexdigest()
+
+
+class Cache:
+    """Checkpoints of a single configuration in a single repository.
+
+    The cache is used in three steps:
+
+    - [`resume`][comver._cache.Cache.resume] finds the checkpoint
+        the walk can start from (if any)
+    - [`update`][comver._cache.Cache.update] is called for every walked commit
+    - [`save`][comver._cache.Cache.save] persists the new checkpoints
+
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        interval: int | None = None,
+        sqlite: bool | None = None,  # noqa: FBT001
+        flags: Mapping[str, bool] | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            path:
+                File where checkpoints are stored.
+            interval:
+                Number of walked commits between checkpoints.
+                Default: `1000`
+            sqlite:
+                Whether the SQLite history store should be kept as well.
+                Default: `False`
+            flags:
+                Flags of `git rev-list` used for the walk
+                (e.g. `first_parent`). Default: No flags.
+
+        """
+        self.path: pathlib.Path = path
+        self.interval: int = INTERVAL if interval is None else interval
+        self.sqlite: bool = bool(sqlite)
+        self.flags: Mapping[str, bool] = {} if flags is None else flags
+        self.tip: Checkpoint | None = None
+        self.checkpoints: list[Checkpoint] = []
+
+        self._childless: set[str] = set()
+        self._last: Checkpoint | None = None
+        self._kept: int = 0
+        self._records: list[_index.Record] = []
+        self._rows: list[_store.Row] = []
+
+    @property
+    def index(self) -> pathlib.Path:
+        """Path to the history index of yielded commits.
+
+        Returns:
+            Path to the index file (might not exist yet).
+
+        """
+        return self.path.with_suffix(".idx")
+
+    @property
+    def store(self) -> pathlib.Path:
+        """Path to the SQLite history store of yielded commits.
+
+        Returns:
+            Path to the database (might not exist yet).
+
+        """
+        return self.path.with_suffix(".sqlite")
+
+    @classmethod
+    def load(
+        cls,
+        repository: git.Repo,
+        key: str,
+        interval: int | None = None,
+        sqlite: bool | None = None,  # noqa: FBT001
+        flags: Mapping[str, bool] | None = None,
+    ) -> Cache:
+        """Load checkpoints of the repository for a given `key`.
+
+        Note:
+            Missing, corrupted or incompatible cache files are treated
+            as an empty cache.
+
+        Args:
+            repository:
+                The `git` repository.
+            key:
+                Key identifying the configuration (see
+                [`key`][comver._cache.key]).
+            interval:
+                Number of walked commits between checkpoints.
+                Default: `1000`
+            sqlite:
+                Whether the SQLite history store should be kept as well.
+                Default: `False`
+            flags:
+                Flags of `git rev-list` used for the walk
+                (e.g. `first_parent`). Default: No flags.
+
+        Returns:
+            Cache with checkpoints read from the disk (if any).
+
+        """
+        cache = cls(
+            pathlib.Path(repository.git_dir) / "comver" / key,
+            interval,
+            sqlite,
+            flags,
+        )
+        with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+            data = json.loads(cache.path.with_suffix(".json").read_text())
+            if data["format"] == FORMAT:
+                cache.checkpoints = [_load(c) for c in data["checkpoints"]]
+                cache.tip = None if data["tip"] is None else _load(data["tip"])
+        return cache
+
+    def resume(
+        self, repository: git.Repo, reader: Backend, rev: str
+    ) -> Checkpoint | None:
+        """Find the checkpoint from which `rev` can be calculated.
+
+        The cached tip is used directly if it is an ancestor of `rev`.
+        Otherwise (history was rewritten) the `merge-base` of both is found,
+        and the nearest checkpoint below it is used (found by
+        binary search, as checkpoints lie on a single ancestry chain).
+
+        Tip:
+            `git merge-base` uses the commit-graph generation numbers
+            when available (see `git commit-graph write`), keeping
+            the ancestry checks cheap on large repositories.
+
+        Warning:
+            The checkpoint is used only if the commits walked after it
+            are exactly the newest commits of `rev` (otherwise the order
+            of commits, and possibly the version, would differ from
+            the full walk).
+
+        Args:
+            repository:
+                The `git` repository.
+            reader:
+                Backend walking the history (commits after the checkpoint
+                are ordered as in the walk).
+            rev:
+                Full sha of the commit the version is calculated for.
+
+        Returns:
+            Checkpoint to resume from or `None` if the history has to be
+            walked from the very beginning.
+
+        """
+        checkpoint = self._find(repository, rev)
+        if checkpoint is not None and not self._ordered(
+            reader, checkpoint, rev
+        ):
+            checkpoint = None
+        if checkpoint is not None and not self._indexed(checkpoint):
+            checkpoint = None
+
+        self.checkpoints = [
+            c
+            for c in self.checkpoints
+            if checkpoint is not None and c.position <= checkpoint.position
+        ]
+        self._childless = set() if checkpoint is None else {checkpoint.sha}
+        self._last = checkpoint
+        self._kept = 0 if checkpoint is None else checkpoint.yielded
+        _profile.count("cache.misses" if checkpoint is None else "cache.hits")
+        self._records, self._rows = [], []
+        return checkpoint
+
+    def update(
+        self,
+        commit: git.Commit,
+        version: Version,
+        *,
+        included: bool,
+    ) -> None:
+        """Record walked commit (creating checkpoints when applicable).
+
+        Args:
+            commit:
+                Commit which was walked.
+            version:
+                Version after walking the commit.
+            included:
+                Whether the commit was yielded (e.g. it was not filtered
+                out by path or author).
+
+        """
+        self._childless.difference_update(p.hexsha for p in commit.parents)
+        self._childless.add(commit.hexsha)
+
+        last = self._last or Checkpoint("", (0, 0, 0), None, 0, 0)
+        self._last = Checkpoint(
+            sha=commit.hexsha,
+            version=(version.major, version.minor, version.patch),
+            commit=commit.hexsha if included else last.commit,
+            position=1 + last.position,
+            yielded=int(included) + last.yielded,
+        )
+        if included:
+            self._records.append(
+                (
+                    bytes.fromhex(commit.hexsha),
+                    version.major,
+                    version.minor,
+                    version.patch,
+                )
+            )
+        if included and self.sqlite:
+            self._rows.append(
+                (
+                    last.yielded,
+                    commit.hexsha,
+                    commit.committed_date,
+                    version.major,
+                    version.minor,
+                    version.patch,
+                )
+            )
+
+        if len(self._childless) == 1 and self._last.position - (
+            self.checkpoints[-1].position if self.checkpoints else 0
+        ) >= max(self.interval, 1):
+            self.checkpoints.append(self._last)
+
+    def save(self) -> None:
+        """Atomically persist checkpoints (and the walked tip) to the disk.
+
+        Note:
+            Cache is a best-effort optimization, failures to write it
+            (e.g. read-only repository) are silently ignored.
+
+        Note:
+            Only commits walked since [`resume`][comver._cache.Cache.resume]
+            are appended to the history index.
+
+        """
+        # Tip is valid only if the whole ancestry was walked
+        if len(self._childless) == 1 and self._last is not None:
+            self.tip = self._last
+        data = {
+            "format": FORMAT,
+            "tip": None if self.tip is None else dataclasses.asdict(self.tip),
+            "checkpoints": [dataclasses.asdict(c) for c in self.checkpoints],
+        }
+        with contextlib.suppress(OSError, sqlite3.Error):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            _index.append(self.index, self._kept, self._records)
+            if self.sqlite:
+                with _store.Store(self.store) as store:
+                    store.replace(self._kept, self._rows)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.path.parent, delete=False, suffix=".tmp"
+            ) as handle:
+                json.dump(data, handle)
+            pathlib.Path(handle.name).replace(self.path.with_suffix(".json"))
+
+    def _ordered(
+        self, reader: Backend, checkpoint: Checkpoint, rev: str
+    ) -> bool:
+        """Check whether commits after the checkpoint are the newest of `rev`.
+
+        Note:
+            For the first-parent traversal the checkpoint
+            has to lie on the first-parent chain of `rev` as well.
+
+        Args:
+            reader:
+                Backend walking the history.
+            checkpoint:
+                Checkpoint the walk would be resumed from.
+            rev:
+                Full sha of the commit the version is calculated for.
+
+        Returns:
+            `True` if the walk can be resumed from the checkpoint.
+
+        """
+        if checkpoint.sha == rev:
+            return True
+        # Both oldest first
+        new = [r.sha for r in reader.commits(rev, self.flags, checkpoint.sha)]
+        newest = [
+            r.sha
+            for r in reader.commits(
+                rev, {**self.flags, "max_count": len(new) + 1}
+            )
+        ]
+        if not self.flags.get("first_parent"):
+            return new == newest[len(newest) - len(new) :]
+        return [checkpoint.sha, *new] == newest
+
+    def _indexed(self, checkpoint: Checkpoint) -> bool:
+        """Check whether the history index (and store) contains the checkpoint.
+
+        Args:
+            checkpoint:
+                Checkpoint the walk would be resumed from.
+
+        Returns:
+            `True` if the index can be extended from the checkpoint.
+
+        """
+        if checkpoint.commit is None:
+            return True
+        with _index.Index(self.index) as index:
+            if len(index) < checkpoint.yielded or index.record(
+                checkpoint.yielded - 1
+            )[0] != bytes.fromhex(checkpoint.commit):
+                return False
+        if not self.sqlite:
+            return True
+        with (
+            contextlib.suppress(sqlite3.Error),
+            _store.Store(self.store) as store,
+        ):
+            return store.sha(checkpoint.yielded - 1) == checkpoint.commit
+        return False
+
+    def _find(self, repository: git.Repo, rev: str) -> Checkpoint | None:
+        """Find the newest checkpoint which is an ancestor of `rev`.
+
+        Args:
+            repository:
+                The `git` repository.
+            rev:
+                Full sha of the commit the version is calculated for.
+
+        Returns:
+            The newest usable checkpoint (if any).
+
+        """
+        if self.tip is None:
+            return None
+        if self.tip.sha == rev or is_ancestor(repository, self.tip.sha, rev):
+            return self.tip
+
+        try:
+            base = repository.git.merge_base(self.tip.sha, rev)
+        except git.GitCommandError:
+            return None
+
+        low, high = 0, len(self.checkpoints)
+        while low < high:
+            middle = (low + high) // 2
+            if is_ancestor(repository, self.checkpoints[middle].sha, base):
+                low = middle + 1
+            else:
+                high = middle
+        return self.checkpoints[low - 1] if low else None
+
+
+def is_ancestor(repository: git.Repo, ancestor: str, rev: str) -> bool:
+    """Check whether `ancestor` is an ancestor of `rev`.
+
+    Note:
+        Missing commits (e.g. garbage collected after a rewrite)
+        are not ancestors of anything.
+
+    Args:
+        repository:
+            The `git` repository.
+        ancestor:
+            Sha of the possible ancestor.
+        rev:
+            Sha of the descendant.
+
+    Returns:
+        `True` if `ancestor` is reachable from `rev`.
+
+    """
+    try:
+        return repository.is_ancestor(ancestor, rev)
+    except git.GitCommandError:
+        return False
+
+
+def _load(data: dict[str, typing.Any]) -> Checkpoint:
+    """Create a checkpoint from its JSON representation.
+
+    Args:
+        data:
+            Dictionary read from the cache file.
+
+    Returns:
+        Checkpoint.
+
+    """
+    major, minor, patch = data["version"]
+    return Checkpoint(
+        sha=data["sha"],
+        version=(int(major), int(minor), int(patch)),
+        commit=data["commit"],
+        position=int(data["position"]),
+        yielded=int(data["yielded"]),
+    )
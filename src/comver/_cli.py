@@ -25,7 +25,9 @@ def main(args: list[str] | None = None) -> None:
 
     """
     parsed_args = _parser.root().parse_args(args)
-    subcommand = getattr(_subcommand, parsed_args.subcommand, None)
+    subcommand = getattr(
+        _subcommand, parsed_args.subcommand.replace("-", "_"), None
+    )
 
     # Cannot be `None`, but left to make pyright feel at peace
     if subcommand is None:  # pragma: no cover
@@ -0,0 +1,240 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Configuration related internal functionalities.
+
+Besides top-level options, the configuration may declare named
+components (e.g. packages of a monorepo), each one overriding
+any of the [`OPTIONS`][comver._config.OPTIONS] (`traversal` is
+shared by all of them, as they are calculated during a single walk):
+
+```toml
+[tool.comver]
+author_email_excludes = ["bot@example.com"]
+
+[tool.comver.components.core]
+path_includes = ["packages/core/*"]
+
+[tool.comver.components.cli]
+path_includes = ["packages/cli/*"]
+```
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import hashlib
+import json
+import tomllib
+import typing
+import warnings
+
+import loadfig
+
+from comver import _cache, _lazy, _regex, error
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    import git
+else:
+    git = _lazy.module("git")
+
+OPTIONS = (
+    *_cache.RULES,
+    "unrecognized_message",
+    "max_message_size",
+    "scopes",
+)
+"""Options which components can override."""
+
+OPTIONAL = ("max_message_size", "scopes")
+"""Options omitted from checksums when not set (added after the release)."""
+
+WALK = (
+    "traversal",
+    "backend",
+    "cache",
+    "checkpoint_interval",
+    "sqlite",
+    "base",
+)
+"""Options of the whole history walk (shared by all components)."""
+
+
+def load(directory: str | None = None) -> dict[str, typing.Any]:
+    """Load the `comver` configuration and check its regexes.
+
+    Regexes which may take super-linear time to match (see
+    [`safety`][comver._regex.safety]) are reported by
+    [`RegexUnsafeWarning`][comver.error.RegexUnsafeWarning]
+    (unless matched by the linear time `re2` engine).
+
+    Args:
+        directory:
+            Directory the configuration is searched from.
+            Default: Current working directory.
+
+    Returns:
+        The `comver` configuration.
+
+    """
+    return _checked(loadfig.config("comver", directory=directory))
+
+
+def load_committed(
+    repository: git.Repo, rev: str = "HEAD"
+) -> dict[str, typing.Any]:
+    """Load the `comver` configuration committed to the repository.
+
+    Used for repositories without a working tree (e.g. bare mirrors),
+    where the configuration cannot be searched for on the disk.
+    As in [`load`][comver._config.load], `.comver.toml` takes
+    precedence over the `[tool.comver]` section of `pyproject.toml`
+    (both taken from the root of the `rev` tree).
+
+    Args:
+        repository:
+            The `git` repository.
+        rev:
+            Commit (or any other revision) the configuration is read from.
+            Default: `HEAD`
+
+    Returns:
+        The `comver` configuration (empty if none was committed).
+
+    """
+    for file, section in (
+        (".comver.toml", ()),
+        ("pyproject.toml", ("tool", "comver")),
+    ):
+        # Missing files are skipped
+        with contextlib.suppress(git.GitCommandError):
+            config = tomllib.loads(repository.git.show(f"{rev}:{file}"))
+            for key in section:
+                config = config.get(key, {})
+            return _checked(config)
+    return {}
+
+
+def _checked(config: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    """Report regexes of the configuration which may be slow to match.
+
+    Args:
+        config:
+            The `comver` configuration.
+
+    Returns:
+        The configuration (unchanged).
+
+    """
+    if _regex.engine() != "re2":
+        for option, pattern in _patterns(config):
+            if (reason := _regex.safety.reason(pattern)) is not None:
+                warnings.warn(
+                    error.RegexUnsafeWarning(option, pattern, reason),
+                    stacklevel=1,
+                )
+    return config
+
+
+def checksum(config: Mapping[str, typing.Any]) -> str:
+    """Get checksum of the options affecting calculated versions.
+
+    Args:
+        config:
+            Options to calculate the checksum of (e.g. of a component).
+
+    Returns:
+        Hex digest of the options.
+
+    """
+    config = collections.defaultdict(lambda: None, config)
+
+    # Get only relevant sections of the dict (unset newer options
+    # are omitted to keep checksums of older releases)
+    subconfig = {
+        k: config[k]
+        for k in OPTIONS
+        if k not in OPTIONAL or config[k] is not None
+    }
+    # Default traversal is omitted to keep checksums of older releases
+    if config["traversal"] not in {None, "all"}:
+        subconfig["traversal"] = config["traversal"]
+    # History horizon changes versions, but is not set by older releases
+    if config["base"]:
+        subconfig["base"] = config["base"]
+    # Dates parsed by TOML (e.g. `since` of the `base`) are stringified
+    stringified = json.dumps(subconfig, sort_keys=True, default=str)
+    return hashlib.sha256(stringified.encode()).hexdigest()
+
+
+def _patterns(config: Mapping[str, typing.Any]) -> Iterator[tuple[str, str]]:
+    """Get regexes of the configuration (components included).
+
+    Args:
+        config:
+            The `comver` configuration.
+
+    Yields:
+        Option (e.g. `components.core.path_includes`) and its regex.
+
+    """
+    declared: Mapping[str, Mapping[str, typing.Any]] = (
+        config.get("components") or {}
+    )
+    for prefix, options in (
+        ("", config),
+        *((f"components.{name}.", declared[name]) for name in declared),
+    ):
+        for option in _cache.RULES:
+            for pattern in options.get(option) or ():
+                yield f"{prefix}{option}", str(pattern)
+
+
+def components(
+    config: Mapping[str, typing.Any],
+    names: Iterable[str] | None = None,
+) -> dict[str, dict[str, typing.Any]]:
+    """Get options of components (top-level options used as defaults).
+
+    Args:
+        config:
+            The `comver` configuration.
+        names:
+            Names of the components to get.
+            Default: All declared components.
+
+    Raises:
+        ComponentNotFoundError:
+            If any of the `names` is not declared.
+        HorizonComponentsError:
+            If the history horizon (`base`) is configured
+            (components are calculated from the whole history).
+
+    Returns:
+        Options of each component (keyed by its name).
+
+    """
+    declared: Mapping[str, Mapping[str, typing.Any]] = (
+        config.get("components") or {}
+    )
+    for name in names or ():
+        if name not in declared:
+            raise error.ComponentNotFoundError(name)
+    if config.get("base"):
+        raise error.HorizonComponentsError(list(names or declared))
+
+    return {
+        name: {
+            **{
+                option: declared[name].get(option, config.get(option))
+                for option in OPTIONS
+            },
+            "traversal": config.get("traversal"),
+        }
+        for name in (declared if names is None else names)
+    }
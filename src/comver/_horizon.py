@@ -0,0 +1,243 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""History horizons, i.e. walking only the recent history.
+
+Old history (unrelated to the current version) is replaced
+by the version it resulted in (the `base`):
+
+```toml
+[tool.comver.base]
+version = "4.0.0"
+# Ancestors of the commit (itself included) are not walked
+sha = "d1e714b..."
+# AND/OR commits older than the date are not walked
+since = "2020-01-01"
+```
+
+The horizon is pushed down to `git` (as `sha..rev` range,
+`--max-age` and `--max-count` options), hence commits past it
+are never read.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import typing
+
+from comver import error
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+@dataclasses.dataclass(frozen=True)
+class Horizon:
+    """Validated history horizon.
+
+    Attributes:
+        version:
+            Version of the history before the horizon.
+        sha:
+            Commit whose ancestors (itself included) are not walked
+            (`None` if not set).
+        limits:
+            Options of `git rev-list` (`max_age` as a UNIX timestamp
+            and/or `max_count`) limiting the walk.
+
+    """
+
+    version: str
+    sha: str | None
+    limits: dict[str, int]
+
+
+def resolve(base: Mapping[str, typing.Any] | None) -> Horizon | None:
+    """Validate the `base` and convert it to `git` limits.
+
+    Note:
+        Dates without timezone are treated as UTC (see
+        [`timestamp`][comver._horizon.timestamp]), hence the horizon
+        does not depend on the timezone of the machine.
+
+    Args:
+        base:
+            The `base` (see [`Base`][comver.type_definitions.Base]).
+            Default: No horizon, the whole history is walked.
+
+    Raises:
+        HorizonInvalidError:
+            If the `base` has unknown keys, no (or malformed) `version`,
+            malformed `sha`, `since` or non-positive `max_commits`.
+
+    Returns:
+        The horizon or `None` if no `base` was provided.
+
+    """
+    if not base:
+        return None
+    parsed: dict[str, typing.Any] = {}
+    # Missing version is reported as any other malformed key
+    for key, value in {"version": None, **base}.items():
+        try:
+            parsed[key] = _PARSERS[key](value)
+        except (KeyError, TypeError, ValueError) as e:
+            raise error.HorizonInvalidError(key, value) from e
+
+    limits = {
+        flag: parsed[key]
+        for key, flag in (("since", "max_age"), ("max_commits", "max_count"))
+        if key in parsed
+    }
+    return Horizon(parsed["version"], parsed.get("sha"), limits)
+
+
+def cached(horizon: Horizon | None) -> bool:
+    """Check whether walks up to the horizon can be checkpointed.
+
+    Note:
+        The `max_commits` horizon moves with every new commit,
+        hence such walks are never cached.
+
+    Args:
+        horizon:
+            The horizon (`None` if the whole history is walked).
+
+    Returns:
+        `True` unless `max_commits` is set.
+
+    """
+    return horizon is None or "max_count" not in horizon.limits
+
+
+def timestamp(moment: dt.datetime) -> float:
+    """Convert the datetime to UNIX timestamp.
+
+    Note:
+        Naive datetimes are treated as UTC by every date of `comver`
+        (`since` of the `base`, `Version.on`, `Version.query`
+        and `comver query`), hence results do not depend
+        on the timezone of the machine.
+
+    Args:
+        moment:
+            Point in time (naive ones are in UTC).
+
+    Returns:
+        UNIX timestamp of the datetime.
+
+    """
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=dt.UTC)
+    return moment.timestamp()
+
+
+def _string(value: typing.Any) -> str:
+    """Check the value is a string (e.g. `sha`).
+
+    Args:
+        value:
+            Value of the key.
+
+    Raises:
+        TypeError:
+            If the value is not a string.
+
+    Returns:
+        The string.
+
+    """
+    if not isinstance(value, str):
+        raise TypeError
+    return value
+
+
+def _version(version: typing.Any) -> str:
+    """Check the version is in `MAJOR.MINOR.PATCH` format.
+
+    Note:
+        Checked as by
+        [`Version.from_string`][comver._version.Version.from_string]
+        (which cannot be imported, as it imports this module).
+
+    Args:
+        version:
+            Version of the history before the horizon (e.g. `4.0.0`).
+
+    Raises:
+        TypeError:
+            If the version is not a string.
+        ValueError:
+            If it does not comprise of `3` integers (e.g. `4.0`).
+
+    Returns:
+        The version.
+
+    """
+    parts = _string(version).split(".")
+    if len(parts) != 3:  # noqa: PLR2004
+        raise ValueError
+    for part in parts:
+        _ = int(part)
+    return version
+
+
+def _timestamp(since: typing.Any) -> int:
+    """Convert the date to UNIX timestamp (as expected by `--max-age`).
+
+    Args:
+        since:
+            ISO 8601 date (or datetime, naive ones are in UTC), either
+            a string or parsed by TOML (e.g. `since = 2020-01-01`).
+
+    Raises:
+        TypeError:
+            If the value is not a date.
+
+    Returns:
+        UNIX timestamp of the date.
+
+    """
+    if isinstance(since, str):
+        since = dt.datetime.fromisoformat(since)
+    if not isinstance(since, dt.date):
+        raise TypeError
+    if not isinstance(since, dt.datetime):
+        since = dt.datetime.combine(since, dt.time())
+    return int(timestamp(since))
+
+
+def _count(max_commits: typing.Any) -> int:
+    """Check the number of walked commits (as expected by `--max-count`).
+
+    Args:
+        max_commits:
+            Maximal number of (newest) commits walked.
+
+    Raises:
+        TypeError:
+            If it is not an integer.
+        ValueError:
+            If it is not positive.
+
+    Returns:
+        The number of commits.
+
+    """
+    if not isinstance(max_commits, int) or isinstance(max_commits, bool):
+        raise TypeError
+    if max_commits < 1:
+        raise ValueError
+    return max_commits
+
+
+_PARSERS: dict[str, Callable[[typing.Any], typing.Any]] = {
+    "version": _version,
+    "sha": _string,
+    "since": _timestamp,
+    "max_commits": _count,
+}
+"""Parsers of the `base` keys (raising `TypeError` or `ValueError`)."""
@@ -0,0 +1,469 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Memory-mapped, append-only index of versions of commits.
+
+The file consists of a header (magic bytes and format version)
+followed by runs, each being:
+
+- run header (commit order position of its first commit
+    and number of records)
+- records sorted by sha, each being a `20` byte sha followed by three
+    `uint32`s (`major`, `minor` and `patch`)
+- `uint32` positions of the above records in commit order
+    (relative to the start of the run)
+
+Every save appends a single run with the new commits only. A run
+supersedes all of the earlier runs starting at (or after) its start,
+hence the index is truncated (e.g. after the history was rewritten)
+by appending as well. Small runs are merged (by appending the merged
+run) so there are only `O(log n)` of them, and the whole file
+is compacted (atomically rewritten) once superseded runs
+outweigh the live ones.
+
+Writers hold an exclusive lock (on POSIX systems) and never shrink
+nor overwrite the file, hence readers (which mapped a shorter file)
+are not affected by concurrent saves.
+
+As every element has fixed width, the file is read via `mmap`
+(shared between processes, no parsing needed) and looked up
+in `O(log^2 n)` time (by sha via sorted records of each run,
+by version via commit order, as versions never decrease).
+
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import mmap
+import pathlib
+import string
+import struct
+import sys
+import tempfile
+import typing
+
+if sys.platform != "win32":
+    import fcntl
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from types import TracebackType
+
+HEADER = struct.Struct("<4sI")
+"""Magic bytes and format version."""
+
+RUN = struct.Struct("<II")
+"""Commit order position of the first record of the run and their number."""
+
+RECORD = struct.Struct("<20sIII")
+"""Binary sha, `major`, `minor` and `patch`."""
+
+POSITION = struct.Struct("<I")
+"""Position of a record (sorted by sha) in the commit order of the run."""
+
+MAGIC = b"CMVX"
+"""Magic bytes identifying the index file."""
+
+FORMAT = 2
+"""Version of the on-disk format, bumped on incompatible changes."""
+
+Record = tuple[bytes, int, int, int]
+"""Binary sha, `major`, `minor` and `patch` of a commit."""
+
+
+def is_sha(sha: str) -> bool:
+    """Check whether `sha` is a full hexadecimal sha.
+
+    Args:
+        sha:
+            Sha to check.
+
+    Returns:
+        `True` if `sha` has `40` hexadecimal characters.
+
+    """
+    return len(sha) == 40 and all(c in string.hexdigits for c in sha)  # noqa: PLR2004
+
+
+class Run(typing.NamedTuple):
+    """Live (not superseded) run of the index file."""
+
+    start: int
+    """Commit order position of the first record."""
+
+    length: int
+    """Number of records."""
+
+    offset: int
+    """Offset of the first record (sorted by sha) in the file."""
+
+
+class Index:
+    """Read-only view of the index file.
+
+    Note:
+        Missing or corrupted files are treated as an empty index,
+        runs which were not fully written (and the ones after them)
+        are ignored.
+
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """Map the index file into memory.
+
+        Args:
+            path:
+                Path to the index file.
+
+        """
+        self._buffer: mmap.mmap | None = None
+        self._runs: list[Run] = []
+        self._end: int = 0
+
+        with contextlib.suppress(OSError, ValueError, struct.error):
+            with path.open("rb") as handle:
+                self._buffer = mmap.mmap(
+                    handle.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            if HEADER.unpack_from(self._buffer) == (MAGIC, FORMAT):
+                self._end = HEADER.size
+                self._parse()
+
+    def __len__(self) -> int:
+        """Number of records in the index.
+
+        Returns:
+            Number of indexed commits.
+
+        """
+        return _end(self._runs)
+
+    @property
+    def runs(self) -> list[Run]:
+        """Live runs of the index (oldest first).
+
+        Returns:
+            Contiguous runs covering all of the records.
+
+        """
+        return self._runs
+
+    @property
+    def end(self) -> int:
+        """Offset after the last fully written run.
+
+        Returns:
+            Size of the valid part of the file (`0` if the file
+            is missing or corrupted).
+
+        """
+        return self._end
+
+    def __enter__(self) -> typing.Self:
+        """Use index as a context manager (unmapping it afterwards).
+
+        Returns:
+            The index itself.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Unmap the index file.
+
+        Args:
+            exc_type:
+                Type of the exception (if any).
+            exc_value:
+                The exception (if any).
+            traceback:
+                Traceback of the exception (if any).
+
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the index file."""
+        if self._buffer is not None:
+            self._buffer.close()
+        self._buffer, self._runs, self._end = None, [], 0
+
+    def record(self, position: int) -> Record:
+        """Get the record at a given position in commit order.
+
+        Args:
+            position:
+                Position of the commit (`0` is the oldest one).
+
+        Returns:
+            Binary sha and version of the commit.
+
+        """
+        run = self._runs[
+            bisect.bisect_right(self._runs, position, key=lambda r: r.start) - 1
+        ]
+        return self._sorted(run, self._position(run, position - run.start))
+
+    def records(self, length: int | None = None) -> Iterable[Record]:
+        """Iterate over the records in commit order.
+
+        Args:
+            length:
+                Number of records to return. Default: all of them.
+
+        Yields:
+            Binary sha and version of each commit.
+
+        """
+        for position in range(len(self) if length is None else length):
+            yield self.record(position)
+
+    def find(self, sha: bytes) -> Record | None:
+        """Find the commit by its sha.
+
+        Args:
+            sha:
+                Binary (`20` bytes) sha of the commit.
+
+        Returns:
+            Record of the commit (if it was indexed).
+
+        """
+        for run in self._runs:
+            index = bisect.bisect_left(
+                range(run.length), sha, key=lambda i: self._sorted(run, i)[0]
+            )
+            if index < run.length and self._sorted(run, index)[0] == sha:
+                return self._sorted(run, index)
+        return None
+
+    def first(self, version: tuple[int, int, int]) -> int | None:
+        """Find the first commit (in commit order) with a given version.
+
+        Args:
+            version:
+                `major`, `minor` and `patch` of the version.
+
+        Returns:
+            Commit order position of the first commit with `version`
+            (if any).
+
+        """
+        length = len(self)
+        position = bisect.bisect_left(
+            range(length), version, key=lambda p: self.record(p)[1:]
+        )
+        if position == length or self.record(position)[1:] != version:
+            return None
+        return position
+
+    def _parse(self) -> None:
+        """Find the live runs (and the end of the fully written ones)."""
+        buffer = typing.cast("mmap.mmap", self._buffer)
+        while self._end + RUN.size <= len(buffer):
+            start, length = RUN.unpack_from(buffer, self._end)
+            end = self._end + RUN.size + length * (RECORD.size + POSITION.size)
+            runs = [r for r in self._runs if r.start < start]
+            # Runs have to be complete and contiguous with the earlier ones
+            if end > len(buffer) or _end(runs) != start:
+                break
+            if length:
+                runs.append(Run(start, length, self._end + RUN.size))
+            self._runs, self._end = runs, end
+
+    def _sorted(self, run: Run, index: int) -> Record:
+        """Get the record at a given position in sha order of the run.
+
+        Args:
+            run:
+                Run containing the record.
+            index:
+                Position of the record in sha order.
+
+        Returns:
+            Binary sha and version of the commit.
+
+        """
+        return RECORD.unpack_from(
+            typing.cast("mmap.mmap", self._buffer),
+            run.offset + index * RECORD.size,
+        )
+
+    def _position(self, run: Run, position: int) -> int:
+        """Get the sha order index of a commit order position in the run.
+
+        Args:
+            run:
+                Run containing the record.
+            position:
+                Position of the commit relative to the start of the run.
+
+        Returns:
+            Position of the record in sha order of the run.
+
+        """
+        return POSITION.unpack_from(
+            typing.cast("mmap.mmap", self._buffer),
+            run.offset + run.length * RECORD.size + position * POSITION.size,
+        )[0]
+
+
+def append(path: pathlib.Path, kept: int, records: Sequence[Record]) -> None:
+    """Keep first `kept` records of the index file and append new ones.
+
+    Only the new records (and the runs merged with them) are written,
+    unless the file is missing, corrupted (e.g. ends with a partially
+    written run) or mostly superseded, in which case it is atomically
+    rewritten. Concurrent writers are serialized by the lock.
+
+    Args:
+        path:
+            Path to the index file.
+        kept:
+            Number of records (in commit order) which are still valid.
+        records:
+            Binary sha and version of each new commit, in commit order.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _locked(path):
+        with Index(path) as index:
+            if kept == len(index) and not records:
+                return
+            start, run = _merge(index, kept, records)
+            end = index.end
+            size = len(run) * (RECORD.size + POSITION.size)
+            live = (
+                HEADER.size
+                + (1 + sum(r.start < start for r in index.runs)) * RUN.size
+                + (start + len(run)) * (RECORD.size + POSITION.size)
+            )
+            # Bytes after the end (partially written run) are never reused
+            compact = (
+                not end
+                or end != path.stat().st_size
+                or end + RUN.size + size > 2 * live
+            )
+            if compact:
+                start, run = 0, [*index.records(start), *run]
+
+        if not compact:
+            with path.open("ab") as handle:
+                handle.write(_pack(start, run))
+            return
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, delete=False, suffix=".tmp"
+        ) as handle:
+            handle.write(HEADER.pack(MAGIC, FORMAT) + _pack(start, run))
+        pathlib.Path(handle.name).replace(path)
+
+
+@contextlib.contextmanager
+def _locked(path: pathlib.Path) -> Iterator[None]:
+    """Hold the exclusive lock of the index file.
+
+    Note:
+        The lock is taken on a separate file, as the index itself
+        is replaced during compaction. No lock is taken on Windows
+        (only atomic rewrites are relied upon).
+
+    Args:
+        path:
+            Path to the index file.
+
+    Yields:
+        Nothing, the lock is held until the context exits.
+
+    """
+    if sys.platform == "win32":  # pragma: no cover
+        yield
+        return
+    with path.with_suffix(".lock").open("wb") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _merge(
+    index: Index, kept: int, records: Sequence[Record]
+) -> tuple[int, list[Record]]:
+    """Get the run appended after the first `kept` records.
+
+    The run containing the last kept record is replaced (by its kept
+    prefix) and runs at most twice as large as the new one are merged
+    into it, hence there are at most `log2(n)` live runs.
+
+    Args:
+        index:
+            The index the run is appended to.
+        kept:
+            Number of records (in commit order) which are still valid.
+        records:
+            Binary sha and version of each new commit, in commit order.
+
+    Returns:
+        Commit order position of the first record of the run
+        and its records (in commit order).
+
+    """
+    runs = [r for r in index.runs if r.start < kept]
+    start, merged = kept, list(records)
+    while runs and (_end(runs) > start or runs[-1].length <= 2 * len(merged)):
+        run = runs.pop()
+        merged = [
+            *(index.record(p) for p in range(run.start, start)),
+            *merged,
+        ]
+        start = run.start
+    return start, merged
+
+
+def _end(runs: Sequence[Run]) -> int:
+    """Get the commit order position after the last of the runs.
+
+    Args:
+        runs:
+            Contiguous runs (oldest first).
+
+    Returns:
+        Number of records in the runs.
+
+    """
+    return runs[-1].start + runs[-1].length if runs else 0
+
+
+def _pack(start: int, records: Sequence[Record]) -> bytes:
+    """Serialize the run of records.
+
+    Args:
+        start:
+            Commit order position of the first record.
+        records:
+            Binary sha and version of each commit, in commit order.
+
+    Returns:
+        Run header, records sorted by sha and their positions.
+
+    """
+    by_sha = sorted(range(len(records)), key=lambda i: records[i][0])
+    positions = [0] * len(records)
+    for index, position in enumerate(by_sha):
+        positions[position] = index
+    return b"".join(
+        (
+            RUN.pack(start, len(records)),
+            *(RECORD.pack(*records[index]) for index in by_sha),
+            struct.pack(f"<{len(positions)}I", *positions),
+        )
+    )
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Lazily imported modules.
+
+`GitPython` is imported (executed) only when any of its attributes
+is accessed, hence commands not reading the repository
+(e.g. `comver calculate --messages-from`) do not pay for it.
+
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+import typing
+
+if typing.TYPE_CHECKING:
+    import types
+
+
+def module(name: str) -> types.ModuleType:
+    """Import the module lazily.
+
+    Args:
+        name:
+            Name of the module (e.g. `git`).
+
+    Raises:
+        ModuleNotFoundError:
+            If the module is not installed.
+
+    Returns:
+        The module (executed on the first attribute access).
+
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    lazy = importlib.util.module_from_spec(spec)
+    sys.modules[name] = lazy
+    loader.exec_module(lazy)
+    return lazy
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Commit messages read from files (not from the git tree).
+
+Streams of messages (e.g. archived logs of other VCS mirrors)
+are separated either by NUL (as output by `git log -z --format=%B`)
+or by the ASCII record separator (RS). Gzipped streams are
+decompressed transparently.
+
+Single messages (e.g. passed to the `commit-msg` hook) are cleaned up
+the way `git commit` does it (see [`clean`][comver._messages.clean]).
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import pathlib
+import sys
+import typing
+
+if typing.TYPE_CHECKING:
+    import io
+
+    from collections.abc import Iterator
+
+SEPARATORS = {"nul": b"\0", "rs": b"\x1e"}
+"""Separators of messages keyed by their names."""
+
+CHUNK = 1 << 16
+"""Number of bytes read at once."""
+
+GZIP = b"\x1f\x8b"
+"""Magic bytes of gzip files."""
+
+SCISSORS = "# ------------------------ >8 ------------------------"
+"""Line below which `git commit --verbose` message is discarded."""
+
+
+def read(path: str, separator: str = "nul") -> Iterator[str]:
+    """Stream messages from the file.
+
+    Note:
+        Empty messages (e.g. after the trailing separator) are skipped.
+
+    Args:
+        path:
+            Path to the (possibly gzipped) file, `-` for the standard input.
+        separator:
+            Name of the separator (one of
+            [`SEPARATORS`][comver._messages.SEPARATORS]).
+
+    Yields:
+        Consecutive messages.
+
+    """
+    delimiter = SEPARATORS[separator]
+    with (
+        contextlib.nullcontext(sys.stdin.buffer)
+        if path == "-"
+        else pathlib.Path(path).open("rb")
+    ) as raw:
+        handle = typing.cast("io.BufferedReader", raw)
+        stream: typing.BinaryIO = (
+            gzip.GzipFile(fileobj=handle)
+            if handle.peek(len(GZIP)).startswith(GZIP)
+            else handle
+        )
+
+        # Pieces of the message spanning many chunks are joined only
+        # once it is terminated (linear time for huge messages)
+        pieces: list[bytes] = []
+        while chunk := stream.read(CHUNK):
+            if delimiter not in chunk:
+                pieces.append(chunk)
+                continue
+            first, *messages, last = chunk.split(delimiter)
+            for message in (b"".join([*pieces, first]), *messages):
+                if message:
+                    yield message.decode(errors="replace")
+            pieces = [last]
+        if remainder := b"".join(pieces):
+            yield remainder.decode(errors="replace")
+
+
+def clean(message: str) -> str:
+    """Clean the message up the way `git commit` does it.
+
+    Lines starting with `#` (comments) and everything below
+    the [`SCISSORS`][comver._messages.SCISSORS] line are removed,
+    as well as leading and trailing blank lines.
+
+    Args:
+        message:
+            Message as edited by the user (e.g. `.git/COMMIT_EDITMSG`).
+
+    Returns:
+        The message which will be committed.
+
+    """
+    message, _, _ = message.partition(f"{SCISSORS}\n")
+    lines = [
+        line.rstrip()
+        for line in message.splitlines()
+        if not line.startswith("#")
+    ]
+    return "\n".join(lines).strip("\n")
@@ -8,6 +8,8 @@
 from __future__ import annotations
 
 import argparse
+import datetime as dt
+import os
 import textwrap
 
 from comver._version import _version
@@ -42,6 +44,11 @@ def root() -> argparse.ArgumentParser:
     )
     _calculate(subparsers)
     _verify(subparsers)
+    _query(subparsers)
+    _history(subparsers)
+    _check_message(subparsers)
+    _check_range(subparsers)
+    _stamp(subparsers)
 
     return parser
 
@@ -91,6 +98,94 @@ def _calculate(subparsers) -> None:  # noqa: ANN001  # pyright: ignore [reportUn
         help="Return checksum of the configuration (usable for verification)",
     )
 
+    parser.add_argument(
+        "--rev",
+        metavar="REV",
+        help=(
+            "Calculate version of the revision (e.g. sha, branch or tag) "
+            "walking only its ancestors (default: HEAD)"
+        ),
+    )
+
+    group = parser.add_mutually_exclusive_group()
+
+    group.add_argument(
+        "--component",
+        nargs="*",
+        metavar="NAME",
+        help=(
+            "Calculate versions of configured components (all of them "
+            "if no NAME is given) during a single history walk, "
+            "each line prefixed with the component name"
+        ),
+    )
+
+    group.add_argument(
+        "--ref",
+        action="append",
+        metavar="REF",
+        help=(
+            "Calculate version of the ref (e.g. branch, tag or sha), "
+            "can be repeated (shared history is walked once), "
+            "each line prefixed with the ref"
+        ),
+    )
+
+    group.add_argument(
+        "--repos",
+        metavar="PATH",
+        help=(
+            "Calculate versions of many repositories concurrently, paths "
+            "read from the file (one per line, `-` for the standard input), "
+            "each one configured by its own configuration. Results are "
+            "output as JSON lines in completion order"
+        ),
+    )
+
+    group.add_argument(
+        "--messages-from",
+        metavar="PATH",
+        help=(
+            "Calculate version from commit messages (instead of the git "
+            "tree) read from the file (possibly gzipped, `-` for the "
+            "standard input), separated by `--separator`"
+        ),
+    )
+
+    parser.add_argument(
+        "--separator",
+        choices=["nul", "rs"],
+        default="nul",
+        help=(
+            "Separator of messages read by `--messages-from`, either NUL "
+            "(as output by `git log -z --format=%%B`) or ASCII record "
+            "separator (default: nul)"
+        ),
+    )
+
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        required=False,
+        help=(
+            "Output version after every message read by `--messages-from` "
+            "(one per line) instead of the last one"
+        ),
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help=(
+            "Number of repositories processed at once with `--repos`, "
+            "bounding concurrent git subprocesses (default: CPU count)"
+        ),
+    )
+
+    _profile_argument(parser)
+
 
 def _verify(subparsers) -> None:  # noqa: ANN001  # pyright: ignore [reportUnknownParameterType, reportMissingParameterType]
     """Create `verify` subcommand subparser.
@@ -110,23 +205,278 @@ def _verify(subparsers) -> None:  # noqa: ANN001  # pyright: ignore [reportUnkno
             - This command runs on the git-tree found in current
             working directory.
             - You can feed the output of the `calculate` command here
+            - Use `--from-file` to verify many versions at once
         """),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
     parser.add_argument(
         "version",
+        nargs="?",
         help="Version to check (e.g. `1.37.21`).",
     )
 
     parser.add_argument(
         "sha",
+        nargs="?",
         help="Sha of the commit to compare against.",
     )
 
     parser.add_argument(
         "checksum",
+        nargs="?",
         help="Checksum of the configuration to check against.",
     )
 
+    parser.add_argument(
+        "--strategy",
+        choices=["scan", "ancestry"],
+        default="scan",
+        help=(
+            "How commits are located (default: scan, the whole history "
+            "once); ancestry walks only the ancestors of each sha "
+            "(sha has to be reachable from HEAD)"
+        ),
+    )
+
+    parser.add_argument(
+        "--from-file",
+        metavar="PATH",
+        help=(
+            "Verify every `<VERSION> <SHA> <CHECKSUM>` line of the file "
+            "(`-` for stdin) walking history once, outputting JSON per line "
+            "and a JSON summary (exit code 1 if any failed, 2 if malformed)"
+        ),
+    )
+
+    _profile_argument(parser)
+
     return parser
+
+
+def _query(subparsers) -> None:  # noqa: ANN001  # pyright: ignore [reportUnknownParameterType, reportMissingParameterType]
+    """Create `query` subcommand subparser.
+
+    Args:
+        subparsers:
+            Object where this subparser is registered.
+
+    """
+    parser = subparsers.add_parser(
+        "query",
+        description=textwrap.dedent("""\
+        Query versions of commits via the SQLite history store.
+
+        NOTE:
+
+            - This command runs on the git-tree found in current
+            working directory.
+            - The store (inside `.git/comver`) is brought up to date
+            before the query (resuming from cached checkpoints).
+            - Dates are in ISO 8601 format (e.g. `2025-06-01` or
+            `2025-06-01T12:00+02:00`), naive ones are in UTC.
+        """),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["line", "json"],
+        default="line",
+        help="Format of the output (default: line, each output space separated)",
+    )
+
+    parser.add_argument(
+        "--on",
+        type=dt.datetime.fromisoformat,
+        help="Return only the newest commit committed up to this date.",
+    )
+
+    parser.add_argument(
+        "--min-version",
+        help="Minimal version (inclusive) of returned commits.",
+    )
+
+    parser.add_argument(
+        "--max-version",
+        help="Maximal version (inclusive) of returned commits.",
+    )
+
+    parser.add_argument(
+        "--since",
+        type=dt.datetime.fromisoformat,
+        help="Minimal commit date (inclusive) of returned commits.",
+    )
+
+    parser.add_argument(
+        "--until",
+        type=dt.datetime.fromisoformat,
+        help="Maximal commit date (inclusive) of returned commits.",
+    )
+
+
+def _history(subparsers) -> None:  # noqa: ANN001  # pyright: ignore [reportUnknownParameterType, reportMissingParameterType]
+    """Create `history` subcommand subparser.
+
+    Args:
+        subparsers:
+            Object where this subparser is registered.
+
+    """
+    parser = subparsers.add_parser(
+        "history",
+        description=textwrap.dedent("""\
+        Stream version of every commit (oldest first).
+
+        NOTE:
+
+            - This command runs on the git-tree found in current
+            working directory.
+            - Records are written as soon as they are calculated,
+            hence the output can be piped (e.g. to `head`).
+            - Each record contains sha, version and bump kind
+            (`major`, `minor`, `patch` or `none`).
+        """),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["ndjson", "csv", "tsv"],
+        default="ndjson",
+        help="Format of the output (default: ndjson, one JSON object per line)",
+    )
+
+    parser.add_argument(
+        "--author",
+        action="store_true",
+        required=False,
+        help="Output author name and email of each commit as well",
+    )
+
+    parser.add_argument(
+        "--time",
+        action="store_true",
+        required=False,
+        help="Output commit time (ISO 8601) of each commit as well",
+    )
+
+
+def _check_message(subparsers) -> None:  # noqa: ANN001  # pyright: ignore [reportUnknownParameterType, reportMissingParameterType]
+    """Create `check-message` subcommand subparser.
+
+    Args:
+        subparsers:
+            Object where this subparser is registered.
+
+    """
+    parser = subparsers.add_parser(
+        "check-message",
+        description=textwrap.dedent("""\
+        Check the commit message against the configured rules.
+
+        NOTE:
+
+            - Usable as `commit-msg` hook (comments and everything
+            below the scissors line are ignored, as `git commit` does).
+            - The kind of the bump (`major`, `minor`, `patch` or `none`)
+            is output; exit code is 1 if the message is not recognized
+            and `unrecognized_message = "error"` is configured.
+            - `git` is neither run nor imported.
+        """),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    parser.add_argument(
+        "path",
+        help="File with the message (e.g. `.git/COMMIT_EDITMSG`, `-` for stdin)",
+    )
+
+
+def _check_range(subparsers) -> None:  # noqa: ANN001  # pyright: ignore [reportUnknownParameterType, reportMissingParameterType]
+    """Create `check-range` subcommand subparser.
+
+    Args:
+        subparsers:
+            Object where this subparser is registered.
+
+    """
+    parser = subparsers.add_parser(
+        "check-range",
+        description=textwrap.dedent("""\
+        Check commits of the ranges against the configured rules.
+
+        NOTE:
+
+            - Usable as `pre-receive` hook (`<OLD> <NEW> <REF>` lines
+            are read from stdin if no RANGE is given).
+            - Commits are filtered by path and author rules and their
+            messages are classified; rejected commits (unrecognized
+            messages with `unrecognized_message = "error"`) are written
+            to stderr (exit code 1).
+            - Each range is output as `<RANGE> <BUMP> <DELTA>` (delta
+            being the version the range bumps `0.0.0` to).
+        """),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    parser.add_argument(
+        "range",
+        nargs="*",
+        metavar="RANGE",
+        help="Ranges of commits (e.g. `main..feature`, default: read from stdin)",
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        required=False,
+        help="Stop at the first rejected commit",
+    )
+
+
+def _stamp(subparsers) -> None:  # noqa: ANN001  # pyright: ignore [reportUnknownParameterType, reportMissingParameterType]
+    """Create `stamp` subcommand subparser.
+
+    Args:
+        subparsers:
+            Object where this subparser is registered.
+
+    """
+    subparsers.add_parser(
+        "stamp",
+        description=textwrap.dedent("""\
+        Write the version to `comver-stamp.json` for builds without git.
+
+        NOTE:
+
+            - This command runs on the git-tree found in current
+            working directory (the stamp is written there).
+            - The stamp contains version, sha and checksum of the
+            configuration; include it in the source distribution.
+            - Plugins use the stamped version if the checksum matches
+            and the repository (if any) did not move past the sha.
+        """),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+
+def _profile_argument(parser: argparse.ArgumentParser) -> None:
+    """Add `--profile` argument to the parser.
+
+    Args:
+        parser:
+            Parser of the subcommand (e.g. `calculate`).
+
+    """
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        metavar="PATH",
+        help=(
+            "Report time and calls of every phase (e.g. git traversal), "
+            "commits walked and filtered per rule and peak memory; "
+            "written to stderr or as JSON to PATH if provided"
+        ),
+    )
@@ -0,0 +1,310 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Per-phase profiling of the CLI (`--profile`) and statistics hooks.
+
+Phases (e.g. `traversal` or `diff`) are timed and counted only while
+[`profiling`][comver._profile.profiling] is active (or the observed
+iterator runs, see [`comver.stats`][comver.stats]), otherwise
+the hooks are (almost) free.
+
+Example report:
+
+```json
+{
+    "wall": 1.53,
+    "peak_memory": 2407112,
+    "phases": {
+        "config": {"time": 0.004, "calls": 1},
+        "traversal": {"time": 0.71, "calls": 12391},
+        "classification": {"time": 0.42, "calls": 10288}
+    },
+    "counters": {"commits": 12390, "filtered.author_name": 2102}
+}
+```
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import functools
+import json
+import pathlib
+import sys
+import time
+import typing
+
+from comver.stats import Stats
+
+if sys.platform != "win32":
+    import resource
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+T = typing.TypeVar("T")
+P = typing.ParamSpec("P")
+
+_CURRENT: contextvars.ContextVar[Stats | None] = contextvars.ContextVar(
+    "stats", default=None
+)
+"""Statistics being collected (if any)."""
+
+_NULL = contextlib.nullcontext()
+"""Context used when not profiling."""
+
+
+class Profile(Stats):
+    """Statistics of the CLI run with its wall time and peak memory.
+
+    Note:
+        Peak memory is the maximal resident set size of the process
+        (in bytes, `0` on Windows), not only of the profiled code.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty profile."""
+        super().__init__()
+        self.wall: float = 0.0
+        self.peak_memory: int = 0
+
+    def report(self) -> dict[str, typing.Any]:
+        """Get the report.
+
+        Returns:
+            JSON serializable report (phases ordered by their time).
+
+        """
+        return {
+            "wall": self.wall,
+            "peak_memory": self.peak_memory,
+            **super().report(),
+        }
+
+    def format(self) -> str:
+        """Format the report as a human readable table.
+
+        Returns:
+            Table with a row per phase, followed by the counters.
+
+        """
+        report = self.report()
+        lines = [
+            (
+                f"wall: {report['wall']:.4f}s, "
+                f"peak memory: {report['peak_memory'] / 2**20:.2f} MiB"
+            ),
+            f"{'phase':<20}{'time [s]':>12}{'calls':>12}",
+        ]
+        lines.extend(
+            f"{name:<20}{phase['time']:>12.4f}{phase['calls']:>12}"
+            for name, phase in report["phases"].items()
+        )
+        lines.extend(
+            f"{name:<32}{value:>12}"
+            for name, value in report["counters"].items()
+        )
+        return "\n".join(lines)
+
+
+def active() -> bool:
+    """Check whether the statistics are being collected.
+
+    Returns:
+        `True` if profiling (callers may skip counting otherwise).
+
+    """
+    return _CURRENT.get() is not None
+
+
+def phase(name: str) -> contextlib.AbstractContextManager[None]:
+    """Time the phase (if profiling).
+
+    Args:
+        name:
+            Name of the phase (e.g. `diff`).
+
+    Returns:
+        Context timing the phase (no-op if not profiling).
+
+    """
+    stats = _CURRENT.get()
+    return _NULL if stats is None else stats.span(name)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Increase the counter (if profiling).
+
+    Args:
+        name:
+            Name of the counter (e.g. `commits`).
+        value:
+            Value added to the counter.
+
+    """
+    stats = _CURRENT.get()
+    if stats is not None:
+        stats.counters[name] += value
+
+
+def timed(  # noqa: UP047
+    iterable: Iterable[T], name: str
+) -> Iterable[T]:
+    """Time retrieval of consecutive items (if profiling).
+
+    Args:
+        iterable:
+            Iterable (e.g. commits read by the backend).
+        name:
+            Name of the phase.
+
+    Returns:
+        The iterable itself (if not profiling) or an iterator
+        timing every item.
+
+    """
+    stats = _CURRENT.get()
+    if stats is None:
+        return iterable
+    return _timed(iter(iterable), stats, name)
+
+
+def _timed(  # noqa: UP047
+    iterator: Iterator[T], stats: Stats, name: str
+) -> Iterator[T]:
+    """Time retrieval of consecutive items.
+
+    Args:
+        iterator:
+            Iterator of the items.
+        stats:
+            Statistics the timings are recorded in.
+        name:
+            Name of the phase.
+
+    Yields:
+        Consecutive items.
+
+    """
+    while True:
+        with stats.span(name):
+            item = next(iterator, _NULL)
+        if item is _NULL:
+            return
+        yield typing.cast("T", item)
+
+
+def observable(  # noqa: UP047
+    function: Callable[P, Iterator[T]],
+) -> Callable[P, Iterator[T]]:
+    """Collect statistics of the iterator into its `stats` keyword argument.
+
+    Note:
+        The function declares the keyword-only `stats` argument
+        (so it is a part of its signature), the wrapper only reads it.
+
+    Args:
+        function:
+            Function returning the iterator (e.g.
+            [`from_git`][comver._version.Version.from_git]).
+
+    Returns:
+        Function observed by the `stats` (if provided).
+
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Iterator[T]:
+        stats = typing.cast("Stats | None", kwargs.get("stats"))
+        iterator = function(*args, **kwargs)
+        return iterator if stats is None else _observed(iterator, stats)
+
+    return wrapper
+
+
+def _observed(iterator: Iterator[T], stats: Stats) -> Iterator[T]:  # noqa: UP047
+    """Collect statistics while the consecutive items are computed.
+
+    Note:
+        Statistics are attached only while the iterator runs, not
+        while the caller processes the items.
+
+    Args:
+        iterator:
+            Observed iterator.
+        stats:
+            Statistics to collect.
+
+    Yields:
+        Consecutive items.
+
+    """
+    while True:
+        token = _CURRENT.set(stats)
+        try:
+            item = next(iterator, _NULL)
+        finally:
+            _CURRENT.reset(token)
+        if item is _NULL:
+            return
+        yield typing.cast("T", item)
+
+
+def _peak_memory() -> int:
+    """Get the peak resident set size of the process.
+
+    Note:
+        Unlike `tracemalloc` nothing is traced during the run, hence
+        profiling does not slow down allocations.
+
+    Returns:
+        Peak memory in bytes (`0` on Windows).
+
+    """
+    if sys.platform == "win32":  # pragma: no cover
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@contextlib.contextmanager
+def profiling(destination: str | None) -> Iterator[Profile | None]:
+    """Profile the enclosed code and write the report.
+
+    Note:
+        The report is written even if the code exits
+        (e.g. via `sys.exit`) or fails.
+
+    Args:
+        destination:
+            Path to the JSON report, `-` for the human readable
+            report written to the standard error.
+            Default: Nothing is profiled.
+
+    Yields:
+        The profile being collected (if any).
+
+    """
+    if destination is None:
+        yield None
+        return
+
+    profile = Profile()
+    token = _CURRENT.set(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.wall = time.perf_counter() - start
+        profile.peak_memory = _peak_memory()
+        _CURRENT.reset(token)
+        if destination == "-":
+            print(profile.format(), file=sys.stderr)  # noqa: T201
+        else:
+            pathlib.Path(destination).write_text(
+                json.dumps(profile.report(), indent=4)
+            )
@@ -7,11 +7,14 @@
 
 from __future__ import annotations
 
-from comver._regex import match, semantic
-from comver._regex._process import process
+from comver._regex import match, safety, scope, semantic
+from comver._regex._process import engine, process
 
 __all__ = [
+    "engine",
     "match",
     "process",
+    "safety",
+    "scope",
     "semantic",
 ]
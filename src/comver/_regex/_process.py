@@ -7,12 +7,21 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
+import os
 import re
 import typing
+import warnings
+
+from comver import error
 
 if typing.TYPE_CHECKING:
     from comver.type_definitions import OptionalStringsOrPatterns
 
+ENGINES = ("re", "re2")
+"""Available regex engines (`re2` requires `google-re2`)."""
+
 
 def process(
     regexes: OptionalStringsOrPatterns, default: str | None = None
@@ -27,6 +36,10 @@ def process(
     and is avoided whenever possible throughout
     the whole `comver`.
 
+    Tip:
+        Set `COMVER_REGEX_ENGINE=re2` to match in linear time
+        (see [`compiled`][comver._regex._process.compiled]).
+
     Arguments:
         regexes:
             Regexes which should be compiled together
@@ -37,5 +50,61 @@ def process(
     if not regexes:
         if default is None:
             return None
-        return re.compile(default)
-    return re.compile(r"(" + r"|".join(rf"({r})" for r in regexes) + r")")
+        return compiled(default, engine())
+    return compiled(
+        r"(" + r"|".join(rf"({r})" for r in regexes) + r")", engine()
+    )
+
+
+def engine() -> str:
+    """Get the regex engine.
+
+    Returns:
+        Engine chosen by `COMVER_REGEX_ENGINE` environment variable
+        OR `"re"`.
+
+    """
+    return os.environ.get("COMVER_REGEX_ENGINE") or "re"
+
+
+@functools.cache
+def compiled(pattern: str, engine: str = "re") -> re.Pattern[str]:
+    """Compile the pattern with the engine (cached).
+
+    `re2` engine guarantees linear matching time, patterns it does not
+    support (e.g. backreferences or lookarounds) are compiled by `re`
+    instead (with a warning).
+
+    Args:
+        pattern:
+            Regex to compile.
+        engine:
+            Name of the engine (one of
+            [`ENGINES`][comver._regex._process.ENGINES]).
+
+    Raises:
+        RegexEngineUnavailableError:
+            If the engine is unknown or not installed.
+
+    Returns:
+        Compiled pattern (`re2` patterns provide the same
+        `search` and `match` methods).
+
+    """
+    if engine == "re":
+        return re.compile(pattern)
+    if engine not in ENGINES:
+        raise error.RegexEngineUnavailableError(engine)
+    try:
+        re2 = importlib.import_module("re2")
+    except ImportError as e:
+        raise error.RegexEngineUnavailableError(engine) from e
+    try:
+        return re2.compile(pattern)
+    except re2.error:
+        warnings.warn(
+            f"Regex '{pattern}' is not supported by 're2', using 're'.",
+            error.ComverWarning,
+            stacklevel=2,
+        )
+        return re.compile(pattern)
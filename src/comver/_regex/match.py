@@ -10,9 +10,13 @@ from __future__ import annotations
 
 import typing
 
+from comver import _profile
+
 if typing.TYPE_CHECKING:
     import re
 
+    from collections.abc import Sequence
+
     import git
 
 
@@ -51,6 +55,7 @@ def path(
     commit: git.Commit,
     include: re.Pattern[str] | None,
     exclude: re.Pattern[str] | None,
+    paths: Sequence[str | None] | None = None,
 ) -> bool:
     """Check if the commit touched the file based regexes.
 
@@ -70,6 +75,10 @@ def path(
             The regex to include the file.
         exclude:
             The regex to exclude the file.
+        paths:
+            Paths changed by the commit (see
+            [`changed`][comver._regex.match.changed]), if already
+            computed. Default: Computed from the commit.
 
     Returns:
         True if the commit touched the file, False otherwise.
@@ -77,7 +86,29 @@ def path(
     if include is None and exclude is None:
         return True
 
-    return not commit.diff() or any(
-        item(diff.a_path, include, exclude) if diff.a_path else True
-        for diff in commit.diff()
+    _profile.count("regex.path")
+    if paths is None:
+        paths = changed(commit)
+
+    return not paths or any(
+        item(file, include, exclude) if file else True for file in paths
     )
+
+
+def changed(commit: git.Commit) -> list[str | None]:
+    """Get paths changed by the commit.
+
+    Tip:
+        Computing the paths once and matching them against
+        many rules (e.g. components) avoids repeated diffs.
+
+    Args:
+        commit:
+            The commit to check.
+
+    Returns:
+        Changed paths (`None` for paths which do not exist
+        on one side of the diff).
+
+    """
+    return [diff.a_path for diff in commit.diff()]
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Static detection of regexes prone to catastrophic backtracking.
+
+Two (most common) sources of exponential backtracking are detected:
+
+- nested unbounded quantifiers, e.g. `(a+)+$` or `(a*b?)*`
+- repeated alternation of overlapping branches, e.g. `(a|a)*`
+    or `(.|x)*`
+
+Warning:
+    The check is a heuristic, it may flag harmless patterns
+    and does not detect polynomial (e.g. `.*a.*a.*`) backtracking.
+    Atomic groups and possessive quantifiers are considered safe.
+
+"""
+
+from __future__ import annotations
+
+import re
+import typing
+
+from re import _constants, _parser  # pyright: ignore [reportAttributeAccessIssue]
+
+REPEATS = (_constants.MAX_REPEAT, _constants.MIN_REPEAT)
+"""Backtracking (greedy and lazy) quantifiers."""
+
+CONTAINERS = (_constants.SUBPATTERN, _constants.ASSERT, _constants.ASSERT_NOT)
+"""Items containing subpattern (as the last element of their argument)."""
+
+
+def reason(pattern: str) -> str | None:
+    """Check whether the pattern may take super-linear time to match.
+
+    Args:
+        pattern:
+            The regex.
+
+    Returns:
+        Why the pattern is unsafe or `None` if it is considered safe
+        (or it is not a valid `re` pattern).
+
+    """
+    try:
+        parsed = _parser.parse(pattern)
+    except re.error:
+        return None
+    return _walk(parsed, repeated=False)
+
+
+def _walk(items: typing.Iterable[typing.Any], *, repeated: bool) -> str | None:
+    """Find the unsafe construct in the parsed subpattern.
+
+    Args:
+        items:
+            Parsed `(opcode, argument)` items of the subpattern.
+        repeated:
+            Whether the subpattern is repeated by an unbounded quantifier.
+
+    Returns:
+        Why the subpattern is unsafe (if it is).
+
+    """
+    for opcode, argument in items:
+        if (found := _item(opcode, argument, repeated=repeated)) is not None:
+            return found
+    return None
+
+
+def _item(
+    opcode: typing.Any, argument: typing.Any, *, repeated: bool
+) -> str | None:
+    """Find the unsafe construct in the parsed item.
+
+    Args:
+        opcode:
+            Kind of the item (e.g. `MAX_REPEAT`).
+        argument:
+            Argument of the item (e.g. the quantified subpattern).
+        repeated:
+            Whether the item is repeated by an unbounded quantifier.
+
+    Returns:
+        Why the item is unsafe (if it is).
+
+    """
+    if opcode in REPEATS:
+        return _repeat(argument, repeated=repeated)
+    if opcode in CONTAINERS:
+        return _walk(argument[-1], repeated=repeated)
+    if opcode is not _constants.BRANCH:
+        return None
+    if repeated and _overlapping(argument):
+        return "repeated overlapping alternation"
+    return next(
+        filter(None, (_walk(b, repeated=repeated) for b in argument[1])),
+        None,
+    )
+
+
+def _repeat(argument: typing.Any, *, repeated: bool) -> str | None:
+    """Check the quantified subpattern.
+
+    Args:
+        argument:
+            Minimum, maximum and the quantified subpattern.
+        repeated:
+            Whether the quantifier is itself repeated.
+
+    Returns:
+        Why the quantifier is unsafe (if it is).
+
+    """
+    _, maximum, subpattern = argument
+    if maximum != _constants.MAXREPEAT:
+        return _walk(subpattern, repeated=repeated)
+    if repeated:
+        return "nested quantifiers"
+    return _walk(subpattern, repeated=True)
+
+
+def _overlapping(argument: typing.Any) -> bool:
+    """Check whether alternated branches may start with the same character.
+
+    Args:
+        argument:
+            Parsed alternation (its second element are the branches).
+
+    Returns:
+        `True` if any two branches start the same (or with any character).
+
+    """
+    starts = [tuple(branch)[:1] for branch in argument[1]]
+    if any(start and start[0][0] is _constants.ANY for start in starts):
+        return True
+    return len(set(map(repr, starts))) < len(starts)
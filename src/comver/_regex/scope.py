@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Sections of commit messages scanned by the message rules.
+
+Example message and its sections:
+
+```text
+feat(core): add the feature          <- header
+
+Long description, possibly a         <- body
+generated changelog.
+
+Refs: #123                           <- trailers
+BREAKING CHANGE: removed the API
+```
+
+Tip:
+    Sections are computed lazily (and at most once), the header
+    is found in `O(header)` and trailers in `O(trailers)` time,
+    no matter how large the body is.
+
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+import typing
+
+from comver import error
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+SCOPES = ("header", "body", "trailers", "full")
+"""Available scopes of the message rules."""
+
+RULES = (
+    "message_includes",
+    "message_excludes",
+    "major_regexes",
+    "minor_regexes",
+    "patch_regexes",
+)
+"""Message rules which can be scoped."""
+
+TRAILER = re.compile(r"(?:BREAKING[ -]CHANGE|[\w-]+)(?::[ \t]| #)|[ \t]")
+"""Line of the trailers (`token: value`, `token #value` or continuation)."""
+
+
+def check(scopes: Mapping[str, str] | None) -> None:
+    """Check the scopes of the message rules.
+
+    Args:
+        scopes:
+            Mapping of the message rules to their scopes.
+
+    Raises:
+        ScopeUnknownError:
+            If the rule is not one of the [`RULES`][comver._regex.scope.RULES]
+            or the scope is not one of the
+            [`SCOPES`][comver._regex.scope.SCOPES].
+
+    """
+    for rule, scope in (scopes or {}).items():
+        if rule not in RULES or scope not in SCOPES:
+            raise error.ScopeUnknownError(rule, scope)
+
+
+class Sections:
+    """Message split into sections.
+
+    Attributes:
+        full:
+            The whole message.
+
+    """
+
+    def __init__(self, full: str) -> None:
+        """Initialize the sections.
+
+        Args:
+            full:
+                The whole message.
+
+        """
+        self.full: str = full
+
+    def __getitem__(self, scope: str | None) -> str:
+        """Get the section of the message.
+
+        Args:
+            scope:
+                One of the [`SCOPES`][comver._regex.scope.SCOPES]
+                (see [`check`][comver._regex.scope.check]),
+                `None` is equivalent to `full`.
+
+        Returns:
+            The section (empty string if the message does not have it).
+
+        """
+        if scope is None or scope == "full":
+            return self.full
+        return getattr(self, scope)
+
+    @functools.cached_property
+    def header(self) -> str:
+        """First line of the message."""
+        return self.full[: self._bounds[0]]
+
+    @functools.cached_property
+    def body(self) -> str:
+        """Paragraphs between the header and the trailers."""
+        header, trailers = self._bounds
+        return self.full[header:trailers].strip("\n")
+
+    @functools.cached_property
+    def trailers(self) -> str:
+        """Last paragraph if it consists of trailers only."""
+        return self.full[self._bounds[1] :].strip("\n")
+
+    @functools.cached_property
+    def _bounds(self) -> tuple[int, int]:
+        """End of the header and start of the trailers."""
+        full = self.full
+        header = full.find("\n")
+        if header == -1:
+            return len(full), len(full)
+
+        # Avoid copying (possibly large) message by `rstrip`
+        end = len(full)
+        while end > header and full[end - 1] == "\n":
+            end -= 1
+        paragraph = full.rfind("\n\n", header, end)
+        if paragraph != -1 and _trailers(full[paragraph + 2 : end]):
+            return header, paragraph
+        return header, len(full)
+
+
+def _trailers(paragraph: str) -> bool:
+    """Check whether the paragraph consists of trailers only.
+
+    Args:
+        paragraph:
+            Last paragraph of the message.
+
+    Returns:
+        `True` if every line is a trailer (or its continuation).
+
+    """
+    first, *rest = paragraph.split("\n")
+    if first[:1].isspace() or TRAILER.match(first) is None:
+        return False
+    return all(TRAILER.match(line) for line in rest)
@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Precomputed versions for builds without the git history.
+
+`comver stamp` writes the version (with the sha of its commit, the sha
+of `HEAD` and the checksum of the configuration) to the
+[`FILE`][comver._stamp.FILE], which should be included in the source
+distribution:
+
+```json
+{
+    "version": "1.2.0",
+    "sha": "d1e714b...",
+    "head": "5f3a9c0...",
+    "checksum": "9f86d08..."
+}
+```
+
+Plugins use the stamped version (instead of walking the history)
+if the checksum matches the configuration and the stamp is not stale,
+i.e. there is no repository (e.g. a wheel built from the sdist)
+or its `HEAD` is the stamped one. `HEAD` is stamped separately,
+as the last commits might not be included (e.g. excluded by paths),
+hence the commit of the version is not `HEAD`.
+
+Note:
+    Staleness is checked by the `git` executable (if installed),
+    `GitPython` is never imported.
+
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import pathlib
+import subprocess
+
+FILE = "comver-stamp.json"
+"""Name of the stamp (placed in the root of the project)."""
+
+
+@dataclasses.dataclass(frozen=True)
+class Stamp:
+    """Version precomputed by `comver stamp`.
+
+    Attributes:
+        version:
+            The version (e.g. `1.2.0`).
+        sha:
+            Sha of the commit related to the version
+            (`None` if no commit bumped the version).
+        head:
+            Sha of the repository `HEAD` when stamped
+            (`None` if unknown, e.g. stamped by older `comver`).
+        checksum:
+            Checksum of the configuration the version was calculated with.
+
+    """
+
+    version: str
+    sha: str | None
+    head: str | None
+    checksum: str
+
+    def write(self, directory: str | pathlib.Path = ".") -> pathlib.Path:
+        """Write the stamp.
+
+        Args:
+            directory:
+                Root of the project.
+                Default: Current working directory.
+
+        Returns:
+            Path to the written stamp.
+
+        """
+        path = pathlib.Path(directory) / FILE
+        _ = path.write_text(json.dumps(dataclasses.asdict(self)) + "\n")
+        return path
+
+    @classmethod
+    def read(cls, directory: str | pathlib.Path = ".") -> Stamp | None:
+        """Read the stamp.
+
+        Args:
+            directory:
+                Root of the project.
+                Default: Current working directory.
+
+        Returns:
+            The stamp or `None` if it does not exist (or is malformed).
+
+        """
+        try:
+            data = json.loads((pathlib.Path(directory) / FILE).read_text())
+            return cls(
+                data["version"],
+                data["sha"],
+                data.get("head"),
+                data["checksum"],
+            )
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+
+def version(directory: str | pathlib.Path, checksum: str) -> str | None:
+    """Get the stamped version if it is usable.
+
+    Args:
+        directory:
+            Root of the project.
+        checksum:
+            Checksum of the configuration used by the build.
+
+    Returns:
+        The stamped version or `None` if it is missing, was calculated
+        with other configuration or is stale.
+
+    """
+    stamp = Stamp.read(directory)
+    if stamp is None or stamp.checksum != checksum:
+        return None
+    if _stale(directory, stamp.head):
+        return None
+    return stamp.version
+
+
+def _stale(directory: str | pathlib.Path, head: str | None) -> bool:
+    """Check whether the repository (if any) moved past the stamped `HEAD`.
+
+    Note:
+        Stamped `HEAD` unknown to the repository (e.g. a shallow clone
+        or an unrelated repository) is stale, as it cannot be verified.
+
+    Args:
+        directory:
+            Root of the project.
+        head:
+            Sha of the stamped `HEAD`.
+
+    Returns:
+        `True` if there is a repository and its `HEAD` is not
+        the stamped one.
+
+    """
+    current = head_sha(directory)
+    return current is not None and current != head
+
+
+def head_sha(directory: str | pathlib.Path) -> str | None:
+    """Get sha of the repository `HEAD` (read by the `git` executable).
+
+    Args:
+        directory:
+            Directory of (or within) the repository.
+
+    Returns:
+        Full sha or `None` if there is no repository (or no commits).
+
+    """
+    return _git(directory, "rev-parse", "--verify", "--quiet", "HEAD")
+
+
+def _git(directory: str | pathlib.Path, *args: str) -> str | None:
+    """Run `git` command.
+
+    Args:
+        directory:
+            Directory the command is run in.
+        *args:
+            Arguments of `git`.
+
+    Returns:
+        Stripped standard output or `None` if the command failed
+        (e.g. not a repository or `git` not installed).
+
+    """
+    try:
+        result = subprocess.run(  # noqa: S603
+            ["git", *args],  # noqa: S607
+            cwd=directory,
+            capture_output=True,
+            check=False,
+            text=True,
+        )
+    except OSError:
+        return None
+    return None if result.returncode else result.stdout.strip()
@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""SQLite history store of versions of commits.
+
+Unlike [history index][comver._index] this store keeps commit times
+as well, and is indexed by sha, commit time and version, allowing
+range queries (e.g. all commits between two versions or the version
+at a given date) over multi-million rows histories.
+
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import typing
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+    from collections.abc import Iterable, Iterator
+    from types import TracebackType
+
+Row = tuple[int, str, int, int, int, int]
+"""Position, sha, commit time (epoch seconds), `major`, `minor`, `patch`."""
+
+Version = tuple[int, int, int]
+"""`major`, `minor` and `patch` of the version."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    position INTEGER PRIMARY KEY,
+    sha TEXT NOT NULL,
+    time INTEGER NOT NULL,
+    major INTEGER NOT NULL,
+    minor INTEGER NOT NULL,
+    patch INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_sha ON history (sha);
+CREATE INDEX IF NOT EXISTS history_time ON history (time);
+CREATE INDEX IF NOT EXISTS history_version ON history (major, minor, patch);
+"""
+"""Schema of the store (rows are yielded commits, in commit order)."""
+
+
+class Store:
+    """Connection to the SQLite history store."""
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """Open (and create if needed) the store.
+
+        Args:
+            path:
+                Path to the SQLite database.
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection: sqlite3.Connection = sqlite3.connect(path)
+        _ = self.connection.executescript(SCHEMA)
+
+    def __len__(self) -> int:
+        """Number of commits in the store.
+
+        Returns:
+            Number of stored commits.
+
+        """
+        (position,) = self.connection.execute(
+            "SELECT MAX(position) FROM history"
+        ).fetchone()
+        return 0 if position is None else 1 + position
+
+    def __enter__(self) -> typing.Self:
+        """Use store as a context manager (closing it afterwards).
+
+        Returns:
+            The store itself.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the connection.
+
+        Args:
+            exc_type:
+                Type of the exception (if any).
+            exc_value:
+                The exception (if any).
+            traceback:
+                Traceback of the exception (if any).
+
+        """
+        self.connection.close()
+
+    def sha(self, position: int) -> str | None:
+        """Get the sha of the commit at a given position.
+
+        Args:
+            position:
+                Position of the commit (`0` is the oldest one).
+
+        Returns:
+            Sha of the commit (if stored).
+
+        """
+        row = self.connection.execute(
+            "SELECT sha FROM history WHERE position = ?", (position,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def replace(self, kept: int, rows: Iterable[Row]) -> None:
+        """Keep first `kept` commits and append new `rows` after them.
+
+        Args:
+            kept:
+                Number of (oldest) commits which are still valid.
+            rows:
+                Rows of commits walked after the `kept` ones.
+
+        """
+        with self.connection:
+            _ = self.connection.execute(
+                "DELETE FROM history WHERE position >= ?", (kept,)
+            )
+            _ = self.connection.executemany(
+                "INSERT INTO history VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def on(self, time: float) -> Row | None:
+        """Get the newest commit committed at or before `time`.
+
+        Args:
+            time:
+                Seconds since epoch.
+
+        Returns:
+            Row of the commit (if any).
+
+        """
+        return self.connection.execute(
+            "SELECT * FROM history WHERE time <= ? "
+            "ORDER BY time DESC, position DESC LIMIT 1",
+            (time,),
+        ).fetchone()
+
+    def query(
+        self,
+        lower: Version | None = None,
+        upper: Version | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> Iterator[Row]:
+        """Get commits (in commit order) matching all of the constraints.
+
+        Args:
+            lower:
+                Minimal version (inclusive).
+            upper:
+                Maximal version (inclusive).
+            since:
+                Minimal commit time (inclusive, seconds since epoch).
+            until:
+                Maximal commit time (inclusive, seconds since epoch).
+
+        Yields:
+            Rows of the matching commits.
+
+        """
+        conditions, parameters = ["1"], []
+        if lower is not None:
+            conditions.append("(major, minor, patch) >= (?, ?, ?)")
+            parameters.extend(lower)
+        if upper is not None:
+            conditions.append("(major, minor, patch) <= (?, ?, ?)")
+            parameters.extend(upper)
+        if since is not None:
+            conditions.append("time >= ?")
+            parameters.append(since)
+        if until is not None:
+            conditions.append("time <= ?")
+            parameters.append(until)
+
+        yield from self.connection.execute(
+            f"SELECT * FROM history WHERE {' AND '.join(conditions)} "  # noqa: S608
+            "ORDER BY position",
+            parameters,
+        )
@@ -8,18 +8,54 @@
 from __future__ import annotations
 
 import collections
-import hashlib
+import concurrent.futures
+import contextlib
+import contextvars
+import csv
 import json
+import os
+import pathlib
 import sys
 import typing
 
-import loadfig
-
-from comver._version import Version, VersionCommit
+from comver import (
+    _backend,
+    _config,
+    _horizon,
+    _index,
+    _lazy,
+    _messages,
+    _profile,
+    _stamp,
+    error,
+)
+from comver._version import (
+    Version,
+    VersionCommit,
+    _changed,
+    _flags,
+    _history_index,
+    _include_commit,
+    _repository,
+)
 
 if typing.TYPE_CHECKING:
     import argparse
 
+    from collections.abc import Iterable, Iterator, Mapping
+
+    import git
+
+    from comver._version import VersionRecord
+else:
+    git = _lazy.module("git")
+
+Pair = tuple[str, str, str]
+"""Version, sha and checksum to verify."""
+
+Rejection = tuple[str, str]
+"""Sha of the rejected commit and the (single line) reason."""
+
 
 def calculate(args: argparse.Namespace) -> typing.NoReturn:
     """Calculate semantic versioning based on commit messages.
@@ -27,6 +63,9 @@ def calculate(args: argparse.Namespace) -> typing.NoReturn:
     Outputs version and (optionally) sha of a commit
     related to this version (the last one in commit chain).
 
+    With `--repos` many repositories are calculated concurrently
+    (exiting with `1` if any of them failed).
+
     This output allows to later compare git trees and inferred
     versions if necessary.
 
@@ -35,8 +74,23 @@ def calculate(args: argparse.Namespace) -> typing.NoReturn:
             Arguments from the CLI.
 
     """
-    print(_calculate(args))  # noqa: T201
-    sys.exit(0)
+    if args.rev is not None and (
+        args.ref is not None or args.messages_from is not None
+    ):
+        print(  # noqa: T201
+            "`--rev` cannot be used together with `--ref` "
+            "or `--messages-from`.",
+            file=sys.stderr,
+        )
+        sys.exit(2)
+    with _profile.profiling(args.profile):
+        if args.repos is not None:
+            sys.exit(_calculate_repos(args))
+        if args.messages_from is not None:
+            _calculate_messages(args)
+            sys.exit(0)
+        print(_calculate(args))  # noqa: T201
+        sys.exit(0)
 
 
 def verify(args: argparse.Namespace) -> typing.NoReturn:
@@ -46,15 +100,272 @@ def verify(args: argparse.Namespace) -> typing.NoReturn:
     commit sha verify whether this version was created
     from this commit chain.
 
+    With `--from-file` many triples are verified at once
+    (walking the history at most once).
+
     Args:
         args:
             Arguments from the CLI.
 
     """
-    sys.exit(_verify(args))
+    if args.from_file is None and None in (
+        args.version,
+        args.sha,
+        args.checksum,
+    ):
+        print(  # noqa: T201
+            "Either `version`, `sha` and `checksum` or `--from-file` "
+            "has to be provided.",
+            file=sys.stderr,
+        )
+        sys.exit(2)
+    with _profile.profiling(args.profile):
+        if args.from_file is not None:
+            sys.exit(_verify_many(args.from_file, args.strategy))
+        sys.exit(_verify(args))
+
+
+def query(args: argparse.Namespace) -> typing.NoReturn:
+    """Query versions of commits within version and date ranges.
+
+    Each matching commit is output as "version sha time"
+    (or a JSON object), in commit order.
+
+    Args:
+        args:
+            Arguments from the CLI.
+
+    """
+    for record in _query(args):
+        print(_record(record, args.format))  # noqa: T201
+    sys.exit(0)
+
+
+def history(args: argparse.Namespace) -> typing.NoReturn:
+    """Stream version of every commit.
+
+    Records are written as soon as they are calculated (memory usage
+    does not depend on the length of the history).
+
+    Note:
+        Closing the output early (e.g. `comver history | head`)
+        is not an error, the command exits with `141`
+        (as processes terminated by `SIGPIPE` do).
+
+    Args:
+        args:
+            Arguments from the CLI.
+
+    """
+    try:
+        _history(args, sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Python flushes stdout at exit, which would fail again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(141)
+    sys.exit(0)
+
+
+def stamp(_: argparse.Namespace) -> typing.NoReturn:
+    """Write the version (with its sha, `HEAD` and checksum) to the stamp.
+
+    The stamp (see [`comver._stamp`][comver._stamp]) is used by the plugins
+    instead of walking the history, e.g. when the wheel is built from
+    the source distribution (without `.git`).
+
+    Args:
+        _:
+            Arguments from the CLI (unused).
+
+    """
+    version = VersionCommit()
+    for version in Version.from_git_configured(resume=True):  # noqa: B007
+        pass
+    path = _stamp.Stamp(
+        str(version.version),
+        None if version.commit is None else version.commit.hexsha,
+        _stamp.head_sha("."),
+        _checksum_config(),
+    ).write()
+    print(path)  # noqa: T201
+    sys.exit(0)
+
+
+def check_message(args: argparse.Namespace) -> typing.NoReturn:
+    """Check the commit message against the configured rules.
+
+    Outputs the kind of the bump the message results in, exits with `1`
+    if the message is not recognized (and such messages are configured
+    to be an error), hence it can be used as `commit-msg` hook.
+
+    Note:
+        Neither `git` nor `GitPython` is used, only the message
+        is read and classified.
+
+    Args:
+        args:
+            Arguments from the CLI.
+
+    """
+    config = collections.defaultdict(lambda: None, _config.load())
+    message = _messages.clean(
+        sys.stdin.read()
+        if args.path == "-"
+        else pathlib.Path(args.path).read_text(encoding="utf-8")
+    )
+    try:
+        version = Version.from_message(
+            message,
+            config["message_includes"],
+            config["message_excludes"],
+            config["major_regexes"],
+            config["minor_regexes"],
+            config["patch_regexes"],
+            config["unrecognized_message"],
+            max_message_size=config["max_message_size"],
+            scopes=config["scopes"],
+        )
+    except error.MessageUnrecognizedError as e:
+        print(e, file=sys.stderr)  # noqa: T201
+        sys.exit(1)
+    print(_bump(Version(), version))  # noqa: T201
+    sys.exit(0)
+
+
+def check_range(args: argparse.Namespace) -> typing.NoReturn:
+    """Check commits of the pushed ranges against the configured rules.
+
+    Commits of every range are streamed (by a single `git rev-list`), filtered
+    by the configured path and author rules and classified. Rejected
+    commits (unrecognized messages with `unrecognized_message = "error"`)
+    are written to stderr, the bump of every range to stdout.
+    Exits with `1` if any commit was rejected, hence it can be used as
+    `pre-receive` hook.
+
+    Args:
+        args:
+            Arguments from the CLI.
+
+    """
+    repository = _repository(None)
+    config = collections.defaultdict(
+        lambda: None, _config.load(repository.working_dir)
+    )
+    reader = _backend.Subprocess(repository)
+    rejected = False
+    for name, revisions in _ranges(args.range):
+        delta, rejections = _check_range(
+            repository, reader, revisions, config, fail_fast=args.fail_fast
+        )
+        for sha, reason in rejections:
+            print(f"{sha} {reason}", file=sys.stderr)  # noqa: T201
+        print(f"{name} {_bump(Version(), delta)} {delta}")  # noqa: T201
+        rejected = rejected or bool(rejections)
+        if rejected and args.fail_fast:
+            break
+    sys.exit(int(rejected))
+
+
+def _ranges(ranges: list[str] | None) -> Iterator[tuple[str, list[str]]]:
+    """Get revisions of the checked ranges.
+
+    Note:
+        Ranges read from stdin are `<OLD> <NEW> <REF>` lines (as passed
+        to the `pre-receive` hook). Deleted refs are skipped, commits
+        of created refs are the ones not reachable from any existing ref.
+
+    Args:
+        ranges:
+            Ranges (e.g. `main..feature`) provided explicitly.
+            Default: Read from stdin.
+
+    Yields:
+        Name of the range and its `git rev-list` revisions.
+
+    """
+    if ranges:
+        yield from ((name, [name]) for name in ranges)
+        return
+    for line in sys.stdin:
+        old, new, ref = line.split()
+        if set(new) == {"0"}:
+            continue
+        yield (
+            ref,
+            [new, "--not", "--all"] if set(old) == {"0"} else [f"{old}..{new}"],
+        )
+
+
+def _check_range(
+    repository: git.Repo,
+    reader: _backend.Subprocess,
+    revisions: list[str],
+    config: Mapping[str, typing.Any],
+    *,
+    fail_fast: bool,
+) -> tuple[Version, list[Rejection]]:
+    """Check commits of the range.
+
+    Args:
+        repository:
+            The `git` repository.
+        reader:
+            Backend streaming the commits.
+        revisions:
+            Revisions of the range (see
+            [`_ranges`][comver._subcommand._ranges]).
+        config:
+            The `comver` configuration.
+        fail_fast:
+            Whether to stop at the first rejected commit.
+
+    Returns:
+        Version the range bumps `0.0.0` to and the rejected commits.
+
+    """
+    version = Version()
+    rejections: list[Rejection] = []
+    for record in reader.log(_flags(config["traversal"]), *revisions):
+        if not _include_commit(
+            record.commit(repository),
+            config["path_includes"],
+            config["path_excludes"],
+            config["author_name_includes"],
+            config["author_name_excludes"],
+            config["author_email_includes"],
+            config["author_email_excludes"],
+            paths=_changed(
+                reader,
+                record.sha,
+                config["path_includes"],
+                config["path_excludes"],
+            ),
+        ):
+            continue
+        try:
+            version = Version.from_message(
+                record.message,
+                config["message_includes"],
+                config["message_excludes"],
+                config["major_regexes"],
+                config["minor_regexes"],
+                config["patch_regexes"],
+                config["unrecognized_message"],
+                version=version,
+                max_message_size=config["max_message_size"],
+                scopes=config["scopes"],
+            )
+        except error.MessageUnrecognizedError as e:
+            header, _, _ = e.message.partition("\n")
+            rejections.append((record.sha, f"unrecognized message: {header}"))
+            if fail_fast:
+                break
+    return version, rejections
 
 
-def _calculate(args: argparse.Namespace) -> str:  # noqa: C901
+def _calculate(args: argparse.Namespace) -> str:
     """Implementation of calculate cli command.
 
     Args:
@@ -67,29 +378,293 @@ def _calculate(args: argparse.Namespace) -> str:  # noqa: C901
         is optional based on `args.sha` flag.
 
     """
+    if args.component is not None:
+        return _calculate_components(args)
+    if args.ref is not None:
+        return _calculate_refs(args)
+
     version = VersionCommit()
-    for version in Version.from_git_configured():  # noqa: B007
+    for version in Version.from_git_configured(  # noqa: B007
+        rev=args.rev, resume=True
+    ):
         pass
 
-    sha = version.commit.hexsha if version.commit is not None else None
+    output = _output(version, _checksum_config(), args)
+
+    if args.format == "line":
+        return " ".join(map(str, output.values()))
+
+    return json.dumps(
+        {k: v for k, v in output.items() if v is not None}, indent=4
+    )
+
+
+def _calculate_components(args: argparse.Namespace) -> str:
+    """Implementation of calculate cli command for components.
+
+    All components are calculated during a single history walk.
+
+    Args:
+        args:
+            Arguments from the CLI.
+
+    Returns:
+        Either formatted dictionary (keyed by component names)
+        or space separated "name version sha" lines (one per component).
+
+    """
+    config = _config.load()
+    components = _config.components(config, args.component or None)
+
+    versions = {name: VersionCommit() for name in components}
+    # The last version of each component is kept
+    versions.update(
+        Version.from_git_components(
+            components,
+            cache=config.get("cache"),
+            checkpoint_interval=config.get("checkpoint_interval"),
+            rev=args.rev,
+            traversal=config.get("traversal"),
+            backend=config.get("backend"),
+            resume=True,
+        )
+    )
+
+    outputs = {
+        name: _output(version, _checksum_config(components[name]), args)
+        for name, version in versions.items()
+    }
+    return _format_many(outputs, args)
+
+
+def _calculate_refs(args: argparse.Namespace) -> str:
+    """Implementation of calculate cli command for many refs.
+
+    All refs are calculated during a single walk of their histories.
+
+    Args:
+        args:
+            Arguments from the CLI.
+
+    Returns:
+        Either formatted dictionary (keyed by refs)
+        or space separated "ref version sha" lines (one per ref).
+
+    """
+    config = _config.load()
     checksum = _checksum_config()
+    versions = Version.from_git_refs(
+        args.ref,
+        {option: config.get(option) for option in _config.OPTIONS},
+        traversal=config.get("traversal"),
+        base=config.get("base"),
+        backend=config.get("backend"),
+    )
+    return _format_many(
+        {
+            ref: _output(version, checksum, args)
+            for ref, version in versions.items()
+        },
+        args,
+    )
+
 
-    version = str(version.version)
+def _calculate_messages(args: argparse.Namespace) -> None:
+    """Implementation of calculate cli command for streamed messages.
 
+    Messages are versioned by the configured rules (`GitPython`
+    is never imported), outputs are written as soon as calculated.
+
+    Args:
+        args:
+            Arguments from the CLI.
+
+    """
+    with _profile.phase("config"):
+        config = collections.defaultdict(lambda: None, _config.load())
+    checksum = _checksum_config(config) if args.checksum else None
+    versions = Version.from_messages(
+        _messages.read(args.messages_from, args.separator),
+        config["message_includes"],
+        config["message_excludes"],
+        config["major_regexes"],
+        config["minor_regexes"],
+        config["patch_regexes"],
+        config["unrecognized_message"],
+        max_message_size=config["max_message_size"],
+        scopes=config["scopes"],
+    )
+    if not args.all:
+        version = Version()
+        for version in versions:  # noqa: B007
+            pass
+        versions = iter((version,))
+
+    for version in versions:
+        output = {"version": str(version)}
+        if checksum is not None:
+            output["checksum"] = checksum
+        print(  # noqa: T201
+            " ".join(output.values())
+            if args.format == "line"
+            else json.dumps(output)
+        )
+
+
+def _calculate_repos(args: argparse.Namespace) -> int:
+    """Implementation of calculate cli command for many repositories.
+
+    Repositories are processed by a pool of `args.jobs` threads (each
+    one running its own `git` subprocesses), every JSON line is written
+    as soon as the repository is calculated.
+
+    Args:
+        args:
+            Arguments from the CLI.
+
+    Returns:
+        Exit code (`1` if any repository failed, `0` otherwise).
+
+    """
+    with (
+        contextlib.nullcontext(sys.stdin)
+        if args.repos == "-"
+        else pathlib.Path(args.repos).open()
+    ) as handle:
+        paths = [
+            line.strip()
+            for line in handle
+            if line.strip() and not line.startswith("#")
+        ]
+
+    failed = False
+    with concurrent.futures.ThreadPoolExecutor(max(args.jobs, 1)) as pool:
+        # Contexts are copied so the repositories are profiled as well
+        futures = [
+            pool.submit(
+                contextvars.copy_context().run, _calculate_repo, path, args
+            )
+            for path in paths
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            output = future.result()
+            failed = failed or "error" in output
+            print(json.dumps(output), flush=True)  # noqa: T201
+    return int(failed)
+
+
+def _calculate_repo(
+    path: str, args: argparse.Namespace
+) -> dict[str, str | None]:
+    """Calculate version of a repository using its own configuration.
+
+    Args:
+        path:
+            Path to the repository.
+        args:
+            Arguments from the CLI.
+
+    Returns:
+        Path of the repository and either the outputs (see
+        [`_output`][comver._subcommand._output]) or the error.
+
+    """
+    try:
+        repository = git.Repo(path)
+    except git.GitError as e:
+        return {"repository": path, "error": f"{type(e).__name__}: {e}"}
+
+    try:
+        # Bare repositories have no working tree to search the config in
+        config = collections.defaultdict(
+            lambda: None,
+            _config.load_committed(repository, args.rev or "HEAD")
+            if repository.bare
+            else _config.load(repository.working_dir),
+        )
+        version = VersionCommit()
+        for version in Version.from_git(  # noqa: B007
+            **{option: config[option] for option in _config.OPTIONS},
+            repository=repository,
+            cache=bool(config["cache"]),
+            checkpoint_interval=config["checkpoint_interval"],
+            sqlite=bool(config["sqlite"]),
+            rev=args.rev,
+            traversal=config["traversal"],
+            backend=config["backend"],
+            base=config["base"],
+            resume=True,
+        ):
+            pass
+    except (git.GitError, error.ComverError, ValueError) as e:
+        return {"repository": path, "error": f"{type(e).__name__}: {e}"}
+    finally:
+        repository.close()
+
+    output = _output(version, _checksum_config(config), args)
+    return {"repository": path} | {
+        k: v for k, v in output.items() if v is not None
+    }
+
+
+def _format_many(
+    outputs: dict[str, dict[str, str | None]], args: argparse.Namespace
+) -> str:
+    """Format outputs of calculate cli command for many versions.
+
+    Args:
+        outputs:
+            Outputs (see [`_output`][comver._subcommand._output]) keyed
+            by the name (e.g. of the component).
+        args:
+            Arguments from the CLI.
+
+    Returns:
+        Either formatted dictionary or space separated lines
+        (each one prefixed with the name).
+
+    """
     if args.format == "line":
-        if args.sha:
-            version = f"{version} {sha}"
-        if args.checksum:
-            version = f"{version} {checksum}"
-        return version
-
-    output = {"version": str(version)}
-    if args.sha and isinstance(sha, str):
-        output["sha"] = sha
+        return "\n".join(
+            " ".join(map(str, (name, *output.values())))
+            for name, output in outputs.items()
+        )
+
+    return json.dumps(
+        {
+            name: {k: v for k, v in output.items() if v is not None}
+            for name, output in outputs.items()
+        },
+        indent=4,
+    )
+
+
+def _output(
+    version: VersionCommit, checksum: str, args: argparse.Namespace
+) -> dict[str, str | None]:
+    """Gather outputs of calculate cli command.
+
+    Args:
+        version:
+            Calculated version and its commit.
+        checksum:
+            Checksum of the configuration.
+        args:
+            Arguments from the CLI.
+
+    Returns:
+        Version and (based on `args.sha` and `args.checksum` flags)
+        sha (`None` if no commit was included) and checksum.
+
+    """
+    output: dict[str, str | None] = {"version": str(version.version)}
+    if args.sha:
+        output["sha"] = (
+            version.commit.hexsha if version.commit is not None else None
+        )
     if args.checksum:
         output["checksum"] = checksum
-
-    return json.dumps(output, indent=4)
+    return output
 
 
 def _verify(args: argparse.Namespace) -> bool:
@@ -108,67 +683,476 @@ def _verify(args: argparse.Namespace) -> bool:
 
     """
     checksum = _checksum_config()
+    pair = (args.version, args.sha, args.checksum)
 
-    if args.checksum != checksum:
+    found, first = (
+        _locate([pair], args.strategy)
+        if args.checksum == checksum
+        else ({}, {})
+    )
+    reason = _reason(pair, checksum, found, first)
+    if reason is not None:
+        print(reason, file=sys.stderr)  # noqa: T201
+    return reason is not None
+
+
+def _verify_many(path: str, strategy: str = "scan") -> int:
+    """Verify many (version, sha, checksum) triples walking history once.
+
+    Warning:
+        This subcommand outputs a JSON object per triple
+        (in the input order) followed by a JSON summary
+
+    Args:
+        path:
+            File with triples (one per line, space separated),
+            `-` for the standard input.
+        strategy:
+            How the shas are located (see
+            [`_locate`][comver._subcommand._locate]).
+
+    Returns:
+        Code status of the command (`0` if all triples were verified,
+        `1` if any of them failed, `2` for malformed input).
+
+    """
+    try:
+        pairs = _pairs(path)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)  # noqa: T201
+        return 2
+
+    checksum = _checksum_config()
+    found, first = _locate([p for p in pairs if p[2] == checksum], strategy)
+
+    failed = 0
+    for pair in pairs:
+        reason = _reason(pair, checksum, found, first)
+        failed += reason is not None
         print(  # noqa: T201
-            "Provided checksum and the checksum of configuration do not match.",
-            file=sys.stderr,
+            json.dumps(
+                {
+                    "version": pair[0],
+                    "sha": pair[1],
+                    "ok": reason is None,
+                    "reason": reason,
+                }
+            )
+        )
+    print(  # noqa: T201
+        json.dumps(
+            {
+                "total": len(pairs),
+                "passed": len(pairs) - failed,
+                "failed": failed,
+            }
         )
-        return True
+    )
+    return int(failed > 0)
+
 
+def _pairs(path: str) -> list[Pair]:
+    """Read (version, sha, checksum) triples to verify.
+
+    Note:
+        Empty lines and lines starting with `#` are skipped.
+
+    Args:
+        path:
+            File with triples (one per line, space separated, as output
+            by `comver calculate --sha --checksum`), `-` for the
+            standard input.
+
+    Raises:
+        ValueError:
+            If any line is not a valid triple.
+
+    Returns:
+        Triples in the input order.
+
+    """
+    with (
+        contextlib.nullcontext(sys.stdin)
+        if path == "-"
+        else pathlib.Path(path).open()
+    ) as handle:
+        lines = [line.split() for line in handle if not line.startswith("#")]
+
+    pairs: list[Pair] = []
+    for number, fields in enumerate(lines, start=1):
+        if not fields:
+            continue
+        if len(fields) != 3 or not _is_version(fields[0]):  # noqa: PLR2004
+            error = f"Line {number} of `{path}` is not `<VERSION> <SHA> <CHECKSUM>`: `{' '.join(fields)}`"
+            raise ValueError(error)
+        pairs.append((fields[0], fields[1], fields[2]))
+    return pairs
+
+
+def _reason(
+    pair: Pair,
+    checksum: str,
+    found: dict[str, Version],
+    first: dict[str, str],
+) -> str | None:
+    """Explain why the verification of a triple failed.
+
+    Note:
+        Any commit with the version passes (not only the first one
+        reaching it), as `calculate --sha` outputs the last included
+        commit, which may not have changed the version.
+
+    Args:
+        pair:
+            Version, sha and checksum to verify.
+        checksum:
+            Checksum of the configuration.
+        found:
+            Versions of located shas.
+        first:
+            Shas of the first commits of located versions.
+
+    Returns:
+        Message for the end user (`None` if verification succeeded).
+
+    """
+    version, sha, provided = pair
+    if provided != checksum:
+        return (
+            "Provided checksum and the checksum of configuration do not match."
+        )
+
+    if sha in found:
+        if found[sha] == version:
+            return None
+        return f"Specified sha: `{sha}` corresponds to version: `{found[sha]}`, while expected version is: `{version}`"
+
+    if version in first:
+        return f"Specified version: `{version}` has sha: `{first[version]}`, while expected sha is: `{sha}`"
+
+    return f"Neither specified sha: `{sha}` nor its corresponding version: `{version}` was found in the git tree"
+
+
+def _history(args: argparse.Namespace, stream: typing.TextIO) -> None:
+    """Implementation of history cli command.
+
+    Args:
+        args:
+            Arguments from the CLI.
+        stream:
+            Text stream records are written to.
+
+    """
+    fields = ["sha", "version", "bump"]
+    if args.author:
+        fields.extend(("author_name", "author_email"))
+    if args.time:
+        fields.append("time")
+
+    if args.format == "ndjson":
+        for record in _records(args):
+            _ = stream.write(f"{json.dumps(record)}\n")
+        return
+
+    writer = csv.DictWriter(
+        stream,
+        fieldnames=fields,
+        delimiter="," if args.format == "csv" else "\t",
+        lineterminator="\n",
+    )
+    writer.writeheader()
+    for record in _records(args):
+        _ = writer.writerow(record)
+
+
+def _records(args: argparse.Namespace) -> Iterator[dict[str, str]]:
+    """Yield record of every commit (oldest first).
+
+    Note:
+        The whole history is walked (cached checkpoints are not used),
+        as every commit has to be output.
+
+    Args:
+        args:
+            Arguments from the CLI.
+
+    Yields:
+        Sha, version, bump kind and (optionally) author and time
+        of each commit.
+
+    """
+    # Commits after the horizon are bumped from its version, the `sha`
+    # commit (if any) is yielded with it, hence it is never bumped
+    horizon = _horizon.resolve(_config.load().get("base"))
+    previous = (
+        Version() if horizon is None else Version.from_string(horizon.version)
+    )
+    for output in Version.from_git_configured(cache=False):
+        # Base version of the horizon without `sha` has no commit
+        if output.commit is None:
+            continue
+        record = {
+            "sha": output.commit.hexsha,
+            "version": str(output.version),
+            "bump": _bump(previous, output.version),
+        }
+        if args.author:
+            record["author_name"] = str(output.commit.author.name)
+            record["author_email"] = str(output.commit.author.email)
+        if args.time:
+            record["time"] = output.commit.committed_datetime.isoformat()
+        previous = output.version
+        yield record
+
+
+def _bump(previous: Version, current: Version) -> str:
+    """Get the kind of the bump between consecutive versions.
+
+    Args:
+        previous:
+            Version before the commit.
+        current:
+            Version after the commit.
+
+    Returns:
+        One of `major`, `minor`, `patch` or `none`.
+
+    """
+    if current.major != previous.major:
+        return "major"
+    if current.minor != previous.minor:
+        return "minor"
+    if current.patch != previous.patch:
+        return "patch"
+    return "none"
+
+
+def _query(args: argparse.Namespace) -> Iterator[VersionRecord]:
+    """Implementation of query cli command.
+
+    Args:
+        args:
+            Arguments from the CLI.
+
+    Returns:
+        Records matching the constraints (only the newest one
+        committed up to `args.on` if specified).
+
+    """
+    if args.on is not None:
+        record = Version.on(args.on)
+        return iter(() if record is None else (record,))
+
+    return Version.query(
+        lower=args.min_version,
+        upper=args.max_version,
+        since=args.since,
+        until=args.until,
+    )
+
+
+def _record(record: VersionRecord, output: str) -> str:
+    """Format a single record of the history store.
+
+    Args:
+        record:
+            Record to format.
+        output:
+            Format of the output (either `line` or `json`).
+
+    Returns:
+        Space separated "version sha time" or JSON object
+        (single line, usable as NDJSON).
+
+    """
+    time = record.time.isoformat()
+    if output == "line":
+        return f"{record.version} {record.sha} {time}"
+    return json.dumps(
+        {"version": str(record.version), "sha": record.sha, "time": time}
+    )
+
+
+def _locate(
+    pairs: Iterable[Pair], strategy: str = "scan"
+) -> tuple[dict[str, Version], dict[str, str]]:
+    """Find versions of shas and first shas of versions of all `pairs`.
+
+    Note:
+        For the `scan` strategy, if `cache` is enabled in the configuration
+        (and the `base` has no `max_commits`), the history index is probed
+        (`O(log n)` per pair), otherwise the history is scanned once
+        (stopping as soon as all shas were found).
+        The `ancestry` strategy walks only the ancestors of each sha
+        (see [`_ancestry`][comver._subcommand._ancestry]).
+
+    Args:
+        pairs:
+            Version, sha and checksum triples to locate.
+        strategy:
+            Either `scan` or `ancestry`.
+
+    Returns:
+        Versions of found shas and shas of the first commits of found
+        versions (only those needed for unfound shas are guaranteed).
+
+    """
+    shas = {sha for _, sha, _ in pairs}
+    versions = {version for version, _, _ in pairs}
+    if not shas:
+        return {}, {}
+    if strategy == "ancestry":
+        return _ancestry(shas), {}
+    config = _config.load()
+    # Walks up to the moving horizon (`max_commits`) are never cached
+    if config.get("cache") and _horizon.cached(
+        _horizon.resolve(config.get("base"))
+    ):
+        return _probe(shas, versions)
+    return _scan(shas, versions)
+
+
+def _scan(
+    shas: set[str], versions: set[str]
+) -> tuple[dict[str, Version], dict[str, str]]:
+    """Find versions of `shas` and first shas of `versions` in a single walk.
+
+    Args:
+        shas:
+            Shas of the commits to find.
+        versions:
+            Versions to find (e.g. `1.37.21`).
+
+    Returns:
+        Versions of found shas and shas of the first commits of found
+        versions.
+
+    """
+    found: dict[str, Version] = {}
+    first: dict[str, str] = {}
+    remaining = set(shas)
     for output in Version.from_git_configured():
-        version, commit = output.version, output.commit
+        if output.commit is None:
+            continue
+        commit = output.commit.hexsha
+        if commit in remaining:
+            found[commit] = output.version
+            remaining.discard(commit)
+            if not remaining:
+                break
+        if (version := str(output.version)) in versions:
+            _ = first.setdefault(version, commit)
+
+    return found, first
+
+
+def _ancestry(shas: set[str]) -> dict[str, Version]:
+    """Calculate versions of `shas` walking only their ancestors.
+
+    Each sha has to be reachable from `HEAD`, and its version is
+    calculated as `comver calculate` would when `HEAD` pointed to it
+    (resuming from the nearest cached checkpoint below it, if `cache`
+    is enabled), so commits done after it are never walked.
+
+    Note:
+        Versions may differ from the `scan` strategy for non-linear
+        histories, where commits from branches merged later
+        (but committed earlier) precede sha in the whole history.
+
+    Args:
+        shas:
+            Shas of the commits to find.
+
+    Returns:
+        Versions of found shas (those which are reachable from `HEAD`
+        and were not filtered out).
+
+    """
+    repository = _repository(None)
+    reader = _backend.load(repository, _config.load().get("backend"))
+    found: dict[str, Version] = {}
+    for sha in filter(_index.is_sha, shas):
+        if not reader.is_ancestor(sha, "HEAD"):
+            continue
+
+        output = VersionCommit()
+        for output in Version.from_git_configured(  # noqa: B007
+            repository=repository, rev=sha, resume=True
+        ):
+            pass
+        if output.commit is not None and output.commit.hexsha == sha:
+            found[sha] = output.version
+
+    return found
 
-        sha = commit.hexsha if commit is not None else None
 
-        if args.version == version:
-            if sha is not None and sha == args.sha:
-                return False
+def _probe(
+    shas: set[str], versions: set[str]
+) -> tuple[dict[str, Version], dict[str, str]]:
+    """Find versions of `shas` and first shas of `versions` in the index.
+
+    Args:
+        shas:
+            Shas of the commits to find.
+        versions:
+            Versions to find (e.g. `1.37.21`).
 
-            print(  # noqa: T201
-                f"Specified version: `{args.version}` has sha: `{sha}`, while expected sha is: `{args.sha}`",
-                file=sys.stderr,
-            )  # pragma: no cover
-            return True  # pragma: no cover
+    Returns:
+        Versions of found shas and shas of the first commits of found
+        versions.
 
-        if args.sha == sha:
-            print(  # noqa: T201
-                f"Specified sha: `{args.sha}` corresponds to version: `{version}`, while expected version is: `{args.version}`",  # noqa: E501
-                file=sys.stderr,
+    """
+    found: dict[str, Version] = {}
+    first: dict[str, str] = {}
+    with _history_index() as index:
+        for sha in shas:
+            record = (
+                index.find(bytes.fromhex(sha)) if _index.is_sha(sha) else None
+            )
+            if record is not None:
+                found[sha] = Version(*record[1:])
+        for version in versions:
+            expected = Version.from_string(version)
+            position = index.first(
+                (expected.major, expected.minor, expected.patch)
             )
-            return True
+            if position is not None:
+                first[version] = index.record(position)[0].hex()
 
-    print(  # noqa: T201
-        f"Neither specified sha: `{args.sha}` nor its corresponding version: `{args.version}` was found in the git tree",  # noqa: E501
-        file=sys.stderr,
-    )
+    return found, first
+
+
+def _is_version(version: str) -> bool:
+    """Check whether `version` is in `MAJOR.MINOR.PATCH` format.
+
+    Args:
+        version:
+            Version to check.
+
+    Returns:
+        `True` if `version` is a valid version.
+
+    """
+    try:
+        _ = Version.from_string(version)
+    except (error.VersionFormatError, error.VersionNotNumericError):
+        return False
     return True
 
 
-def _checksum_config() -> str:
+def _checksum_config(config: Mapping[str, typing.Any] | None = None) -> str:
     """Get checksum of config.
 
+    Args:
+        config:
+            Options to calculate the checksum of (e.g. of a component).
+            Default: The `comver` configuration.
+
     Returns:
         Checksum of subconfig.
 
     """
-    config = collections.defaultdict(lambda: None, loadfig.config("comver"))
-    keys = [
-        "message_includes",
-        "message_excludes",
-        "path_includes",
-        "path_excludes",
-        "author_name_includes",
-        "author_name_excludes",
-        "author_email_includes",
-        "author_email_excludes",
-        "major_regexes",
-        "minor_regexes",
-        "patch_regexes",
-        "unrecognized_message",
-    ]
-
-    # Get only relevant sections of the dict
-    subconfig = {k: config[k] for k in keys}
-    stringified = json.dumps(subconfig, sort_keys=True)
-    return hashlib.sha256(stringified.encode()).hexdigest()
+    if config is None:
+        with _profile.phase("config"):
+            config = _config.load()
+    return _config.checksum(config)
@@ -26,18 +26,47 @@ from __future__ import annotations
 
 import collections
 import dataclasses
+import datetime as dt
 import functools
 import typing
-
-import git
-import loadfig
-
-from comver import _regex, error
+import warnings
+
+from comver import (
+    _backend,
+    _cache,
+    _config,
+    _horizon,
+    _index,
+    _lazy,
+    _profile,
+    _regex,
+    _store,
+    error,
+)
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    from collections.abc import (
+        AsyncIterator,
+        Generator,
+        Iterable,
+        Iterator,
+        Mapping,
+        Sequence,
+    )
 
-    from comver.type_definitions import OptionalStringsOrPatterns
+    import git
+
+    from comver import _aio
+    from comver.stats import Stats
+    from comver.type_definitions import (
+        Base,
+        OptionalStringsOrPatterns,
+        Scopes,
+    )
+else:
+    git = _lazy.module("git")
+    # asyncio (imported by it) is costly and used only by `afrom_git`
+    _aio = _lazy.module("comver._aio")
 
 from importlib.metadata import version
 
@@ -76,7 +105,165 @@ class Version:
     minor: int = 0
     patch: int = 0
 
-    # Add commit message includes and commit message excludes
+    @classmethod
+    def at(
+        cls,
+        sha: str,
+        repository: str | git.Repo | None = None,
+    ) -> Version | None:
+        """Get the version of a commit via the history index.
+
+        The index is a memory-mapped file (stored in the `.git/comver`
+        directory), hence lookups take `O(log n)` time and the file
+        is shared between concurrent processes.
+
+        Example usage:
+
+        ```python
+        import comver
+
+        version = comver.Version.at("4b825dc642cb6eb9a060e54bf8d69288fbee4904")
+        ```
+
+        Important:
+            Rules are taken from the configuration (as in
+            [`from_git_configured`][comver._version.Version.from_git_configured]).
+            The index is brought up to date (resuming from checkpoints)
+            before the lookup.
+
+        Args:
+            sha:
+                Full (`40` characters) sha of the commit.
+            repository:
+                The `git` repository.
+                Default: Searched in the parent directories.
+
+        Raises:
+            HorizonUncachedError:
+                If the configured `base` has `max_commits` (never cached).
+
+        Returns:
+            Version of the commit or `None` if the commit was not
+            yielded (e.g. it is not in the history or was filtered out)
+            or `sha` is not a full one (abbreviated shas are not resolved).
+
+        """
+        if not _index.is_sha(sha):
+            return None
+
+        with _history_index(repository) as index:
+            record = index.find(bytes.fromhex(sha))
+        return None if record is None else cls(*record[1:])
+
+    @classmethod
+    def on(
+        cls,
+        moment: dt.datetime,
+        repository: str | git.Repo | None = None,
+    ) -> VersionRecord | None:
+        """Get the version of the newest commit committed up to `moment`.
+
+        Example usage:
+
+        ```python
+        import datetime
+
+        import comver
+
+        record = comver.Version.on(datetime.datetime(2025, 6, 1))
+        if record is not None:
+            print(record.version, record.sha)
+        ```
+
+        Important:
+            Rules are taken from the configuration (as in
+            [`from_git_configured`][comver._version.Version.from_git_configured]).
+            The SQLite history store (in the `.git/comver` directory)
+            is brought up to date (resuming from checkpoints) before
+            the lookup.
+
+        Args:
+            moment:
+                Point in time (naive datetimes are in UTC, as `since`
+                of the [`Base`][comver.type_definitions.Base]).
+            repository:
+                The `git` repository.
+                Default: Searched in the parent directories.
+
+        Raises:
+            HorizonUncachedError:
+                If the configured `base` has `max_commits` (never cached).
+
+        Returns:
+            Version, sha and commit time of the newest commit
+            (`None` if no commit was committed up to `moment`).
+
+        """
+        with _history_store(repository) as store:
+            row = store.on(_horizon.timestamp(moment))
+        return None if row is None else VersionRecord.from_row(row)
+
+    @classmethod
+    def query(
+        cls,
+        lower: Version | str | None = None,
+        upper: Version | str | None = None,
+        since: dt.datetime | None = None,
+        until: dt.datetime | None = None,
+        repository: str | git.Repo | None = None,
+    ) -> Iterator[VersionRecord]:
+        """Yield commits whose version and commit time are within ranges.
+
+        Example usage:
+
+        ```python
+        import comver
+
+        # Commits which moved the project from 3.x to 4.0.0
+        for record in comver.Version.query(lower="3.0.0", upper="4.0.0"):
+            print(record.version, record.sha, record.time)
+        ```
+
+        Important:
+            Rules are taken from the configuration (as in
+            [`from_git_configured`][comver._version.Version.from_git_configured]).
+            The SQLite history store (in the `.git/comver` directory)
+            is brought up to date (resuming from checkpoints) before
+            the query.
+
+        Args:
+            lower:
+                Minimal version (inclusive). Default: No constraint.
+            upper:
+                Maximal version (inclusive). Default: No constraint.
+            since:
+                Minimal commit time (inclusive, naive datetimes are
+                in UTC). Default: No constraint.
+            until:
+                Maximal commit time (inclusive, naive datetimes are
+                in UTC). Default: No constraint.
+            repository:
+                The `git` repository.
+                Default: Searched in the parent directories.
+
+        Raises:
+            HorizonUncachedError:
+                If the configured `base` has `max_commits` (never cached).
+
+        Yields:
+            Version, sha and commit time of matching commits
+            (in commit order).
+
+        """
+        with _history_store(repository) as store:
+            for row in store.query(
+                _triple(lower),
+                _triple(upper),
+                None if since is None else _horizon.timestamp(since),
+                None if until is None else _horizon.timestamp(until),
+            ):
+                yield VersionRecord.from_row(row)
+
     @classmethod
     def from_git_configured(  # noqa: PLR0913
         cls,
@@ -93,6 +280,20 @@ class Version:
         patch_regexes: OptionalStringsOrPatterns = None,
         unrecognized_message: typing.Literal["ignore", "error"] | None = None,
         repository: str | git.Repo | None = None,
+        *,
+        cache: bool | None = None,
+        checkpoint_interval: int | None = None,
+        sqlite: bool | None = None,
+        rev: str | None = None,
+        traversal: typing.Literal["all", "first-parent", "merges-only"]
+        | None = None,
+        backend: typing.Literal["subprocess", "gitpython", "pygit2"]
+        | None = None,
+        max_message_size: int | None = None,
+        scopes: Scopes | None = None,
+        base: Base | None = None,
+        resume: bool = False,
+        stats: Stats | None = None,
     ) -> Iterator[VersionCommit]:
         r"""Yield version and its respective commit.
 
@@ -160,6 +361,10 @@ class Version:
             (the same will be returned),
             __but the Version-Commit pair will be returned__.
 
+        Tip:
+            Statistics of the run are collected into the `stats`
+            argument (if provided, see [`comver.stats`][comver.stats]).
+
         Args:
             message_includes:
                 Commit message regexes against which the commit is included.
@@ -207,12 +412,57 @@ class Version:
                 The `git` repository.
                 Default: From config OR will be searched
                 in the parent directories.
+            cache:
+                Whether to resume calculations from on-disk checkpoints
+                (see [`from_git`][comver._version.Version.from_git]).
+                Default: From config OR `False`
+            checkpoint_interval:
+                Number of walked commits between consecutive checkpoints.
+                Default: From config OR `1000`
+            sqlite:
+                Whether to keep the SQLite history store (requires `cache`).
+                Default: From config OR `False`
+            rev:
+                Commit (or any other revision, e.g. branch or tag) to
+                calculate the version for (see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: `HEAD`
+            traversal:
+                Which commits are walked (see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: From config OR `"all"`
+            backend:
+                How the repository is read (see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: From config OR `COMVER_BACKEND` environment
+                variable OR `"subprocess"`
+            max_message_size:
+                Maximal number of characters of the message matched
+                (see [`from_message`][comver._version.Version.from_message]).
+                Default: From config OR whole messages are matched.
+            scopes:
+                Sections of the message scanned by the message rules
+                (see [`from_message`][comver._version.Version.from_message]).
+                Default: From config OR whole messages are scanned.
+            base:
+                History horizon and the version before it (see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: From config OR the whole history is walked.
+            resume:
+                Whether the first yielded element may be the checkpointed
+                state (see [`from_git`][comver._version.Version.from_git]).
+                Default: All commits are yielded.
+            stats:
+                Statistics collected while the iterator runs
+                (see [`comver.stats`][comver.stats]).
+                Default: Nothing is collected.
 
         Yields:
             Version and its respective commit
 
         """
-        config = collections.defaultdict(lambda: None, loadfig.config("comver"))
+        with _profile.phase("config"):
+            config = collections.defaultdict(lambda: None, _config.load())
 
         yield from cls.from_git(
             message_includes=message_includes or config["message_includes"],
@@ -233,10 +483,23 @@ class Version:
             unrecognized_message=unrecognized_message
             or config["unrecognized_message"],
             repository=repository,
+            cache=config["cache"] if cache is None else cache,
+            checkpoint_interval=checkpoint_interval
+            or config["checkpoint_interval"],
+            sqlite=config["sqlite"] if sqlite is None else sqlite,
+            rev=rev,
+            traversal=traversal or config["traversal"],
+            backend=backend or config["backend"],
+            max_message_size=max_message_size or config["max_message_size"],
+            scopes=scopes or config["scopes"],
+            base=base or config["base"],
+            resume=resume,
+            stats=stats,
         )
 
     @classmethod
-    def from_git(  # noqa: PLR0913
+    @_profile.observable
+    def from_git(  # noqa: PLR0913, PLR0915
         cls,
         message_includes: OptionalStringsOrPatterns = None,
         message_excludes: OptionalStringsOrPatterns = None,
@@ -251,6 +514,20 @@ class Version:
         patch_regexes: OptionalStringsOrPatterns = None,
         unrecognized_message: typing.Literal["ignore", "error"] | None = None,
         repository: str | git.Repo | None = None,
+        *,
+        cache: bool | None = None,
+        checkpoint_interval: int | None = None,
+        sqlite: bool | None = None,
+        rev: str | None = None,
+        traversal: typing.Literal["all", "first-parent", "merges-only"]
+        | None = None,
+        backend: typing.Literal["subprocess", "gitpython", "pygit2"]
+        | None = None,
+        max_message_size: int | None = None,
+        scopes: Scopes | None = None,
+        base: Base | None = None,
+        resume: bool = False,
+        stats: Stats | None = None,  # noqa: ARG003
     ) -> Iterator[VersionCommit]:
         """Yield version and its respective commit.
 
@@ -285,6 +562,29 @@ class Version:
             the `*_include` regexes are checked first, then the `*_exclude`
             regexes might disinclude the `*_include` match
 
+        Note:
+            When `cache` is enabled, the walk resumes from the newest usable
+            checkpoint (stored in the `.git/comver` directory). Commits
+            yielded before it are replayed from the history index (they are
+            neither diffed nor classified), hence the outputs are the same.
+
+        Warning:
+            With `resume`, __the first yielded element is the checkpointed
+            state__ (last commit yielded before the checkpoint and its
+            version), earlier commits are not yielded.
+
+        Warning:
+            When `base` is provided, __the first yielded element is its
+            version__ (and the `sha` commit, if any) unless the walk
+            is resumed from a checkpoint. The `max_commits` horizon moves
+            with new commits (hence versions may decrease as commits
+            leave it) and is never cached, prefer `sha` or `since`.
+
+        Tip:
+            Statistics (e.g. commits scanned or diffs computed) of the run
+            are collected into the `stats` argument (if provided,
+            see [`comver.stats`][comver.stats]).
+
         Args:
             message_includes:
                 Commit message regexes against which the commit is included.
@@ -331,19 +631,421 @@ class Version:
             repository:
                 The `git` repository.
                 Default: Searched in the parent directories.
+            cache:
+                Whether to resume calculations from on-disk checkpoints.
+                Checkpoints are invalidated (down to the nearest
+                valid one) when the history is rewritten.
+                Default: `False`
+            checkpoint_interval:
+                Number of walked commits between consecutive checkpoints.
+                Default: `1000`
+            sqlite:
+                Whether to keep the SQLite history store (requires `cache`),
+                used by [`on`][comver._version.Version.on] and
+                [`query`][comver._version.Version.query].
+                Default: `False`
+            rev:
+                Commit (or any other revision, e.g. branch or tag) to
+                calculate the version for. Only its ancestors are walked
+                (as if `HEAD` pointed to it). Checkpoints below `rev` are
+                reused, but the cache is persisted only if `rev` is `HEAD`.
+                Default: `HEAD`
+            traversal:
+                Which commits are walked: `"all"` (every reachable commit),
+                `"first-parent"` (only the first-parent chain, e.g. squashed
+                or merged pull requests on the main branch) or
+                `"merges-only"` (only merge commits, e.g. to use titles
+                of merged pull requests). Commits are filtered by `git`
+                itself, hence other commits are never diffed.
+                Default: `"all"`
+            backend:
+                How the repository is read: `"subprocess"` (`git` plumbing
+                commands), `"gitpython"` or `"pygit2"` (requires `pygit2`
+                to be installed). Yielded commits are always `GitPython`
+                commits, attributes not read by the backend (e.g. committer)
+                are read lazily.
+                Default: `COMVER_BACKEND` environment variable
+                OR `"subprocess"`
+            max_message_size:
+                Maximal number of characters of the message matched
+                (see [`from_message`][comver._version.Version.from_message]).
+                Default: Whole messages are matched.
+            scopes:
+                Sections of the message scanned by the message rules
+                (see [`from_message`][comver._version.Version.from_message]).
+                Default: Whole messages are scanned.
+            base:
+                History horizon (see
+                [`Base`][comver.type_definitions.Base]): the `version`
+                of the history before it and the `sha` (its ancestors,
+                itself included, are not walked), `since` (older commits
+                are not walked) and/or `max_commits` (only the newest
+                commits are walked), all pushed down to `git`.
+                Default: The whole history is walked.
+            resume:
+                Whether the walk starts from the checkpointed state
+                (yielded first) instead of replaying the commits before
+                it, for callers interested only in the latest versions.
+                Default: All commits are yielded.
+            stats:
+                Statistics collected while the iterator runs
+                (see [`comver.stats`][comver.stats]).
+                Default: Nothing is collected.
+
+        Raises:
+            TraversalUnknownError:
+                If `traversal` is not one of the above.
+            BackendUnavailableError:
+                If `backend` is unknown or not installed.
+            HorizonInvalidError:
+                If `base` is malformed.
+            HorizonUnreachableError:
+                If `rev` does not descend from the `sha` of the `base`
+                (e.g. it is older than the horizon).
+
+        Yields:
+            Version and its respective commit
+
+        """
+        repository = _repository(repository)
+        flags = _flags(traversal)
+        horizon = _horizon.resolve(base)
+        reader = _backend.load(repository, backend)
+
+        head = reader.resolve("HEAD")
+        rev = head if rev is None else reader.resolve(rev)
+        checkpoints = (
+            _cache.Cache.load(
+                repository,
+                _cache.key(
+                    traversal,
+                    max_message_size,
+                    scopes,
+                    base,
+                    message_includes=message_includes,
+                    message_excludes=message_excludes,
+                    path_includes=path_includes,
+                    path_excludes=path_excludes,
+                    author_name_includes=author_name_includes,
+                    author_name_excludes=author_name_excludes,
+                    author_email_includes=author_email_includes,
+                    author_email_excludes=author_email_excludes,
+                    major_regexes=major_regexes,
+                    minor_regexes=minor_regexes,
+                    patch_regexes=patch_regexes,
+                ),
+                checkpoint_interval,
+                sqlite,
+                flags,
+            )
+            if cache and _horizon.cached(horizon)
+            else None
+        )
+
+        version, since = yield from _start(
+            repository, reader, rev, checkpoints, horizon, resume=resume
+        )
+
+        limits = flags if horizon is None else {**flags, **horizon.limits}
+        for record in _profile.timed(
+            reader.commits(rev, limits, since), "traversal"
+        ):
+            _profile.count("commits")
+            commit = record.commit(repository)
+            included = _include_commit(
+                commit,
+                path_includes,
+                path_excludes,
+                author_name_includes,
+                author_name_excludes,
+                author_email_includes,
+                author_email_excludes,
+                paths=_changed(
+                    reader, record.sha, path_includes, path_excludes
+                ),
+            )
+            if included:
+                # Messages of filtered out commits are never decoded
+                commit.message = message = record.message
+                with _profile.phase("classification"):
+                    version = cls.from_message(
+                        message,
+                        message_includes,
+                        message_excludes,
+                        major_regexes,
+                        minor_regexes,
+                        patch_regexes,
+                        unrecognized_message,
+                        version=version,
+                        max_message_size=max_message_size,
+                        scopes=scopes,
+                    )
+                yield VersionCommit(version, commit)
+            if checkpoints is not None:
+                checkpoints.update(commit, version, included=included)
+
+        # Cache of other revisions would shrink the one of HEAD
+        if checkpoints is not None and rev == head:
+            checkpoints.save()
+
+    @classmethod
+    async def afrom_git_configured(  # noqa: PLR0913
+        cls,
+        message_includes: OptionalStringsOrPatterns = None,
+        message_excludes: OptionalStringsOrPatterns = None,
+        path_includes: OptionalStringsOrPatterns = None,
+        path_excludes: OptionalStringsOrPatterns = None,
+        author_name_includes: OptionalStringsOrPatterns = None,
+        author_name_excludes: OptionalStringsOrPatterns = None,
+        author_email_includes: OptionalStringsOrPatterns = None,
+        author_email_excludes: OptionalStringsOrPatterns = None,
+        major_regexes: OptionalStringsOrPatterns = None,
+        minor_regexes: OptionalStringsOrPatterns = None,
+        patch_regexes: OptionalStringsOrPatterns = None,
+        unrecognized_message: typing.Literal["ignore", "error"] | None = None,
+        repository: str | git.Repo | None = None,
+        *,
+        rev: str | None = None,
+        traversal: typing.Literal["all", "first-parent", "merges-only"]
+        | None = None,
+        max_message_size: int | None = None,
+        scopes: Scopes | None = None,
+        base: Base | None = None,
+    ) -> AsyncIterator[VersionCommit]:
+        """Asynchronously yield version and its respective commit.
+
+        Asynchronous counterpart of
+        [`from_git_configured`][comver._version.Version.from_git_configured],
+        arguments (if not provided) are inferred from the configuration
+        (caching options are not used, see
+        [`afrom_git`][comver._version.Version.afrom_git]).
+
+        Args:
+            message_includes:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR all messages are included.
+            message_excludes:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR no messages are excluded.
+            path_includes:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR all paths are included.
+            path_excludes:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR no paths are excluded.
+            author_name_includes:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR all names are included.
+            author_name_excludes:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR no names are excluded.
+            author_email_includes:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR all emails are included.
+            author_email_excludes:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR no emails are excluded.
+            major_regexes:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR matches `feat!:` and `fix!:`
+            minor_regexes:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR matches messages starting with `feat:`.
+            patch_regexes:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR matches messages starting with `fix:`.
+            unrecognized_message:
+                See [`from_git`][comver._version.Version.from_git].
+                Default: From config OR "ignore"
+            repository:
+                The `git` repository.
+                Default: Searched in the parent directories.
+            rev:
+                Commit (or any other revision) to calculate the version for.
+                Default: `HEAD`
+            traversal:
+                Which commits are walked (see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: From config OR `"all"`
+            max_message_size:
+                Maximal number of characters of the message matched
+                (see [`from_message`][comver._version.Version.from_message]).
+                Default: From config OR whole messages are matched.
+            scopes:
+                Sections of the message scanned by the message rules
+                (see [`from_message`][comver._version.Version.from_message]).
+                Default: From config OR whole messages are scanned.
+            base:
+                History horizon and the version before it (see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: From config OR the whole history is walked.
+
+        Yields:
+            Version and its respective commit
+
+        """
+        with _profile.phase("config"):
+            config = collections.defaultdict(lambda: None, _config.load())
+
+        async for output in cls.afrom_git(
+            message_includes=message_includes or config["message_includes"],
+            message_excludes=message_excludes or config["message_excludes"],
+            path_includes=path_includes or config["path_includes"],
+            path_excludes=path_excludes or config["path_excludes"],
+            author_name_includes=author_name_includes
+            or config["author_name_includes"],
+            author_name_excludes=author_name_excludes
+            or config["author_name_excludes"],
+            author_email_includes=author_email_includes
+            or config["author_email_includes"],
+            author_email_excludes=author_email_excludes
+            or config["author_email_excludes"],
+            major_regexes=major_regexes or config["major_regexes"],
+            minor_regexes=minor_regexes or config["minor_regexes"],
+            patch_regexes=patch_regexes or config["patch_regexes"],
+            unrecognized_message=unrecognized_message
+            or config["unrecognized_message"],
+            repository=repository,
+            rev=rev,
+            traversal=traversal or config["traversal"],
+            max_message_size=max_message_size or config["max_message_size"],
+            scopes=scopes or config["scopes"],
+            base=base or config["base"],
+        ):
+            yield output
+
+    @classmethod
+    async def afrom_git(  # noqa: PLR0913
+        cls,
+        message_includes: OptionalStringsOrPatterns = None,
+        message_excludes: OptionalStringsOrPatterns = None,
+        path_includes: OptionalStringsOrPatterns = None,
+        path_excludes: OptionalStringsOrPatterns = None,
+        author_name_includes: OptionalStringsOrPatterns = None,
+        author_name_excludes: OptionalStringsOrPatterns = None,
+        author_email_includes: OptionalStringsOrPatterns = None,
+        author_email_excludes: OptionalStringsOrPatterns = None,
+        major_regexes: OptionalStringsOrPatterns = None,
+        minor_regexes: OptionalStringsOrPatterns = None,
+        patch_regexes: OptionalStringsOrPatterns = None,
+        unrecognized_message: typing.Literal["ignore", "error"] | None = None,
+        repository: str | git.Repo | None = None,
+        *,
+        rev: str | None = None,
+        traversal: typing.Literal["all", "first-parent", "merges-only"]
+        | None = None,
+        max_message_size: int | None = None,
+        scopes: Scopes | None = None,
+        base: Base | None = None,
+    ) -> AsyncIterator[VersionCommit]:
+        """Asynchronously yield version and its respective commit.
+
+        Asynchronous counterpart of
+        [`from_git`][comver._version.Version.from_git] (yielding the same
+        outputs), suitable for `asyncio` applications. `git` is run via
+        `asyncio` subprocesses and its output is parsed incrementally,
+        hence the event loop is not blocked and many repositories
+        can be versioned concurrently:
+
+        ```python
+        import asyncio
+
+        import comver
+
+
+        async def latest(repository: str) -> comver.Version:
+            version = comver.Version()
+            async for output in comver.Version.afrom_git(repository=repository):
+                version = output.version
+            return version
+
+
+        async def main() -> None:
+            print(await asyncio.gather(latest("a"), latest("b")))
+        ```
+
+        Cancelling the task (or closing the generator) kills
+        running `git` subprocesses.
+
+        Note:
+            Checkpoints (`cache`) are neither read nor written.
+
+        Args:
+            message_includes:
+                See [`from_git`][comver._version.Version.from_git].
+            message_excludes:
+                See [`from_git`][comver._version.Version.from_git].
+            path_includes:
+                See [`from_git`][comver._version.Version.from_git].
+                Changed paths are only computed if any path regexes
+                are provided (a `git diff` subprocess per commit).
+            path_excludes:
+                See [`from_git`][comver._version.Version.from_git].
+            author_name_includes:
+                See [`from_git`][comver._version.Version.from_git].
+            author_name_excludes:
+                See [`from_git`][comver._version.Version.from_git].
+            author_email_includes:
+                See [`from_git`][comver._version.Version.from_git].
+            author_email_excludes:
+                See [`from_git`][comver._version.Version.from_git].
+            major_regexes:
+                See [`from_git`][comver._version.Version.from_git].
+            minor_regexes:
+                See [`from_git`][comver._version.Version.from_git].
+            patch_regexes:
+                See [`from_git`][comver._version.Version.from_git].
+            unrecognized_message:
+                See [`from_git`][comver._version.Version.from_git].
+            repository:
+                The `git` repository.
+                Default: Searched in the parent directories.
+            rev:
+                Commit (or any other revision) to calculate the version for.
+                Default: `HEAD`
+            traversal:
+                Which commits are walked (see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: `"all"`
+            max_message_size:
+                Maximal number of characters of the message matched
+                (see [`from_message`][comver._version.Version.from_message]).
+                Default: Whole messages are matched.
+            scopes:
+                Sections of the message scanned by the message rules
+                (see [`from_message`][comver._version.Version.from_message]).
+                Default: Whole messages are scanned.
+            base:
+                History horizon and the version before it (see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: The whole history is walked.
 
         Yields:
             Version and its respective commit
 
         """
-        if isinstance(repository, str):
-            repository = git.Repo(repository)
-        if repository is None:
-            repository = git.Repo(search_parent_directories=True)
-
-        commits = [
-            commit
-            for commit in repository.iter_commits(reverse=True)
+        repository = _repository(repository)
+        flags = _flags(traversal)
+        horizon = _horizon.resolve(base)
+        directory = repository.working_dir
+
+        rev = rev or "HEAD"
+        # Resolved (and checked for ancestry) via `GitPython`
+        start = await _aio.blocking(_base, repository, horizon, rev)
+        version = start.version
+        if horizon is not None:
+            yield start
+        if start.commit is not None:
+            rev = f"{start.commit.hexsha}..{rev}"
+
+        limits = flags if horizon is None else {**flags, **horizon.limits}
+        async for record in _aio.log(directory, rev, limits):
+            commit = record.commit(repository)
+            paths = (
+                await _aio.changed(directory, record.sha)
+                if path_includes or path_excludes
+                else None
+            )
             if _include_commit(
                 commit,
                 path_includes,
@@ -352,25 +1054,272 @@ class Version:
                 author_name_excludes,
                 author_email_includes,
                 author_email_excludes,
+                paths=paths,
+            ):
+                commit.message = message = record.message
+                version = cls.from_message(
+                    message,
+                    message_includes,
+                    message_excludes,
+                    major_regexes,
+                    minor_regexes,
+                    patch_regexes,
+                    unrecognized_message,
+                    version=version,
+                    max_message_size=max_message_size,
+                    scopes=scopes,
+                )
+                yield VersionCommit(version, commit)
+
+    @classmethod
+    def from_git_components(  # noqa: PLR0913
+        cls,
+        components: Mapping[str, Mapping[str, typing.Any]],
+        repository: str | git.Repo | None = None,
+        *,
+        cache: bool | None = None,
+        checkpoint_interval: int | None = None,
+        rev: str | None = None,
+        traversal: typing.Literal["all", "first-parent", "merges-only"]
+        | None = None,
+        backend: typing.Literal["subprocess", "gitpython", "pygit2"]
+        | None = None,
+        resume: bool = False,
+    ) -> Iterator[tuple[str, VersionCommit]]:
+        """Yield versions of many components walking the history once.
+
+        Each component (e.g. package of a monorepo) has its own rules,
+        the same as arguments of
+        [`from_git`][comver._version.Version.from_git]
+        (e.g. `path_includes`). Paths changed by a commit are computed
+        once and matched against the rules of every component.
+
+        Example usage:
+
+        ```python
+        import comver
+
+        versions = {}
+        for name, output in comver.Version.from_git_components(
+            {
+                "core": {"path_includes": ["packages/core/*"]},
+                "cli": {"path_includes": ["packages/cli/*"]},
+            }
+        ):
+            versions[name] = output.version
+        ```
+
+        Tip:
+            Use `components` of the configuration (see
+            [configuration tutorial](../tutorials/configuration.md))
+            together with `comver calculate --component`.
+
+        Note:
+            With `cache`, versions of each component before its checkpoint
+            are replayed from its history index (yielded before the walk),
+            hence each component yields the same outputs as without it.
+
+        Args:
+            components:
+                Rules of each component keyed by its name.
+            repository:
+                The `git` repository.
+                Default: Searched in the parent directories.
+            cache:
+                Whether to resume calculations from on-disk checkpoints
+                (kept separately for every component).
+                Default: `False`
+            checkpoint_interval:
+                Number of walked commits between consecutive checkpoints.
+                Default: `1000`
+            rev:
+                Commit (or any other revision) to calculate versions for.
+                Default: `HEAD`
+            traversal:
+                Which commits are walked (shared by all components, see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: `"all"`
+            backend:
+                How the repository is read (see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: `COMVER_BACKEND` environment variable
+                OR `"subprocess"`
+            resume:
+                Whether each component starts from its checkpointed state
+                (yielded first) instead of replaying the commits before it
+                (see [`from_git`][comver._version.Version.from_git]).
+                Default: All commits are yielded.
+
+        Yields:
+            Name of the component and its version with respective commit
+            (commits are yielded in order, interleaved between components).
+
+        """
+        repository = _repository(repository)
+        flags = _flags(traversal)
+        reader = _backend.load(repository, backend)
+        head = reader.resolve("HEAD")
+        rev = head if rev is None else reader.resolve(rev)
+
+        states = {
+            name: _Component.load(
+                cls(),
+                rules,
+                repository,
+                cache=bool(cache),
+                checkpoint_interval=checkpoint_interval,
+                traversal=traversal,
             )
-        ]
+            for name, rules in components.items()
+        }
+        total = reader.count(rev, flags)
+        for name, state in states.items():
+            for output in state.resume(
+                repository, reader, rev, total, resume=resume
+            ):
+                yield name, output
+        yield from _walk_components(repository, reader, rev, states, flags)
+
+        # Cache of other revisions would shrink the one of HEAD
+        if rev == head:
+            for state in states.values():
+                state.save()
+
+    @classmethod
+    def from_git_refs(  # noqa: PLR0913
+        cls,
+        refs: Iterable[str],
+        rules: Mapping[str, typing.Any] | None = None,
+        repository: str | git.Repo | None = None,
+        traversal: typing.Literal["all", "first-parent", "merges-only"]
+        | None = None,
+        base: Base | None = None,
+        *,
+        backend: typing.Literal["subprocess", "gitpython", "pygit2"]
+        | None = None,
+    ) -> dict[str, VersionCommit]:
+        """Calculate versions of many refs walking their history once.
+
+        Every unique commit (from the union of histories of all `refs`)
+        is walked and classified (filtered and matched against regexes)
+        exactly once. Refs sharing history share the state
+        of the calculation, which is split at fork points, hence
+        the cost grows with the number of unique commits, not
+        `refs` times history.
+
+        Example usage:
+
+        ```python
+        import comver
+
+        versions = comver.Version.from_git_refs(
+            ["main", "release/1.x", "refs/pull/37/head"],
+            {"path_includes": ["src/*"]},
+        )
+        print(versions["main"].version)
+        ```
+
+        Warning:
+            Commits of concurrent branches are interleaved as in a single
+            `git rev-list` of all `refs`, which may differ from separate
+            [`from_git`][comver._version.Version.from_git] calls
+            for commits with equal (or skewed) commit dates.
+
+        Args:
+            refs:
+                Revisions (e.g. branches, tags or shas) to calculate
+                versions for.
+            rules:
+                Rules (arguments of
+                [`from_git`][comver._version.Version.from_git],
+                e.g. `path_includes`). Default: No rules.
+            repository:
+                The `git` repository.
+                Default: Searched in the parent directories.
+            traversal:
+                Which commits are walked (see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: `"all"`
+            base:
+                History horizon and the version before it (see
+                [`from_git`][comver._version.Version.from_git]),
+                `max_commits` limits the union of histories of all `refs`.
+                Default: The whole history is walked.
+            backend:
+                How the repository is read (see
+                [`from_git`][comver._version.Version.from_git]).
+                Default: `COMVER_BACKEND` environment variable
+                OR `"subprocess"`
 
-        for version, commit in zip(
-            cls.from_messages(
-                messages=(str(commit.message) for commit in commits),
-                message_includes=message_includes,
-                message_excludes=message_excludes,
-                major_regexes=major_regexes,
-                minor_regexes=minor_regexes,
-                patch_regexes=patch_regexes,
-                unrecognized_message=unrecognized_message,
-            ),
-            commits,
-            strict=False,
-        ):
-            yield VersionCommit(version, commit)
+        Returns:
+            Version and its respective (last included) commit of each ref.
+
+        """
+        repository = _repository(repository)
+        refs = list(dict.fromkeys(refs))
+        if not refs:
+            return {}
+        rules = {} if rules is None else rules
+
+        flags = _flags(traversal)
+        horizon = _horizon.resolve(base)
+        reader = _backend.load(repository, backend)
+        tips = [repository.commit(ref).hexsha for ref in refs]
+        masks = _ref_masks(
+            repository, tips, first_parent=bool(flags.get("first_parent"))
+        )
+
+        start = _base(repository, horizon, *tips)
+        groups = [_Group((1 << len(refs)) - 1, start.version, start.commit)]
+        since = None if start.commit is None else start.commit.hexsha
+        limits = flags if horizon is None else {**flags, **horizon.limits}
+        for record in reader.commits(tips, limits, since):
+            commit = record.commit(repository)
+            if not _include_commit(
+                commit,
+                rules.get("path_includes"),
+                rules.get("path_excludes"),
+                rules.get("author_name_includes"),
+                rules.get("author_name_excludes"),
+                rules.get("author_email_includes"),
+                rules.get("author_email_excludes"),
+                paths=_changed(
+                    reader,
+                    record.sha,
+                    rules.get("path_includes"),
+                    rules.get("path_excludes"),
+                ),
+            ):
+                continue
+            commit.message = message = record.message
+            bump = cls.from_message(
+                message,
+                rules.get("message_includes"),
+                rules.get("message_excludes"),
+                rules.get("major_regexes"),
+                rules.get("minor_regexes"),
+                rules.get("patch_regexes"),
+                rules.get("unrecognized_message"),
+                max_message_size=rules.get("max_message_size"),
+                scopes=rules.get("scopes"),
+            )
+            groups = [
+                split
+                for group in groups
+                for split in group.split(masks[record.sha], bump, commit)
+            ]
+
+        return {
+            ref: next(
+                VersionCommit(group.version, group.commit)
+                for group in groups
+                if group.mask >> bit & 1
+            )
+            for bit, ref in enumerate(refs)
+        }
 
     @classmethod
+    @_profile.observable
     def from_messages(  # noqa: PLR0913
         cls,
         messages: Iterable[str],
@@ -380,6 +1329,10 @@ class Version:
         minor_regexes: OptionalStringsOrPatterns = None,
         patch_regexes: OptionalStringsOrPatterns = None,
         unrecognized_message: typing.Literal["ignore", "error"] | None = None,
+        *,
+        max_message_size: int | None = None,
+        scopes: Scopes | None = None,
+        stats: Stats | None = None,  # noqa: ARG003
     ) -> Iterator[Version]:
         """Yield versions from an iterable of messages.
 
@@ -394,6 +1347,10 @@ class Version:
             the `*_include` regexes are checked first, then the `*_exclude`
             regexes might disinclude the `*_include` match
 
+        Tip:
+            Statistics of the run are collected into the `stats`
+            argument (if provided, see [`comver.stats`][comver.stats]).
+
         Args:
             messages:
                 Iterable containing messages from which versions
@@ -419,6 +1376,19 @@ class Version:
                 either "exclude" or "error".
                 Default: "ignore"
 
+            max_message_size:
+                Maximal number of characters of the message matched
+                (see [`from_message`][comver._version.Version.from_message]).
+                Default: Whole messages are matched.
+            scopes:
+                Sections of the message scanned by the message rules
+                (see [`from_message`][comver._version.Version.from_message]).
+                Default: Whole messages are scanned.
+            stats:
+                Statistics collected while the iterator runs
+                (see [`comver.stats`][comver.stats]).
+                Default: Nothing is collected.
+
         Yields:
             Version (one for each message).
         """
@@ -434,6 +1404,8 @@ class Version:
                 patch_regexes,
                 unrecognized_message,
                 version=version,
+                max_message_size=max_message_size,
+                scopes=scopes,
             )
             yield version
 
@@ -448,6 +1420,9 @@ class Version:
         patch_regexes: OptionalStringsOrPatterns = None,
         unrecognized_message: typing.Literal["ignore", "error"] | None = None,
         version: Version | None = None,
+        *,
+        max_message_size: int | None = None,
+        scopes: Scopes | None = None,
     ) -> Version:
         """Bump the version based on a message.
 
@@ -483,29 +1458,54 @@ class Version:
             version:
                 Starting version from which a new version is calculated
                 (version from which to bump). Default: `0.0.0` version.
+            max_message_size:
+                Maximal number of characters of the message matched,
+                longer messages are truncated (with
+                [`MessageTruncatedWarning`][comver.error.MessageTruncatedWarning])
+                guarding against huge (e.g. generated) messages.
+                Default: Whole message is matched.
+            scopes:
+                Section of the message scanned by each message rule
+                (e.g. `{"major_regexes": "trailers"}`), one of `"header"`
+                (first line), `"body"`, `"trailers"` (last paragraph
+                of `Token: value` lines, e.g. `BREAKING CHANGE: ...`)
+                or `"full"`. The message is split only once and only
+                into the sections which are scanned.
+                Default: Every rule scans the whole message.
 
         Raises:
             MessageUnrecognizedError: If the message is not recognized
                 by any of the regexes and `unrecognized_message`
                 is set to "error".
+            ScopeUnknownError: If any of the `scopes` is not recognized
+                (or is specified for other than the message rule).
 
         Returns:
             Version corresponding to the message (possibly starting from
             initial version provided).
         """
         version = cls() if version is None else version
-
-        if not _regex.match.item(
-            what=message,
-            include=_regex.process(message_includes),
-            exclude=_regex.process(message_excludes),
-        ):
+        message, sections = _split(message, max_message_size, scopes)
+        included = _included(
+            message, sections, scopes, message_includes, message_excludes
+        )
+        if _profile.active():
+            _count_message(
+                included=included,
+                filtered=message_includes is not None
+                or message_excludes is not None,
+            )
+        if not included:
             return version
 
         for semantic_component, regex in _regex.semantic.components(
             major_regexes, minor_regexes, patch_regexes
         ):
-            if regex is not None and regex.match(message):
+            if regex is not None and regex.match(
+                _section(
+                    message, sections, scopes, f"{semantic_component}_regexes"
+                )
+            ):
                 return getattr(version, f"bump_{semantic_component}")()
 
         if unrecognized_message == "error":
@@ -678,6 +1678,38 @@ class Version:
         return other
 
 
+@dataclasses.dataclass(frozen=True)
+class VersionRecord:
+    """POD containing `Version`, sha and commit time of a commit.
+
+    This container is returned from history store related functionalities
+    of `Version` (e.g. [`query`][comver._version.Version.query]).
+    """
+
+    version: Version
+    sha: str
+    time: dt.datetime
+
+    @classmethod
+    def from_row(cls, row: _store.Row) -> VersionRecord:
+        """Create record from a row of the history store.
+
+        Args:
+            row:
+                Row of the SQLite history store.
+
+        Returns:
+            Record (commit time in UTC).
+
+        """
+        _, sha, time, major, minor, patch = row
+        return cls(
+            Version(major, minor, patch),
+            sha,
+            dt.datetime.fromtimestamp(time, tz=dt.UTC),
+        )
+
+
 @dataclasses.dataclass(frozen=True)
 class VersionCommit:
     """POD containing `Version` and its respective `git.Commit`.
@@ -690,6 +1722,575 @@ class VersionCommit:
     commit: git.Commit | None = None
 
 
+class _Component:
+    """State of a single component walked by `Version.from_git_components`."""
+
+    def __init__(
+        self,
+        version: Version,
+        rules: Mapping[str, typing.Any],
+        checkpoints: _cache.Cache | None,
+    ) -> None:
+        """Initialize the state.
+
+        Args:
+            version:
+                Initial version of the component.
+            rules:
+                Rules of the component (arguments of `Version.from_git`).
+            checkpoints:
+                Cache of the component (if enabled).
+
+        """
+        self.version: Version = version
+        self.rules: Mapping[str, typing.Any] = rules
+        self.checkpoints: _cache.Cache | None = checkpoints
+        self.sha: str | None = None
+        self.remaining: int = 0
+
+    @classmethod
+    def load(  # noqa: PLR0913
+        cls,
+        version: Version,
+        rules: Mapping[str, typing.Any],
+        repository: git.Repo,
+        *,
+        cache: bool,
+        checkpoint_interval: int | None,
+        traversal: typing.Literal["all", "first-parent", "merges-only"] | None,
+    ) -> _Component:
+        """Create the state (loading cache of the component if enabled).
+
+        Args:
+            version:
+                Initial version of the component.
+            rules:
+                Rules of the component (arguments of `Version.from_git`).
+            repository:
+                The `git` repository.
+            cache:
+                Whether to resume from on-disk checkpoints.
+            checkpoint_interval:
+                Number of walked commits between consecutive checkpoints.
+            traversal:
+                Which commits are walked.
+
+        Returns:
+            State of the component.
+
+        """
+        return cls(
+            version,
+            rules,
+            _cache.Cache.load(
+                repository,
+                _cache.key(
+                    traversal,
+                    rules.get("max_message_size"),
+                    rules.get("scopes"),
+                    **{rule: rules.get(rule) for rule in _cache.RULES},
+                ),
+                checkpoint_interval,
+                flags=_flags(traversal),
+            )
+            if cache
+            else None,
+        )
+
+    def resume(
+        self,
+        repository: git.Repo,
+        reader: _backend.Backend,
+        rev: str,
+        total: int,
+        *,
+        resume: bool,
+    ) -> Iterator[VersionCommit]:
+        """Resume from the checkpoint (if any) of the component.
+
+        Note:
+            The state is resumed before the first output is yielded,
+            the outputs have to be consumed before the walk.
+
+        Args:
+            repository:
+                The `git` repository.
+            reader:
+                Backend walking the history.
+            rev:
+                Full sha of the commit versions are calculated for.
+            total:
+                Number of commits reachable from `rev`.
+            resume:
+                Whether only the checkpointed state is yielded (instead
+                of the commits yielded before the checkpoint).
+
+        Yields:
+            Version and commit of the checkpoint (if `resume`)
+            or versions of commits before the checkpoint (replayed
+            from the history index).
+
+        """
+        if (
+            self.checkpoints is None
+            or (checkpoint := self.checkpoints.resume(repository, reader, rev))
+            is None
+        ):
+            self.remaining = total
+            return
+
+        self.sha = checkpoint.sha
+        self.remaining = reader.count(
+            rev, self.checkpoints.flags, checkpoint.sha
+        )
+        self.version = type(self.version)(*checkpoint.version)
+        if resume:
+            yield VersionCommit(
+                self.version,
+                None
+                if checkpoint.commit is None
+                else repository.commit(checkpoint.commit),
+            )
+            return
+
+        with _index.Index(self.checkpoints.index) as index:
+            for sha, *triple in index.records(checkpoint.yielded):
+                yield VersionCommit(
+                    type(self.version)(*triple), git.Commit(repository, sha)
+                )
+
+    def update(
+        self, commit: git.Commit, paths: Sequence[str | None] | None
+    ) -> VersionCommit | None:
+        """Calculate version of the component after the commit.
+
+        Args:
+            commit:
+                Walked commit.
+            paths:
+                Paths changed by the commit (if computed).
+
+        Returns:
+            Version and the commit (`None` if the commit was filtered out).
+
+        """
+        included = _include_commit(
+            commit,
+            self.rules.get("path_includes"),
+            self.rules.get("path_excludes"),
+            self.rules.get("author_name_includes"),
+            self.rules.get("author_name_excludes"),
+            self.rules.get("author_email_includes"),
+            self.rules.get("author_email_excludes"),
+            paths=paths,
+        )
+        if included:
+            self.version = self.version.from_message(
+                str(commit.message),
+                self.rules.get("message_includes"),
+                self.rules.get("message_excludes"),
+                self.rules.get("major_regexes"),
+                self.rules.get("minor_regexes"),
+                self.rules.get("patch_regexes"),
+                self.rules.get("unrecognized_message"),
+                version=self.version,
+                max_message_size=self.rules.get("max_message_size"),
+                scopes=self.rules.get("scopes"),
+            )
+        if self.checkpoints is not None:
+            self.checkpoints.update(commit, self.version, included=included)
+        return VersionCommit(self.version, commit) if included else None
+
+    def save(self) -> None:
+        """Persist checkpoints of the component (if enabled)."""
+        if self.checkpoints is not None:
+            self.checkpoints.save()
+
+
+@dataclasses.dataclass(frozen=True)
+class _Group:
+    """Refs sharing the state of `Version.from_git_refs` calculation.
+
+    Attributes:
+        mask:
+            Bitmask of refs in the group.
+        version:
+            Version of refs in the group.
+        commit:
+            Last included commit of refs in the group.
+
+    """
+
+    mask: int
+    version: Version
+    commit: git.Commit | None
+
+    def split(
+        self, mask: int, bump: Version, commit: git.Commit
+    ) -> tuple[_Group, ...]:
+        """Apply the commit to refs of the group reaching it.
+
+        Args:
+            mask:
+                Bitmask of refs the commit is reachable from.
+            bump:
+                Version of the commit calculated from `0.0.0`
+                (e.g. `0.1.0` for a minor bump).
+            commit:
+                The commit.
+
+        Returns:
+            Groups of refs (split in two if only some refs reach the commit).
+
+        """
+        reached = self.mask & mask
+        if not reached:
+            return (self,)
+        updated = _Group(reached, _bumped(self.version, bump), commit)
+        if reached == self.mask:
+            return (updated,)
+        return _Group(self.mask & ~mask, self.version, self.commit), updated
+
+
+def _bumped(version: Version, bump: Version) -> Version:
+    """Bump the version as the `bump` was applied to `0.0.0`.
+
+    Args:
+        version:
+            Version to bump.
+        bump:
+            Result of a single bump from `0.0.0` (either `1.0.0`,
+            `0.1.0`, `0.0.1` or `0.0.0` for no bump).
+
+    Returns:
+        Bumped version.
+
+    """
+    if bump.major:
+        return version.bump_major()
+    if bump.minor:
+        return version.bump_minor()
+    if bump.patch:
+        return version.bump_patch()
+    return version
+
+
+def _ref_masks(
+    repository: git.Repo, tips: Sequence[str], *, first_parent: bool = False
+) -> dict[str, int]:
+    """Find refs (as a bitmask) every commit is reachable from.
+
+    Args:
+        repository:
+            The `git` repository.
+        tips:
+            Full shas of refs (bit `i` corresponds to `tips[i]`).
+        first_parent:
+            Whether only first parents are followed.
+
+    Returns:
+        Bitmask of refs keyed by commit sha.
+
+    """
+    masks: dict[str, int] = {}
+    for bit, tip in enumerate(tips):
+        masks[tip] = masks.get(tip, 0) | 1 << bit
+
+    # Children are listed before their parents
+    for line in repository.git.rev_list(
+        "--topo-order", "--parents", *tips, first_parent=first_parent
+    ).splitlines():
+        sha, *parents = line.split()
+        for parent in parents[:1] if first_parent else parents:
+            masks[parent] = masks.get(parent, 0) | masks[sha]
+    return masks
+
+
+def _walk_components(
+    repository: git.Repo,
+    reader: _backend.Backend,
+    rev: str,
+    states: Mapping[str, _Component],
+    flags: Mapping[str, bool],
+) -> Iterator[tuple[str, VersionCommit]]:
+    """Walk the history once, updating (resumed) states of all components.
+
+    The walk starts from the oldest checkpoint (of all components),
+    and every component skips commits walked before its own checkpoint
+    (these are the oldest ones, as checkpoints are used only if commits
+    after them are the newest commits of `rev`).
+
+    Args:
+        repository:
+            The `git` repository.
+        reader:
+            Backend walking the history.
+        rev:
+            Full sha of the commit versions are calculated for.
+        states:
+            States of components keyed by their names.
+        flags:
+            Flags of `git rev-list` (traversal mode).
+
+    Yields:
+        Name of the component and its version with respective commit.
+
+    """
+    longest = max(states.values(), key=lambda s: s.remaining, default=None)
+    if longest is None:
+        return
+
+    diff = any(
+        state.rules.get("path_includes") or state.rules.get("path_excludes")
+        for state in states.values()
+    )
+    for index, record in enumerate(reader.commits(rev, flags, longest.sha)):
+        commit = record.commit(repository, record.message)
+        paths = reader.changed(record.sha) if diff else None
+        for name, state in states.items():
+            if state.remaining < longest.remaining - index:
+                continue
+            if (output := state.update(commit, paths)) is not None:
+                yield name, output
+
+
+def _start(  # noqa: PLR0913
+    repository: git.Repo,
+    reader: _backend.Backend,
+    rev: str,
+    checkpoints: _cache.Cache | None,
+    horizon: _horizon.Horizon | None,
+    *,
+    resume: bool,
+) -> Generator[VersionCommit, None, tuple[Version, str | None]]:
+    """Yield the history before the walk (checkpoint or history horizon).
+
+    Args:
+        repository:
+            The `git` repository.
+        reader:
+            Backend walking the history.
+        rev:
+            Full sha of the commit the version is calculated for.
+        checkpoints:
+            Checkpoints of the configuration (`None` if not cached).
+        horizon:
+            History horizon (`None` if the whole history is walked).
+        resume:
+            Whether only the checkpointed state is yielded (instead
+            of the commits yielded before the checkpoint).
+
+    Yields:
+        Base version (if `horizon` is provided) and versions of commits
+        before the checkpoint (replayed from the history index).
+
+    Returns:
+        Version the walk starts from and full sha of the commit
+        whose ancestors are not walked.
+
+    """
+    start = _base(repository, horizon, rev)
+    checkpoint = (
+        None
+        if checkpoints is None
+        else checkpoints.resume(repository, reader, rev)
+    )
+    if checkpoint is None or checkpoints is None:
+        if horizon is not None:
+            yield start
+        return (
+            start.version,
+            None if start.commit is None else start.commit.hexsha,
+        )
+
+    version = Version(*checkpoint.version)
+    if resume:
+        yield VersionCommit(
+            version,
+            start.commit
+            if checkpoint.commit is None
+            else repository.commit(checkpoint.commit),
+        )
+        return version, checkpoint.sha
+
+    if horizon is not None:
+        yield start
+    with _index.Index(checkpoints.index) as index:
+        for sha, *triple in index.records(checkpoint.yielded):
+            yield VersionCommit(Version(*triple), git.Commit(repository, sha))
+    return version, checkpoint.sha
+
+
+def _base(
+    repository: git.Repo, horizon: _horizon.Horizon | None, *revs: str
+) -> VersionCommit:
+    """Get the version (and commit) the walk starts from.
+
+    Args:
+        repository:
+            The `git` repository.
+        horizon:
+            History horizon (see [`_horizon`][comver._horizon]).
+            Default: The whole history is walked from `0.0.0`.
+        *revs:
+            Revisions the versions are calculated for.
+
+    Raises:
+        HorizonUnreachableError:
+            If any of the `revs` does not descend from the `sha` commit
+            (the base version does not apply to its history).
+
+    Returns:
+        Version of the history before the horizon and its `sha` commit.
+
+    """
+    if horizon is None:
+        return VersionCommit()
+    commit = None if horizon.sha is None else repository.commit(horizon.sha)
+    for rev in revs:
+        if commit is not None and not _cache.is_ancestor(
+            repository, commit.hexsha, rev
+        ):
+            raise error.HorizonUnreachableError(commit.hexsha, rev)
+    return VersionCommit(Version.from_string(horizon.version), commit)
+
+
+def _flags(traversal: str | None) -> dict[str, bool]:
+    """Get `git rev-list` flags of the traversal mode.
+
+    Args:
+        traversal:
+            Either `all`, `first-parent` or `merges-only`.
+            Default: `all`
+
+    Raises:
+        TraversalUnknownError:
+            If `traversal` is not one of the above.
+
+    Returns:
+        Keyword arguments of `git.Repo.iter_commits`.
+
+    """
+    if traversal is None or traversal == "all":
+        return {}
+    if traversal == "first-parent":
+        return {"first_parent": True}
+    if traversal == "merges-only":
+        return {"merges": True}
+    raise error.TraversalUnknownError(traversal)
+
+
+def _repository(repository: str | git.Repo | None) -> git.Repo:
+    """Get the `git` repository.
+
+    Args:
+        repository:
+            Path to the repository or the repository itself.
+            Default: Searched in the parent directories.
+
+    Returns:
+        The `git` repository.
+
+    """
+    if isinstance(repository, str):
+        return git.Repo(repository)
+    if repository is None:
+        return git.Repo(search_parent_directories=True)
+    return repository
+
+
+def _history_index(repository: str | git.Repo | None = None) -> _index.Index:
+    """Open up to date history index of the configured rules.
+
+    Args:
+        repository:
+            The `git` repository.
+            Default: Searched in the parent directories.
+
+    Returns:
+        Memory-mapped index (should be closed after usage).
+
+    """
+    return _index.Index(_refreshed(repository).index)
+
+
+def _history_store(repository: str | git.Repo | None = None) -> _store.Store:
+    """Open up to date SQLite history store of the configured rules.
+
+    Args:
+        repository:
+            The `git` repository.
+            Default: Searched in the parent directories.
+
+    Returns:
+        History store (should be closed after usage).
+
+    """
+    return _store.Store(_refreshed(repository, sqlite=True).store)
+
+
+def _refreshed(
+    repository: str | git.Repo | None = None, *, sqlite: bool = False
+) -> _cache.Cache:
+    """Bring the cache of the configured rules up to date.
+
+    Args:
+        repository:
+            The `git` repository.
+            Default: Searched in the parent directories.
+        sqlite:
+            Whether the SQLite history store should be updated as well.
+
+    Raises:
+        HorizonUncachedError:
+            If the configured `base` has `max_commits` (never cached).
+
+    Returns:
+        Up to date cache.
+
+    """
+    repository = _repository(repository)
+    config = collections.defaultdict(lambda: None, _config.load())
+    horizon = _horizon.resolve(config["base"])
+    if horizon is not None and not _horizon.cached(horizon):
+        raise error.HorizonUncachedError(horizon.limits["max_count"])
+
+    for _ in Version.from_git_configured(
+        repository=repository, cache=True, sqlite=sqlite, resume=True
+    ):
+        pass
+
+    return _cache.Cache.load(
+        repository,
+        _cache.key(
+            config["traversal"],
+            config["max_message_size"],
+            config["scopes"],
+            config["base"],
+            **{name: config[name] for name in _cache.RULES},
+        ),
+        flags=_flags(config["traversal"]),
+    )
+
+
+def _triple(version: Version | str | None) -> tuple[int, int, int] | None:
+    """Convert the version to `major`, `minor` and `patch` tuple.
+
+    Args:
+        version:
+            Version or its string representation (e.g. `1.2.3`).
+
+    Returns:
+        `major`, `minor` and `patch` (or `None` if no version was given).
+
+    """
+    if version is None:
+        return None
+    if isinstance(version, str):
+        version = Version.from_string(version)
+    return version.major, version.minor, version.patch
+
+
 def _include_commit(  # noqa: PLR0913
     commit: git.Commit,
     path_includes: OptionalStringsOrPatterns = None,
@@ -698,6 +2299,8 @@ def _include_commit(  # noqa: PLR0913
     author_name_excludes: OptionalStringsOrPatterns = None,
     author_email_includes: OptionalStringsOrPatterns = None,
     author_email_excludes: OptionalStringsOrPatterns = None,
+    *,
+    paths: Sequence[str | None] | None = None,
 ) -> bool:
     """Check whether to include a given commit.
 
@@ -726,34 +2329,221 @@ def _include_commit(  # noqa: PLR0913
             Commit author email regexes against
             which the commit is excluded.
             Default: No emails are excluded.
+        paths:
+            Paths changed by the commit (if already computed).
+            Default: Computed only if path regexes are provided.
+
+    Returns:
+        `True` if the commit should be included.
 
     """
-    return (
-        _maybe_match(
-            commit.author.name, author_name_includes, author_name_excludes
-        )
-        and _maybe_match(
-            commit.author.email, author_email_includes, author_email_excludes
+    with _profile.phase("author"):
+        for attribute, includes, excludes in (
+            ("name", author_name_includes, author_name_excludes),
+            ("email", author_email_includes, author_email_excludes),
+        ):
+            if not _maybe_match(commit.author, attribute, includes, excludes):
+                _profile.count(f"filtered.author_{attribute}")
+                return False
+
+    with _profile.phase("path"):
+        included = _regex.match.path(
+            commit,
+            _regex.process(path_includes),
+            _regex.process(path_excludes),
+            paths,
         )
-        and _regex.match.path(
-            commit, _regex.process(path_includes), _regex.process(path_excludes)
+    if not included:
+        _profile.count("filtered.path")
+    return included
+
+
+def _split(
+    message: str,
+    max_message_size: int | None,
+    scopes: Scopes | None,
+) -> tuple[str, _regex.scope.Sections | None]:
+    """Truncate the message and split it into sections (only if needed).
+
+    Args:
+        message:
+            The message.
+        max_message_size:
+            Maximal number of characters (`None` disables truncation).
+        scopes:
+            Sections scanned by the message rules.
+
+    Raises:
+        ScopeUnknownError:
+            If any of the `scopes` is not recognized.
+
+    Returns:
+        The (possibly truncated) message and its sections
+        (`None` if no rule is scoped, the whole message is scanned).
+
+    """
+    if max_message_size is not None:
+        message = _truncate(message, max_message_size)
+    if not scopes:
+        return message, None
+    _regex.scope.check(scopes)
+    return message, _regex.scope.Sections(message)
+
+
+def _included(
+    message: str,
+    sections: _regex.scope.Sections | None,
+    scopes: Scopes | None,
+    message_includes: OptionalStringsOrPatterns,
+    message_excludes: OptionalStringsOrPatterns,
+) -> bool:
+    """Check whether the message is included by the message rules.
+
+    Args:
+        message:
+            The (possibly truncated) message.
+        sections:
+            The message split into sections (`None` if no `scopes`).
+        scopes:
+            Sections scanned by the message rules.
+        message_includes:
+            Commit message regexes against which the commit is included.
+        message_excludes:
+            Commit message regexes against which the commit is excluded.
+
+    Returns:
+        `True` if the message bumps the version.
+
+    """
+    if sections is None:
+        return _regex.match.item(
+            what=message,
+            include=_regex.process(message_includes),
+            exclude=_regex.process(message_excludes),
         )
+    return _regex.match.item(
+        what=_section(message, sections, scopes, "message_includes"),
+        include=_regex.process(message_includes),
+        exclude=None,
+    ) and _regex.match.item(
+        what=_section(message, sections, scopes, "message_excludes"),
+        include=None,
+        exclude=_regex.process(message_excludes),
+    )
+
+
+def _count_message(*, included: bool, filtered: bool) -> None:
+    """Count the regexes matched against the message (if profiling).
+
+    Args:
+        included:
+            Whether the message was included by the message rules.
+        filtered:
+            Whether any message rules were provided.
+
+    """
+    if filtered:
+        _profile.count("regex.message")
+    _profile.count("regex.semantic" if included else "filtered.message")
+
+
+def _section(
+    message: str,
+    sections: _regex.scope.Sections | None,
+    scopes: Scopes | None,
+    rule: str,
+) -> str:
+    """Get the part of the message scanned by the rule.
+
+    Args:
+        message:
+            The (possibly truncated) message.
+        sections:
+            The message split into sections (`None` if no `scopes`).
+        scopes:
+            Sections scanned by the message rules.
+        rule:
+            The message rule (e.g. `major_regexes`).
+
+    Returns:
+        The section (whole message if the rule is not scoped).
+
+    """
+    if sections is None or scopes is None:
+        return message
+    return sections[scopes.get(rule)]
+
+
+def _truncate(message: str, max_message_size: int | None) -> str:
+    """Truncate the message exceeding the size (warning about it).
+
+    Args:
+        message:
+            The message.
+        max_message_size:
+            Maximal number of characters (`None` disables truncation).
+
+    Returns:
+        The (possibly truncated) message.
+
+    """
+    if max_message_size is None or len(message) <= max_message_size:
+        return message
+    warnings.warn(
+        error.MessageTruncatedWarning(message, max_message_size),
+        stacklevel=3,
     )
+    return message[:max_message_size]
+
+
+def _changed(
+    reader: _backend.Backend,
+    sha: str,
+    path_includes: OptionalStringsOrPatterns,
+    path_excludes: OptionalStringsOrPatterns,
+) -> list[str | None] | None:
+    """Get paths changed by the commit if any path regexes are provided.
+
+    Args:
+        reader:
+            Backend reading the repository.
+        sha:
+            Hash of the commit.
+        path_includes:
+            Path regexes against which the commit is included.
+        path_excludes:
+            Path regexes against which the commit is excluded.
+
+    Returns:
+        Changed paths or `None` (no regexes, paths are not needed).
+
+    """
+    if not (path_includes or path_excludes):
+        return None
+    with _profile.phase("diff"):
+        return reader.changed(sha)
 
 
 def _maybe_match(
-    variable: str | None,
+    author: git.Actor,
+    attribute: typing.Literal["name", "email"],
     includes: OptionalStringsOrPatterns,
     excludes: OptionalStringsOrPatterns,
 ) -> bool:
-    """Optionally match variable against includes and excludes.
+    """Optionally match author's attribute against includes and excludes.
 
     Important:
         `None` is considered as matching.
 
+    Tip:
+        The attribute is read (e.g. decoded by the
+        [backend][comver._backend]) only if any regexes are provided.
+
     Args:
-        variable:
-            Variable to be matched
+        author:
+            Author of the commit.
+        attribute:
+            Attribute of the author to be matched.
         includes:
             Optional list of includes
         excludes:
@@ -763,6 +2553,11 @@ def _maybe_match(
         `True` if the variable matches the constraints.
 
     """
+    if includes is None and excludes is None:
+        return True
+
+    _profile.count(f"regex.author_{attribute}")
+    variable: str | None = getattr(author, attribute)
     # Escape hatch if commit's author name or email is missing
     # This situation is highly unlikely to happen
     if variable is None:  # pragma: no cover
@@ -7,6 +7,11 @@
 
 from __future__ import annotations
 
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 class ComverError(Exception):
     """Base class for all exceptions raised by `comver`."""
@@ -80,3 +85,316 @@ class VersionNotNumericError(ComverError):
         super().__init__(
             f"One of the MAJOR, MINOR, PATCH is not an integer. Expected <INT>.<INT>.<INT>, got: {version}"
         )
+
+
+class ComponentNotFoundError(ComverError):
+    """Raised when the requested component is not configured.
+
+    Components are declared as `[tool.comver.components.<NAME>]` tables
+    (or `[components.<NAME>]` in `.comver.toml`).
+
+    """
+
+    def __init__(self, component: str) -> None:
+        """Initialize the error.
+
+        Args:
+            component:
+                Name of the component which was not found.
+
+        """
+        self.component: str = component
+
+        super().__init__(
+            f"Component '{component}' is not declared in the configuration."
+        )
+
+
+class TraversalUnknownError(ComverError):
+    """Raised when the traversal mode is not recognized.
+
+    Available modes are `all`, `first-parent` and `merges-only`.
+
+    """
+
+    def __init__(self, traversal: str) -> None:
+        """Initialize the error.
+
+        Args:
+            traversal:
+                Traversal mode which was not recognized.
+
+        """
+        self.traversal: str = traversal
+
+        super().__init__(
+            f"Traversal should be one of 'all', 'first-parent' or 'merges-only', got: {traversal}"
+        )
+
+
+class BackendUnavailableError(ComverError):
+    """Raised when the backend is unknown or its dependencies are missing.
+
+    Available backends are `subprocess`, `gitpython` and `pygit2`
+    (the last one requires `pygit2` to be installed).
+
+    """
+
+    def __init__(self, backend: str) -> None:
+        """Initialize the error.
+
+        Args:
+            backend:
+                Backend which is not available.
+
+        """
+        self.backend: str = backend
+
+        super().__init__(
+            f"Backend should be one of 'subprocess', 'gitpython' or 'pygit2' (installed), got: {backend}"
+        )
+
+
+class RegexEngineUnavailableError(ComverError):
+    """Raised when the regex engine is unknown or not installed.
+
+    Available engines are `re` and `re2` (the latter requires
+    `google-re2` to be installed).
+
+    """
+
+    def __init__(self, engine: str) -> None:
+        """Initialize the error.
+
+        Args:
+            engine:
+                Engine which is not available.
+
+        """
+        self.engine: str = engine
+
+        super().__init__(
+            f"Regex engine should be one of 're' or 're2' (installed), got: {engine}"
+        )
+
+
+class ScopeUnknownError(ComverError):
+    """Raised when the scope of the message rule is not recognized.
+
+    Available scopes are `header`, `body`, `trailers` and `full`,
+    only message rules (`message_includes`, `message_excludes`
+    and `*_regexes`) can be scoped.
+
+    """
+
+    def __init__(self, rule: str, scope: str) -> None:
+        """Initialize the error.
+
+        Args:
+            rule:
+                Rule the scope was specified for.
+            scope:
+                Scope of the rule.
+
+        """
+        self.rule: str = rule
+        self.scope: str = scope
+
+        super().__init__(
+            f"Scope of the message rule '{rule}' should be one of "
+            f"'header', 'body', 'trailers' or 'full', got: {scope}"
+        )
+
+
+class HorizonInvalidError(ComverError):
+    """Raised when the history horizon (`base`) is malformed.
+
+    The `base` requires the `version` (string) and accepts `sha` (string),
+    `since` (ISO 8601 date) and `max_commits` (positive integer) keys.
+
+    """
+
+    def __init__(self, key: str, value: object) -> None:
+        """Initialize the error.
+
+        Args:
+            key:
+                Key of the `base` which is invalid (missing or unknown).
+            value:
+                Value of the key (`None` if missing).
+
+        """
+        self.key: str = key
+        self.value: object = value
+
+        super().__init__(
+            f"Key '{key}' of the history horizon (base) is invalid, "
+            "expected 'version' (string) and optional 'sha' (string), "
+            "'since' (ISO 8601 date) or 'max_commits' (positive integer), "
+            f"got: {value!r}"
+        )
+
+
+class HorizonComponentsError(ComverError):
+    """Raised when the history horizon (`base`) is used with components.
+
+    Components are always calculated from the whole history,
+    remove the `base` table to calculate them.
+
+    """
+
+    def __init__(self, components: list[str]) -> None:
+        """Initialize the error.
+
+        Args:
+            components:
+                Names of the components which were requested.
+
+        """
+        self.components: list[str] = components
+
+        super().__init__(
+            "History horizon (base) cannot be used together with components, "
+            f"got components: {', '.join(components)}"
+        )
+
+
+class HorizonUnreachableError(ComverError):
+    """Raised when the revision does not descend from the horizon `sha`.
+
+    Versions of such revisions (e.g. older than the `sha` commit
+    or on unrelated branches) do not depend on the `base` version,
+    remove the `base` table (or its `sha`) to calculate them.
+
+    """
+
+    def __init__(self, sha: str, rev: str) -> None:
+        """Initialize the error.
+
+        Args:
+            sha:
+                Commit of the history horizon (base).
+            rev:
+                Revision the version is calculated for.
+
+        """
+        self.sha: str = sha
+        self.rev: str = rev
+
+        super().__init__(
+            f"Commit '{sha}' of the history horizon (base) "
+            f"is not an ancestor of '{rev}'."
+        )
+
+
+class HorizonUncachedError(ComverError):
+    """Raised when the cache is required with the `max_commits` horizon.
+
+    The `max_commits` horizon moves with every new commit, hence it is
+    never cached and versions of commits cannot be looked up (e.g. by
+    `Version.at` or `comver query`), use `sha` or `since` instead.
+
+    """
+
+    def __init__(self, max_commits: int) -> None:
+        """Initialize the error.
+
+        Args:
+            max_commits:
+                The `max_commits` of the history horizon (base).
+
+        """
+        self.max_commits: int = max_commits
+
+        super().__init__(
+            "History horizon (base) with 'max_commits' is never cached, "
+            "versions of commits cannot be looked up, "
+            f"got: max_commits = {max_commits}"
+        )
+
+
+class ComverWarning(UserWarning):
+    """Base class for all warnings issued by `comver`."""
+
+
+class RegexUnsafeWarning(ComverWarning):
+    """Issued when the regex may take super-linear time to match.
+
+    Such patterns (e.g. `(a+)+$`) may hang the calculation on
+    adversarial (e.g. bot generated) commit messages.
+
+    """
+
+    def __init__(self, option: str, pattern: str, reason: str) -> None:
+        """Initialize the warning.
+
+        Args:
+            option:
+                Option declaring the regex (e.g. `major_regexes`).
+            pattern:
+                The unsafe regex.
+            reason:
+                Why the regex is considered unsafe.
+
+        """
+        self.option: str = option
+        self.pattern: str = pattern
+        self.reason: str = reason
+
+        super().__init__(
+            f"Regex '{pattern}' of '{option}' may take super-linear time "
+            f"({reason}), consider rewriting it or using the 're2' engine."
+        )
+
+
+class PluginOptionsWarning(ComverWarning):
+    """Issued when the plugin options change the configuration checksum.
+
+    Options provided to the plugin (e.g. under `[tool.hatch.version]`)
+    are not read by the CLI, hence `comver verify` (and
+    `comver calculate --checksum`) disagree with the built version.
+
+    """
+
+    def __init__(self, options: Iterable[str]) -> None:
+        """Initialize the warning.
+
+        Args:
+            options:
+                Options whose values differ from the `comver` configuration.
+
+        """
+        self.options: list[str] = sorted(options)
+
+        super().__init__(
+            f"Plugin options {self.options} differ from the comver "
+            "configuration (not read by the CLI), move them to "
+            "'[tool.comver]' so 'comver verify' agrees with the built version."
+        )
+
+
+class MessageTruncatedWarning(ComverWarning):
+    """Issued when the message exceeds `max_message_size`.
+
+    Only the first `max_message_size` characters are matched.
+
+    """
+
+    def __init__(self, message: str, max_message_size: int) -> None:
+        """Initialize the warning.
+
+        Args:
+            message:
+                The message which was truncated.
+            max_message_size:
+                Number of characters kept.
+
+        """
+        self.header: str = message.partition("\n")[0]
+        self.size: int = len(message)
+        self.max_message_size: int = max_message_size
+
+        super().__init__(
+            f"Message '{self.header}' ({self.size} characters) truncated "
+            f"to {max_message_size} characters before matching."
+        )
@@ -14,6 +14,11 @@ __Currently supported third party tools:__
 - [`hatch`](https://hatch.pypa.io/1.9/plugins/version-source/reference/)
     package manager.
 
+Tip:
+    Builds without the git history (e.g. wheels built from the source
+    distribution) use the version stamped by `comver stamp`
+    (see [`comver._stamp`][comver._stamp]).
+
 Warning:
     Check out guidelines and tutorials for information about CLI/plugin
     usage and suggested configuration. This section should be of interest
@@ -23,13 +28,19 @@ Warning:
 
 from __future__ import annotations
 
+import json
+import pathlib
 import typing
+import warnings
 
 from importlib.util import find_spec
 
+from comver import _config, _stamp, error
 from comver._version import Version, VersionCommit
 
 if typing.TYPE_CHECKING:
+    from collections.abc import Mapping
+
     import git
 
     from comver.type_definitions import OptionalStringsOrPatterns
@@ -127,25 +138,124 @@ def pdm(  # noqa: PLR0913
         Calculated version as string (compatible with `pdm` interface).
 
     """
+    return _version(
+        repository,
+        {
+            "message_includes": message_includes,
+            "message_excludes": message_excludes,
+            "path_includes": path_includes,
+            "path_excludes": path_excludes,
+            "author_name_includes": author_name_includes,
+            "author_name_excludes": author_name_excludes,
+            "author_email_includes": author_email_includes,
+            "author_email_excludes": author_email_excludes,
+            "major_regexes": major_regexes,
+            "minor_regexes": minor_regexes,
+            "patch_regexes": patch_regexes,
+            "unrecognized_message": unrecognized_message,
+        },
+    )
+
+
+def _version(
+    repository: str | git.Repo | None, options: Mapping[str, typing.Any]
+) -> str:
+    """Calculate the version as the CLI does (or get the stamped one).
+
+    Note:
+        Resolved options and calculated versions are kept for the lifetime
+        of the process (e.g. `hatch` asking for the version many times
+        during a single build), the latter as long as `HEAD` does not move.
+
+    Args:
+        repository:
+            The `git` repository.
+            Default: Searched in the parent directories.
+        options:
+            Options provided to the plugin (taking precedence over
+            the configuration, as in `from_git_configured`).
+
+    Returns:
+        The version (see [`comver._stamp`][comver._stamp] for the stamp).
+
+    """
+    if repository is None or isinstance(repository, str):
+        directory = str(pathlib.Path(repository or ".").resolve())
+    else:
+        directory = str(repository.working_dir)
+    config, checksum = _resolved(options)
+    if (stamped := _stamp.version(directory, checksum)) is not None:
+        return stamped
+
+    key = (directory, checksum, _stamp.head_sha(directory))
+    if key in _VERSIONS:
+        return _VERSIONS[key]
+
     version = VersionCommit()
     for version in Version.from_git_configured(  # noqa: B007
-        message_includes=message_includes,
-        message_excludes=message_excludes,
-        path_includes=path_includes,
-        path_excludes=path_excludes,
-        author_name_includes=author_name_includes,
-        author_name_excludes=author_name_excludes,
-        author_email_includes=author_email_includes,
-        author_email_excludes=author_email_excludes,
-        major_regexes=major_regexes,
-        minor_regexes=minor_regexes,
-        patch_regexes=patch_regexes,
-        unrecognized_message=unrecognized_message,
-        repository=repository,
+        repository=repository, resume=True, **config
     ):
         pass
+    _VERSIONS[key] = str(version.version)
+    return _VERSIONS[key]
+
+
+_RESOLVED: dict[str, tuple[dict[str, typing.Any], str]] = {}
+"""Resolved options and their checksums (keyed by cwd and provided options)."""
+
+_VERSIONS: dict[tuple[str, str, str | None], str] = {}
+"""Calculated versions keyed by the directory, checksum and `HEAD` sha."""
+
+
+def _resolved(
+    options: Mapping[str, typing.Any],
+) -> tuple[dict[str, typing.Any], str]:
+    """Resolve the provided options against the configuration (once).
 
-    return str(version.version)
+    Note:
+        The configuration is loaded from the current working directory
+        (as by `from_git_configured` and the CLI). Provided options are
+        not read by the CLI, hence
+        [`PluginOptionsWarning`][comver.error.PluginOptionsWarning]
+        is issued if they change the checksum.
+
+    Args:
+        options:
+            Options provided to the plugin (other keys, e.g. `source`
+            of `[tool.hatch.version]`, are ignored).
+
+    Returns:
+        Options of `from_git_configured` and their checksum (the same
+        as output by `comver calculate --checksum`).
+
+    """
+    provided = {
+        name: options[name]
+        for name in (*_config.OPTIONS, *_config.WALK)
+        if options.get(name) is not None
+    }
+    key = f"{pathlib.Path.cwd()}:{json.dumps(provided, sort_keys=True, default=repr)}"
+    if key not in _RESOLVED:
+        loaded = _config.load()
+        config = {**loaded, **provided}
+        checksum = _config.checksum(config)
+        if checksum != _config.checksum(loaded):
+            warnings.warn(
+                error.PluginOptionsWarning(
+                    name
+                    for name, value in provided.items()
+                    if loaded.get(name) != value
+                ),
+                stacklevel=1,
+            )
+        _RESOLVED[key] = (
+            {
+                name: config.get(name)
+                for name in (*_config.OPTIONS, *_config.WALK)
+            },
+            checksum,
+        )
+    return _RESOLVED[key]
 
 
 if find_spec("hatchling"):
@@ -169,8 +279,10 @@ if find_spec("hatchling"):
         yielded from `iterable`__.
 
         > [!IMPORTANT]
-        > Plugin can also be configured by `[tool.hatch.version]`, not only
-        > `[tool.comver`]. The former takes precedence if both exist.
+        > Plugin can also be configured by `[tool.hatch.version]` (any
+        > of the options), not only `[tool.comver`]. The former takes
+        > precedence if both exist, but it is not read by the CLI
+        > (see [`PluginOptionsWarning`][comver.error.PluginOptionsWarning]).
 
         """
 
@@ -183,21 +295,7 @@ if find_spec("hatchling"):
                 A dictionary with the resolved version string,
                 under the "version" key.
             """
-            version = VersionCommit()
-            for version in Version.from_git_configured(  # noqa: B007
-                message_includes=self.config.get("message_includes"),  # pyright: ignore [reportUnknownArgumentType]
-                message_excludes=self.config.get("message_excludes"),  # pyright: ignore [reportUnknownArgumentType]
-                path_includes=self.config.get("path_includes"),  # pyright: ignore [reportUnknownArgumentType]
-                path_excludes=self.config.get("path_excludes"),  # pyright: ignore [reportUnknownArgumentType]
-                author_name_includes=self.config.get("author_name_includes"),  # pyright: ignore [reportUnknownArgumentType]
-                author_name_excludes=self.config.get("author_name_excludes"),  # pyright: ignore [reportUnknownArgumentType]
-                author_email_includes=self.config.get("author_email_includes"),  # pyright: ignore [reportUnknownArgumentType]
-                author_email_excludes=self.config.get("author_email_excludes"),  # pyright: ignore [reportUnknownArgumentType]
-                repository=self.root,
-            ):
-                pass
-
-            return {"version": str(version.version)}
+            return {"version": _version(self.root, self.config)}  # pyright: ignore [reportUnknownArgumentType]
 
         def set_version(  # pyright: ignore [reportIncompatibleMethodOverride, reportImplicitOverride]
             self,
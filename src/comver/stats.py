@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Statistics of version calculations.
+
+Pass [`Stats`][comver.stats.Stats] to
+[`from_git`][comver._version.Version.from_git] (or
+[`from_messages`][comver._version.Version.from_messages]) to observe
+the run:
+
+```python
+import comver
+from comver.stats import Stats
+
+stats = Stats(on_span=lambda name, start, duration: print(name, duration))
+for version in comver.Version.from_git(path_excludes=["^docs/"], stats=stats):
+    pass
+
+print(stats.counters["commits"], stats.spans["diff"].calls)
+```
+
+Spans (timed phases):
+
+- `traversal` - reading the next commit from the backend
+- `diff` - computing paths changed by the commit (calls are the
+    number of diffs computed)
+- `author` - matching author names and emails
+- `path` - matching changed paths
+- `classification` - matching the message
+
+Counters:
+
+- `commits` - commits scanned
+- `filtered.<rule>` - commits filtered out by the rule (e.g. `path`
+    or `author_email`)
+- `regex.<rules>` - evaluations of the rule set (e.g. `message`
+    or `semantic`)
+- `cache.hits`/`cache.misses` - checkpoints found (or not) in the cache
+- `bytes` - bytes read from `git` (only `subprocess` backend)
+
+Tip:
+    Statistics are collected only while the observed iterator runs
+    (not while your code processes the yielded versions), without
+    any observer attached the overhead is negligible.
+
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@dataclasses.dataclass
+class Span:
+    """Timings of the span.
+
+    Attributes:
+        time:
+            Total time (in seconds) spent in the span.
+        calls:
+            Number of times the span was entered.
+
+    """
+
+    time: float = 0.0
+    calls: int = 0
+
+
+class Stats:
+    """Counters and spans of the run.
+
+    Attributes:
+        counters:
+            Counters keyed by their names (e.g. `commits`).
+        spans:
+            Timings of spans keyed by their names (e.g. `diff`).
+        on_span:
+            Callback called with the name, start (as returned by
+            `time.perf_counter`) and duration (in seconds) of every
+            finished span (e.g. forwarding it to the tracing system).
+
+    """
+
+    def __init__(
+        self, on_span: Callable[[str, float, float], None] | None = None
+    ) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            on_span:
+                Callback called after every span (see
+                [`Stats`][comver.stats.Stats]).
+                Default: No callback.
+
+        """
+        self.counters: collections.Counter[str] = collections.Counter()
+        self.spans: collections.defaultdict[str, Span] = (
+            collections.defaultdict(Span)
+        )
+        self.on_span: Callable[[str, float, float], None] | None = on_span
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the span.
+
+        Args:
+            name:
+                Name of the span.
+
+        Yields:
+            Nothing, the span is timed until the context exits.
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            span = self.spans[name]
+            span.time += duration
+            span.calls += 1
+            if self.on_span is not None:
+                self.on_span(name, start, duration)
+
+    def report(self) -> dict[str, typing.Any]:
+        """Get the report.
+
+        Returns:
+            JSON serializable report (spans ordered by their time).
+
+        """
+        return {
+            "phases": {
+                name: dataclasses.asdict(span)
+                for name, span in sorted(
+                    self.spans.items(), key=lambda item: -item[1].time
+                )
+            },
+            "counters": dict(sorted(self.counters.items())),
+        }
@@ -14,8 +14,9 @@ Important:
 from __future__ import annotations
 
 import re
+import typing
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 
 StringOrPattern = str | re.Pattern[str]
 """Either `string` or compiled `re.Pattern`."""
@@ -25,3 +26,30 @@ StringsOrPatterns = Iterable[StringOrPattern]
 
 OptionalStringsOrPatterns = Iterable[StringOrPattern] | None
 """Iterable of `StringOrPattern` or `None`."""
+
+Scope = typing.Literal["header", "body", "trailers", "full"]
+"""Section of the commit message scanned by the message rule."""
+
+Scopes = Mapping[str, Scope]
+"""Mapping of the message rules (e.g. `major_regexes`) to their `Scope`."""
+
+
+class Base(typing.TypedDict, total=False):
+    """History horizon and the version right before it.
+
+    Attributes:
+        version:
+            Version of the history before the horizon (e.g. `4.0.0`).
+        sha:
+            Commit whose ancestors (itself included) are not walked.
+        since:
+            ISO 8601 date, older commits are not walked.
+        max_commits:
+            Maximal number of (newest) commits walked.
+
+    """
+
+    version: typing.Required[str]
+    sha: str
+    since: str
+    max_commits: int
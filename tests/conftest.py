@@ -69,5 +69,11 @@ ARGS = argparse.Namespace()
 ARGS.sha = True
 ARGS.checksum = True
 ARGS.format = "line"
+ARGS.component = None
+ARGS.ref = None
+ARGS.rev = None
+ARGS.repos = None
+ARGS.messages_from = None
+ARGS.profile = None
 pytest.ComverCalculateArgs = ARGS  # pyright: ignore [reportAttributeAccessIssue]
 """Hack making CLI args for calculate subcommand globally available."""
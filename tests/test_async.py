@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test the `asyncio` API."""
+
+from __future__ import annotations
+
+import asyncio
+import typing
+
+import git
+
+import pytest
+
+import comver
+
+from comver import _aio
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+
+async def collect(
+    repo: git.Repo, **kwargs: typing.Any
+) -> list[tuple[str, str]]:
+    """Collect outputs of `afrom_git` as (version, sha) pairs.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        **kwargs:
+            Keyword arguments of `afrom_git`.
+
+    Returns:
+        Version and sha of each yielded commit.
+
+    """
+    return [
+        (str(output.version), output.commit.hexsha)
+        async for output in comver.Version.afrom_git(repository=repo, **kwargs)
+    ]
+
+
+@pytest.fixture
+def repo(tmp_path: pathlib.Path) -> git.Repo:
+    """Create repository with merged branch and renamed file.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+
+    Returns:
+        Initialized repository.
+
+    """
+    repo = git.Repo.init(tmp_path, initial_branch="main")
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+
+    for path, message in (
+        ("src/a", "feat: a\n\nWith a body."),
+        ("docs/b", "fix: b"),
+        ("src/c", "feat!: c"),
+    ):
+        file = tmp_path / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(message)
+        repo.git.add(path)
+        repo.git.commit("-m", message)
+
+    repo.git.checkout("-b", "feature")
+    repo.git.mv("src/c", "docs/c")
+    repo.git.commit("-m", "fix: move c")
+    repo.git.checkout("main")
+    repo.git.commit("--allow-empty", "-m", "fix: d", author="Bot <bot@x.y>")
+    repo.git.merge("feature", "--no-ff", "-m", "feat: merge feature")
+    return repo
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {},
+        {"path_includes": ["src/*"]},
+        {"path_excludes": ["docs/*"], "minor_regexes": ["^fix"]},
+        {"author_email_excludes": ["bot@"], "message_excludes": ["body"]},
+        {"traversal": "first-parent"},
+        {"rev": "feature"},
+    ),
+)
+def test_afrom_git(repo: git.Repo, kwargs: dict[str, typing.Any]) -> None:
+    """Test asynchronous outputs agree with the synchronous ones.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        kwargs:
+            Keyword arguments of both `from_git` and `afrom_git`.
+
+    """
+    expected = [
+        (str(output.version), output.commit.hexsha)
+        for output in comver.Version.from_git(repository=repo, **kwargs)
+    ]
+    assert expected
+    assert asyncio.run(collect(repo, **kwargs)) == expected
+
+
+def test_concurrent(tmp_path: pathlib.Path, repo: git.Repo) -> None:
+    """Test many repositories versioned in a single event loop.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        repo:
+            Repository to calculate versions for.
+
+    """
+    bare = git.Repo.clone_from(
+        str(repo.working_tree_dir), tmp_path.parent / "bare", bare=True
+    )
+
+    async def gather() -> list[list[tuple[str, str]]]:
+        return await asyncio.gather(collect(repo), collect(bare))
+
+    ours, theirs = asyncio.run(gather())
+    assert ours == theirs
+
+
+def test_cancel(repo: git.Repo, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test cancelled walk kills the `git` subprocess.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        monkeypatch:
+            Fixture making the subprocess output slow.
+
+    """
+    processes: list[asyncio.subprocess.Process] = []
+    spawned = asyncio.Event()
+    original = asyncio.create_subprocess_exec
+
+    async def spawn(
+        *args: typing.Any, **kwargs: typing.Any
+    ) -> asyncio.subprocess.Process:
+        proc = await original(*args, **kwargs)
+        processes.append(proc)
+        spawned.set()
+        return proc
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", spawn)
+    monkeypatch.setattr(_aio, "CHUNK", 1)
+
+    async def cancel() -> None:
+        task = asyncio.create_task(collect(repo))
+        await spawned.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel())
+    assert processes
+    assert all(proc.returncode is not None for proc in processes)
+
+
+@pytest.mark.parametrize("chunk", (1, 7))
+def test_split(
+    repo: git.Repo, monkeypatch: pytest.MonkeyPatch, chunk: int
+) -> None:
+    """Test tokens spanning many chunks are joined (empty ones kept).
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        monkeypatch:
+            Fixture changing the size of read chunks.
+        chunk:
+            Number of bytes read at once.
+
+    """
+    repo.git.commit("--allow-empty", "-m", f"feat: long\n\n{'x' * 50_000}")
+    expected = asyncio.run(collect(repo))
+    monkeypatch.setattr(_aio, "CHUNK", chunk)
+
+    async def messages() -> list[str]:
+        return [
+            str(output.commit.message)
+            async for output in comver.Version.afrom_git(repository=repo)
+        ]
+
+    assert asyncio.run(collect(repo)) == expected
+    assert asyncio.run(messages())[-1].endswith("x" * 50_000 + "\n")
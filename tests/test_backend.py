@@ -0,0 +1,273 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test every backend reading the repository."""
+
+from __future__ import annotations
+
+import typing
+
+import git
+
+import pytest
+
+import comver
+
+from comver import _backend, error
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.fixture(params=_backend.BACKENDS)
+def backend(request: pytest.FixtureRequest) -> str:
+    """Name of the tested backend (skipped if not installed).
+
+    Args:
+        request:
+            Request of the `pytest` fixture.
+
+    Returns:
+        Name of the backend.
+
+    """
+    if request.param == "pygit2":
+        pytest.importorskip("pygit2")
+    return request.param
+
+
+@pytest.fixture
+def repo(tmp_path: pathlib.Path) -> git.Repo:
+    """Create repository with merged branch and renamed file.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+
+    Returns:
+        Initialized repository.
+
+    """
+    repo = git.Repo.init(tmp_path, initial_branch="main")
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+
+    for path, message in (
+        ("src/a", "feat: a\n\nWith a body."),
+        ("docs/b", "fix: b"),
+        ("src/c", "feat!: c"),
+    ):
+        file = tmp_path / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(message)
+        repo.git.add(path)
+        repo.git.commit("-m", message)
+
+    repo.git.checkout("-b", "feature")
+    repo.git.mv("src/c", "docs/c")
+    repo.git.commit("-m", "fix: move c")
+    repo.git.checkout("main")
+    repo.git.commit("--allow-empty", "-m", "fix: d", author="Bot <bot@x.y>")
+    repo.git.merge("feature", "--no-ff", "-m", "feat: merge feature")
+    return repo
+
+
+def test_protocol(repo: git.Repo, backend: str) -> None:
+    """Test backend operations agree with `GitPython`.
+
+    Args:
+        repo:
+            Repository to read.
+        backend:
+            Name of the backend.
+
+    """
+    reader = _backend.load(repo, backend)
+    head = repo.head.commit
+
+    assert reader.resolve("HEAD") == head.hexsha
+    assert reader.resolve("feature~1") == repo.commit("feature~1").hexsha
+
+    records = list(reader.commits(head.hexsha, {}))
+    assert [record.sha for record in records] == [
+        commit.hexsha for commit in repo.iter_commits(reverse=True)
+    ]
+    for record in records:
+        commit = repo.commit(record.sha)
+        assert record.parents == tuple(p.hexsha for p in commit.parents)
+        assert record.author_email == commit.author.email
+        assert record.time == commit.committed_date
+        assert record.message == commit.message
+        assert reader.changed(record.sha) == [d.a_path for d in commit.diff()]
+
+    parent = head.parents[0].hexsha
+    assert [record.sha for record in reader.commits(head.hexsha, {}, parent)]
+    assert reader.is_ancestor(parent, head.hexsha)
+    assert not reader.is_ancestor(head.hexsha, parent)
+    assert not reader.is_ancestor("0" * 40, head.hexsha)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {},
+        {"path_includes": ["src/*"]},
+        {"path_excludes": ["docs/*"], "minor_regexes": ["^fix"]},
+        {"author_email_excludes": ["bot@"], "message_excludes": ["body"]},
+        {"traversal": "first-parent"},
+        {"traversal": "merges-only"},
+        {"rev": "feature", "cache": True},
+    ),
+)
+def test_from_git(
+    repo: git.Repo, backend: str, kwargs: dict[str, typing.Any]
+) -> None:
+    """Test versions do not depend on the backend.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        backend:
+            Name of the backend.
+        kwargs:
+            Keyword arguments of `from_git`.
+
+    """
+    expected = list(
+        comver.Version.from_git(repository=repo, backend="gitpython", **kwargs)
+    )
+    outputs = list(
+        comver.Version.from_git(
+            repository=repo,
+            backend=backend,  # pyright: ignore [reportArgumentType]
+            **kwargs,
+        )
+    )
+    assert expected
+    assert outputs == expected
+
+
+def test_refs_components(repo: git.Repo, backend: str) -> None:
+    """Test versions of many refs and components do not depend on the backend.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        backend:
+            Name of the backend.
+
+    """
+    rules = {"path_includes": ["src/*"]}
+    components = {"src": rules, "all": {}}
+    expected, outputs = (
+        (
+            comver.Version.from_git_refs(
+                ["main", "feature"], rules, repository=repo, backend=name
+            ),
+            list(
+                comver.Version.from_git_components(
+                    components, repository=repo, backend=name
+                )
+            ),
+        )
+        for name in typing.cast("list[typing.Any]", ["gitpython", backend])
+    )
+    assert outputs == expected
+
+
+def test_environment(
+    repo: git.Repo, monkeypatch: pytest.MonkeyPatch, backend: str
+) -> None:
+    """Test backend chosen by the environment variable.
+
+    Args:
+        repo:
+            Repository to read.
+        monkeypatch:
+            Fixture setting the environment variable.
+        backend:
+            Name of the backend.
+
+    """
+    monkeypatch.setenv("COMVER_BACKEND", backend)
+    assert type(_backend.load(repo)).__name__.lower() == backend
+
+    monkeypatch.setenv("COMVER_BACKEND", "svn")
+    with pytest.raises(error.BackendUnavailableError):
+        _backend.load(repo)
+
+
+@pytest.mark.parametrize("chunk", (1, 7, 64))
+def test_buffers(
+    repo: git.Repo, monkeypatch: pytest.MonkeyPatch, chunk: int
+) -> None:
+    """Test fields spanning many read buffers are parsed correctly.
+
+    Args:
+        repo:
+            Repository to read.
+        monkeypatch:
+            Fixture shrinking the read buffer.
+        chunk:
+            Size of the read buffer.
+
+    """
+    expected = list(_backend.load(repo, "subprocess").commits("HEAD", {}))
+    monkeypatch.setattr(_backend, "CHUNK", chunk)
+    records = list(_backend.load(repo, "subprocess").commits("HEAD", {}))
+    assert [(r.sha, r.parents, r.message) for r in records] == [
+        (r.sha, r.parents, r.message) for r in expected
+    ]
+
+
+def test_user_config(repo: git.Repo) -> None:
+    """Test commits are read the same no matter the `git` configuration.
+
+    Args:
+        repo:
+            Repository to read.
+
+    """
+    repo.git.commit("--allow-empty", "-m", "feat: zażółć gęślą jaźń")
+    repo.git.notes("add", "-m", "feat!: note")
+    expected = list(_backend.load(repo, "subprocess").commits("HEAD", {}))
+    with repo.config_writer() as writer:
+        writer.set_value("i18n", "logOutputEncoding", "ISO-8859-2")
+        writer.set_value("log", "showSignature", "true")
+        writer.set_value("notes", "displayRef", "refs/notes/*")
+
+    records = list(_backend.load(repo, "subprocess").commits("HEAD", {}))
+    assert [(r.sha, r.message) for r in records] == [
+        (r.sha, r.message) for r in expected
+    ]
+    assert records[-1].message == "feat: zażółć gęślą jaźń\n"
+
+
+def test_lazy(repo: git.Repo, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test author email is decoded only if inspected by the rules.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        monkeypatch:
+            Fixture failing the decoding.
+
+    """
+
+    def fail(_: typing.Any) -> str:
+        raise AssertionError
+
+    monkeypatch.setattr(_backend.author_type(), "email", property(fail))
+
+    assert list(comver.Version.from_git(repository=repo))
+    with pytest.raises(AssertionError):
+        list(
+            comver.Version.from_git(
+                repository=repo, author_email_excludes=["bot@"]
+            )
+        )
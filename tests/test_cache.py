@@ -0,0 +1,461 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test on-disk checkpoints of `comver.Version.from_git`."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import pathlib
+import time
+import typing
+
+import git
+
+import pytest
+
+import comver
+
+from comver import _cli, _index, _subcommand
+
+
+def commit(repo: git.Repo, message: str) -> None:
+    """Create an empty commit with a given message.
+
+    Args:
+        repo:
+            Repository to commit to.
+        message:
+            Message of the commit.
+
+    """
+    repo.git.commit("--allow-empty", "-m", message)
+
+
+def last(repo: git.Repo, *, cache: bool) -> tuple[str, int]:
+    """Calculate the last version and count yielded elements.
+
+    Note:
+        The walk is resumed from the checkpointed state (if cached).
+
+    Args:
+        repo:
+            Repository to calculate version for.
+        cache:
+            Whether checkpoints should be used.
+
+    Returns:
+        Last version as string and number of yielded elements.
+
+    """
+    outputs = list(
+        comver.Version.from_git(
+            repository=repo, cache=cache, checkpoint_interval=2, resume=True
+        )
+    )
+    return str(outputs[-1].version), len(outputs)
+
+
+@pytest.fixture
+def repo(tmp_path: pathlib.Path) -> git.Repo:
+    """Create repository with `6` linear commits.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+
+    Returns:
+        Initialized repository.
+
+    """
+    repo = git.Repo.init(tmp_path)
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+    for message in ("feat: a", "fix: b", "fix: c", "feat: d", "fix: e"):
+        commit(repo, message)
+    return repo
+
+
+def test_resume_from_tip(repo: git.Repo) -> None:
+    """Test cached tip is reused and only new commits are walked."""
+    assert last(repo, cache=True) == ("0.2.1", 5)
+    commit(repo, "feat!: f")
+    commit(repo, "fix: g")
+
+    version, yielded = last(repo, cache=True)
+    assert version == last(repo, cache=False)[0] == "1.0.1"
+    # Checkpoint and two new commits
+    assert yielded == 3  # noqa: PLR2004
+
+
+def test_replay(repo: git.Repo) -> None:
+    """Test cached walk yields the same outputs as the uncached one."""
+    last(repo, cache=True)
+    commit(repo, "feat!: f")
+
+    expected = list(comver.Version.from_git(repository=repo))
+    for _ in range(2):
+        assert (
+            list(
+                comver.Version.from_git(
+                    repository=repo, cache=True, checkpoint_interval=2
+                )
+            )
+            == expected
+        )
+
+
+def test_rewritten_history(repo: git.Repo) -> None:
+    """Test rewritten history resumes from a checkpoint below merge-base."""
+    last(repo, cache=True)
+    repo.git.reset("--hard", "HEAD~2")
+    commit(repo, "feat!: rewritten")
+
+    version, yielded = last(repo, cache=True)
+    assert version == last(repo, cache=False)[0] == "1.0.0"
+    assert yielded < last(repo, cache=False)[1]
+
+
+def test_interleaved_merge(repo: git.Repo) -> None:
+    """Test checkpoint is not used if it would change the order of commits."""
+    base = repo.head.commit
+    last(repo, cache=True)
+
+    repo.git.checkout("-b", "side", base.parents[0].hexsha)
+    with repo.git.custom_environment(GIT_COMMITTER_DATE="2000-01-01T00:00"):
+        commit(repo, "feat!: old")
+    repo.git.checkout("-")
+    repo.git.merge("side", "--no-ff", "-m", "fix: merge")
+
+    assert last(repo, cache=True)[0] == last(repo, cache=False)[0]
+
+
+def test_index_append(repo: git.Repo) -> None:
+    """Test the history index is extended (not rewritten) by new commits."""
+    last(repo, cache=True)
+    (index,) = pathlib.Path(repo.git_dir, "comver").glob("*.idx")
+    before = index.read_bytes()
+
+    commit(repo, "feat!: f")
+    last(repo, cache=True)
+    assert index.read_bytes().startswith(before)
+
+    repo.git.reset("--hard", "HEAD~3")
+    commit(repo, "feat: rewritten")
+    last(repo, cache=True)
+    for output in comver.Version.from_git(repository=repo):
+        sha = typing.cast("git.Commit", output.commit).hexsha
+        assert comver.Version.at(sha, repository=repo) == output.version
+
+
+def test_index_concurrent(tmp_path: pathlib.Path) -> None:
+    """Test saves neither shrink nor overwrite the mapped index."""
+    path = tmp_path / "history.idx"
+    records = [(bytes([i]) * 20, 0, i, 0) for i in range(8)]
+    _index.append(path, 0, records[:4])
+
+    with _index.Index(path) as reader:
+        _index.append(path, 4, records[4:6])
+        # Partially written run (e.g. interrupted save) is not reused
+        with path.open("ab") as handle:
+            handle.write(b"\0" * 3)
+        _index.append(path, 6, records[6:])
+        assert list(reader.records()) == records[:4]
+
+    with _index.Index(path) as index:
+        assert list(index.records()) == records
+        assert index.end == path.stat().st_size
+
+
+def test_at(repo: git.Repo) -> None:
+    """Test `comver.Version.at` agrees with the full walk."""
+    for output in comver.Version.from_git(repository=repo):
+        sha = typing.cast("git.Commit", output.commit).hexsha
+        assert comver.Version.at(sha, repository=repo) == output.version
+
+    assert comver.Version.at("0" * 40, repository=repo) is None
+    assert comver.Version.at("randomShaNonExistent", repository=repo) is None
+    assert (
+        comver.Version.at(repo.head.commit.hexsha[:8], repository=repo) is None
+    )
+
+
+def test_verify_index(repo: git.Repo, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test `verify` subcommand probing the history index.
+
+    Args:
+        repo:
+            Repository to verify.
+        monkeypatch:
+            Fixture changing the working directory.
+
+    """
+    directory = pathlib.Path(typing.cast("str", repo.working_tree_dir))
+    (directory / ".comver.toml").write_text("cache = true\n")
+    monkeypatch.chdir(directory)
+
+    version, sha, checksum = _subcommand._calculate(  # noqa: SLF001
+        pytest.ComverCalculateArgs  # pyright: ignore [reportAttributeAccessIssue]
+    ).split()
+    first = repo.commit("HEAD~4").hexsha
+    for arguments, code in (
+        ((version, sha, checksum), 0),
+        (("0.1.0", first, checksum), 0),
+        (("0.1.0", sha, checksum), 1),
+        (("0.2.1", first, checksum), 1),
+        (("9.9.9", "0" * 40, checksum), 1),
+    ):
+        with pytest.raises(SystemExit) as e:
+            _cli.main(["verify", *arguments])
+        assert e.value.code == code
+
+
+def test_query(repo: git.Repo, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test `comver.Version.query` and `comver.Version.on` via SQLite store.
+
+    Args:
+        repo:
+            Repository to query.
+        monkeypatch:
+            Fixture changing the working directory.
+
+    """
+    monkeypatch.chdir(typing.cast("str", repo.working_tree_dir))
+    outputs = list(comver.Version.from_git(repository=repo))
+
+    records = list(comver.Version.query(lower="0.1.1", upper="0.2.0"))
+    assert [(r.version, r.sha) for r in records] == [
+        (o.version, typing.cast("git.Commit", o.commit).hexsha)
+        for o in outputs[1:4]
+    ]
+
+    now = dt.datetime.now(tz=dt.UTC)
+    record = comver.Version.on(now + dt.timedelta(days=1))
+    assert record is not None
+    assert record.version == outputs[-1].version
+    assert comver.Version.on(now - dt.timedelta(days=1)) is None
+    assert not list(comver.Version.query(since=now + dt.timedelta(days=1)))
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["query", "--min-version", "0.2.1", "--format", "json"])
+    assert e.value.code == 0
+
+
+def test_query_naive(repo: git.Repo, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test naive datetimes are in UTC (no matter the local timezone).
+
+    Args:
+        repo:
+            Repository to query.
+        monkeypatch:
+            Fixture changing the working directory and the timezone.
+
+    """
+    monkeypatch.chdir(typing.cast("str", repo.working_tree_dir))
+    # Local time is five hours ahead of UTC
+    monkeypatch.setenv("TZ", "Etc/GMT-5")
+    time.tzset()
+    try:
+        record = comver.Version.on(dt.datetime.now(tz=dt.UTC))
+        assert record is not None
+        naive = record.time.replace(tzinfo=None)
+        assert comver.Version.on(naive) == record
+        # Commits of the fixture are made within the same second
+        assert record in comver.Version.query(since=naive, until=naive)
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+@pytest.mark.parametrize("cache", (True, False))
+def test_verify_first(
+    repo: git.Repo,
+    monkeypatch: pytest.MonkeyPatch,
+    cache: bool,  # noqa: FBT001
+) -> None:
+    """Test later commits with the version are verified as well.
+
+    Args:
+        repo:
+            Repository to verify.
+        monkeypatch:
+            Fixture changing the working directory.
+        cache:
+            Whether the history index is probed.
+
+    """
+    directory = pathlib.Path(typing.cast("str", repo.working_tree_dir))
+    (directory / ".comver.toml").write_text(f"cache = {str(cache).lower()}\n")
+    monkeypatch.chdir(directory)
+    first = repo.head.commit.hexsha
+    # Included, but does not change the version
+    commit(repo, "docs: g")
+
+    version, sha, checksum = _subcommand._calculate(  # noqa: SLF001
+        pytest.ComverCalculateArgs  # pyright: ignore [reportAttributeAccessIssue]
+    ).split()
+    assert sha == repo.head.commit.hexsha
+    for arguments, code in (
+        ((version, first, checksum), 0),
+        ((version, sha, checksum), 0),
+        ((version, repo.commit("HEAD~2").hexsha, checksum), 1),
+    ):
+        with pytest.raises(SystemExit) as e:
+            _cli.main(["verify", *arguments])
+        assert e.value.code == code
+
+
+@pytest.mark.parametrize("cache", (True, False))
+def test_verify_many(
+    repo: git.Repo,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    cache: bool,  # noqa: FBT001
+) -> None:
+    """Test `verify --from-file` reporting every triple and the summary.
+
+    Args:
+        repo:
+            Repository to verify.
+        monkeypatch:
+            Fixture changing the working directory.
+        capsys:
+            Fixture capturing the output.
+        cache:
+            Whether the history index is probed (instead of a scan).
+
+    """
+    directory = pathlib.Path(typing.cast("str", repo.working_tree_dir))
+    (directory / ".comver.toml").write_text(f"cache = {str(cache).lower()}\n")
+    monkeypatch.chdir(directory)
+
+    checksum = _subcommand._checksum_config()  # noqa: SLF001
+    first = repo.commit("HEAD~4").hexsha
+    head = repo.head.commit.hexsha
+    (directory / "pairs.txt").write_text(
+        f"# releases\n0.1.0 {first} {checksum}\n\n"
+        f"0.2.1 {head} {checksum}\n"
+        f"0.2.1 {first} {checksum}\n"
+        f"0.2.1 {head} wrongChecksum\n"
+    )
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["verify", "--from-file", "pairs.txt"])
+    assert e.value.code == 1
+
+    *results, summary = map(json.loads, capsys.readouterr().out.splitlines())
+    assert [r["ok"] for r in results] == [True, True, False, False]
+    assert summary == {"total": 4, "passed": 2, "failed": 2}
+
+    (directory / "pairs.txt").write_text("0.1.0 onlySha\n")
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["verify", "--from-file", "pairs.txt"])
+    assert e.value.code == 2  # noqa: PLR2004
+
+
+def test_rev(repo: git.Repo) -> None:
+    """Test `rev` walks only ancestors and keeps the cache of `HEAD`."""
+    last(repo, cache=True)
+    outputs = list(comver.Version.from_git(repository=repo, rev="HEAD~2"))
+    assert str(outputs[-1].version) == "0.1.2"
+    assert len(outputs) == 3  # noqa: PLR2004
+
+    cached = list(
+        comver.Version.from_git(repository=repo, cache=True, rev="HEAD~2")
+    )
+    assert cached[-1] == outputs[-1]
+    # Cache of HEAD was not overwritten, tip is reused
+    assert last(repo, cache=True) == ("0.2.1", 1)
+
+
+@pytest.mark.parametrize("cache", (True, False))
+def test_verify_ancestry(
+    repo: git.Repo,
+    monkeypatch: pytest.MonkeyPatch,
+    cache: bool,  # noqa: FBT001
+) -> None:
+    """Test `verify --strategy ancestry` for reachable and unreachable shas.
+
+    Args:
+        repo:
+            Repository to verify.
+        monkeypatch:
+            Fixture changing the working directory.
+        cache:
+            Whether to resume from cached checkpoints.
+
+    """
+    directory = pathlib.Path(typing.cast("str", repo.working_tree_dir))
+    (directory / ".comver.toml").write_text(f"cache = {str(cache).lower()}\n")
+    monkeypatch.chdir(directory)
+
+    checksum = _subcommand._checksum_config()  # noqa: SLF001
+    release = repo.commit("HEAD~2").hexsha
+    repo.git.checkout("-b", "side")
+    commit(repo, "feat!: unreachable")
+    unreachable = repo.head.commit.hexsha
+    repo.git.checkout("-")
+
+    for arguments, code in (
+        (("0.1.2", release, checksum), 0),
+        (("0.2.0", release, checksum), 1),
+        (("1.0.0", unreachable, checksum), 1),
+    ):
+        with pytest.raises(SystemExit) as e:
+            _cli.main(["verify", "--strategy", "ancestry", *arguments])
+        assert e.value.code == code
+
+
+def test_rev_checkpoint(repo: git.Repo) -> None:
+    """Test `rev` resumes from the nearest checkpoint below it."""
+    last(repo, cache=True)
+
+    for rev, yielded in (("HEAD~1", 1), ("HEAD~2", 2), ("HEAD~4", 1)):
+        outputs = list(
+            comver.Version.from_git(
+                repository=repo,
+                cache=True,
+                checkpoint_interval=2,
+                rev=rev,
+                resume=True,
+            )
+        )
+        assert len(outputs) == yielded
+        *_, expected = comver.Version.from_git(repository=repo, rev=rev)
+        assert outputs[-1] == expected
+
+
+def test_calculate_rev(
+    repo: git.Repo,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test `calculate --rev` outputs version of the revision.
+
+    Args:
+        repo:
+            Repository to calculate version for.
+        monkeypatch:
+            Fixture changing the working directory.
+        capsys:
+            Fixture capturing the output.
+
+    """
+    monkeypatch.chdir(typing.cast("str", repo.working_tree_dir))
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["calculate", "--rev", "HEAD~2", "--sha"])
+    assert e.value.code == 0
+    assert capsys.readouterr().out.split() == [
+        "0.1.2",
+        repo.commit("HEAD~2").hexsha,
+    ]
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["calculate", "--rev", "HEAD~2", "--ref", "HEAD"])
+    assert e.value.code == 2  # noqa: PLR2004
@@ -7,6 +7,8 @@
 
 from __future__ import annotations
 
+import csv
+import json
 import typing
 
 import pytest
@@ -100,3 +102,39 @@ def test_verify(
         _cli.main(["verify", version, sha, checksum])
     except SystemExit as e:
         assert e.code == code  # noqa: PT017
+
+
+@pytest.mark.parametrize("format", ("ndjson", "csv", "tsv"))
+@pytest.mark.parametrize("extra", ((), ("--author",), ("--author", "--time")))
+def test_history(
+    format: typing.Literal["ndjson", "csv", "tsv"],  # noqa: A002
+    extra: tuple[str, ...],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test `history` command agrees with `calculate`.
+
+    Args:
+        format:
+            Format of the output.
+        extra:
+            Additional CLI flags (optional columns).
+        capsys:
+            Fixture capturing the output.
+
+    """
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["history", "--format", format, *extra])
+    assert e.value.code == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    if format == "ndjson":
+        last = json.loads(lines[-1])
+    else:
+        delimiter = "," if format == "csv" else "\t"
+        last = next(csv.DictReader(lines[:1] + lines[-1:], delimiter=delimiter))
+
+    output = _subcommand._calculate(pytest.ComverCalculateArgs)  # noqa: SLF001  # pyright: ignore [reportAttributeAccessIssue]
+    version, sha = output.split()[:2]
+    assert (last["version"], last["sha"]) == (version, sha)
+    assert ("author_name" in last) == ("--author" in extra)
+    assert ("time" in last) == ("--time" in extra)
@@ -0,0 +1,244 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test versions of components calculated in a single history walk."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import typing
+
+import git
+
+import pytest
+
+import comver
+
+from comver import _cli, error
+
+COMPONENTS = {
+    "a": {"path_includes": ["packages/a/*"]},
+    "b": {"path_includes": ["packages/b/*"], "minor_regexes": ["^chore:"]},
+    "everything": {},
+}
+
+# Paths are matched against the index, hence not used with cache
+SCOPES = {
+    "a": {"message_includes": [r"^\w+!?\(a\):"]},
+    "b": {"message_includes": [r"^\w+!?\(b\):"], "minor_regexes": ["^chore"]},
+    "everything": {},
+}
+
+
+def change(repo: git.Repo, path: str, message: str) -> None:
+    """Commit a change of a file.
+
+    Args:
+        repo:
+            Repository to commit to.
+        path:
+            Path (relative to the repository) of the changed file.
+        message:
+            Message of the commit.
+
+    """
+    file = pathlib.Path(typing.cast("str", repo.working_tree_dir)) / path
+    file.parent.mkdir(parents=True, exist_ok=True)
+    with file.open("a") as handle:
+        handle.write(f"{message}\n")
+    repo.git.add(path)
+    repo.git.commit("-m", message)
+
+
+def separately(
+    repo: git.Repo, components: dict[str, dict[str, list[str]]]
+) -> dict[str, comver.Version]:
+    """Calculate versions of components one by one.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        components:
+            Rules of each component.
+
+    Returns:
+        Last version of each component.
+
+    """
+    versions = {}
+    for name, rules in components.items():
+        versions[name] = comver.Version()
+        for output in comver.Version.from_git(repository=repo, **rules):
+            versions[name] = output.version
+    return versions
+
+
+def together(
+    repo: git.Repo,
+    components: dict[str, dict[str, list[str]]],
+    *,
+    cache: bool,
+) -> dict[str, comver.Version]:
+    """Calculate versions of components in a single walk.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        components:
+            Rules of each component.
+        cache:
+            Whether checkpoints should be used.
+
+    Returns:
+        Last version of each component.
+
+    """
+    versions = dict.fromkeys(components, comver.Version())
+    for name, output in comver.Version.from_git_components(
+        components, repository=repo, cache=cache, checkpoint_interval=1
+    ):
+        versions[name] = output.version
+    return versions
+
+
+def streams(repo: git.Repo, **kwargs: bool) -> dict[str, list[str]]:
+    """Collect outputs of each component in a single walk.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        **kwargs:
+            Keyword arguments of `from_git_components` (e.g. `cache`).
+
+    Returns:
+        "version sha" of every output of each component.
+
+    """
+    outputs: dict[str, list[str]] = {name: [] for name in SCOPES}
+    for name, output in comver.Version.from_git_components(
+        SCOPES, repository=repo, checkpoint_interval=1, **kwargs
+    ):
+        commit = typing.cast("git.Commit", output.commit)
+        outputs[name].append(f"{output.version} {commit.hexsha}")
+    return outputs
+
+
+@pytest.fixture
+def repo(tmp_path: pathlib.Path) -> git.Repo:
+    """Create repository with changes of two components.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+
+    Returns:
+        Initialized repository.
+
+    """
+    repo = git.Repo.init(tmp_path)
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+    for path, message in (
+        ("packages/a/x", "feat(a): a"),
+        ("packages/b/x", "chore(b): b"),
+        ("packages/a/x", "fix(a): a"),
+        ("README.md", "feat!: docs"),
+    ):
+        change(repo, path, message)
+    return repo
+
+
+def test_single_walk(repo: git.Repo) -> None:
+    """Test components agree with separate walks."""
+    assert together(repo, COMPONENTS, cache=False) == separately(
+        repo, COMPONENTS
+    )
+
+
+def test_resume(repo: git.Repo) -> None:
+    """Test components resuming from different checkpoints."""
+    assert together(repo, SCOPES, cache=True) == separately(repo, SCOPES)
+
+    # Component `a` resumes from a newer checkpoint than the others
+    change(repo, "packages/a/x", "feat(a): again")
+    for _ in comver.Version.from_git_components(
+        {"a": SCOPES["a"]}, repository=repo, cache=True
+    ):
+        pass
+    change(repo, "packages/b/x", "chore(b): again")
+
+    assert together(repo, SCOPES, cache=True) == separately(repo, SCOPES)
+
+
+def test_replay(repo: git.Repo) -> None:
+    """Test cached walks yield every output (unless resumed)."""
+    expected = streams(repo, cache=False)
+    for _ in range(2):
+        assert streams(repo, cache=True) == expected
+
+    resumed = streams(repo, cache=True, resume=True)
+    assert resumed == {name: stream[-1:] for name, stream in expected.items()}
+
+
+def test_calculate(
+    repo: git.Repo,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test `calculate --component` with overridden top-level options.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        monkeypatch:
+            Fixture changing the working directory.
+        capsys:
+            Fixture capturing the output.
+
+    """
+    directory = pathlib.Path(typing.cast("str", repo.working_tree_dir))
+    (directory / ".comver.toml").write_text(
+        'minor_regexes = ["^chore:"]\n'
+        "[components.a]\n"
+        'path_includes = ["packages/a/*"]\n'
+        "[components.b]\n"
+        'path_includes = ["packages/b/*"]\n'
+        'minor_regexes = ["^feat:"]\n'
+    )
+    monkeypatch.chdir(directory)
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["calculate", "--component", "--format", "json"])
+    assert e.value.code == 0
+    outputs = json.loads(capsys.readouterr().out)
+    expected = separately(
+        repo,
+        {
+            "a": {
+                "path_includes": ["packages/a/*"],
+                "minor_regexes": ["^chore:"],
+            },
+            "b": {
+                "path_includes": ["packages/b/*"],
+                "minor_regexes": ["^feat:"],
+            },
+        },
+    )
+    assert {name: output["version"] for name, output in outputs.items()} == {
+        name: str(version) for name, version in expected.items()
+    }
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["calculate", "--component", "b", "--checksum"])
+    assert e.value.code == 0
+    name, version, _ = capsys.readouterr().out.split()
+    assert (name, version) == ("b", str(expected["b"]))
+
+    with pytest.raises(error.ComponentNotFoundError):
+        _cli.main(["calculate", "--component", "missing"])
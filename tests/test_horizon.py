@@ -0,0 +1,352 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test history horizons (walking only the history after the `base`)."""
+
+from __future__ import annotations
+
+import json
+import typing
+
+import git
+
+import pytest
+
+from comver import Version, _cli, _config, error
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+    from comver.type_definitions import Base
+
+MESSAGES = ("feat: a", "feat!: b", "fix: c", "feat: d", "fix: e")
+"""Messages of consecutive commits (committed on January 1st of 2021-2025)."""
+
+MAX_COMMITS = 2
+"""Number of commits walked by the moving horizon."""
+
+
+@pytest.fixture
+def repo(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> git.Repo:
+    """Create repository with yearly commits (`1.1.1` version).
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        monkeypatch:
+            Fixture changing the working directory.
+
+    Returns:
+        Initialized repository.
+
+    """
+    repo = git.Repo.init(tmp_path)
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+    for year, message in enumerate(MESSAGES, start=2021):
+        repo.git.commit(
+            "--allow-empty",
+            "-m",
+            message,
+            env={"GIT_COMMITTER_DATE": f"{year}-01-01T12:00:00Z"},
+        )
+    monkeypatch.chdir(tmp_path)
+    return repo
+
+
+def versions(repo: git.Repo, base: Base | None, backend: str) -> list[str]:
+    """Get all versions calculated by `from_git`.
+
+    Args:
+        repo:
+            Repository to calculate versions of.
+        base:
+            History horizon.
+        backend:
+            Backend reading the repository.
+
+    Returns:
+        Versions of consecutive commits.
+
+    """
+    return [
+        str(output.version)
+        for output in Version.from_git(
+            repository=repo,
+            base=base,
+            backend=typing.cast("typing.Any", backend),
+        )
+    ]
+
+
+@pytest.mark.parametrize("backend", ("subprocess", "gitpython"))
+@pytest.mark.parametrize(
+    ("base", "expected"),
+    (
+        (None, ["0.1.0", "1.0.0", "1.0.1", "1.1.0", "1.1.1"]),
+        ({"version": "4.0.0", "sha": "HEAD~2"}, ["4.0.0", "4.1.0", "4.1.1"]),
+        (
+            {"version": "4.0.0", "since": "2023-06-01"},
+            ["4.0.0", "4.1.0", "4.1.1"],
+        ),
+        ({"version": "4.0.0", "max_commits": 1}, ["4.0.0", "4.0.1"]),
+        (
+            {"version": "4.0.0", "sha": "HEAD~3", "since": "2024-06-01"},
+            ["4.0.0", "4.0.1"],
+        ),
+    ),
+)
+def test_horizon(
+    repo: git.Repo,
+    base: Base | None,
+    expected: list[str],
+    backend: str,
+) -> None:
+    """Test the base version is bumped by commits after the horizon.
+
+    Args:
+        repo:
+            Repository with yearly commits.
+        base:
+            History horizon.
+        expected:
+            Expected versions (the base one first).
+        backend:
+            Backend reading the repository.
+
+    """
+    assert versions(repo, base, backend) == expected
+
+
+def test_base_commit(repo: git.Repo) -> None:
+    """Test the base version is yielded with its commit (if no newer ones).
+
+    Args:
+        repo:
+            Repository with yearly commits.
+
+    """
+    outputs = list(
+        Version.from_git(
+            repository=repo, base={"version": "4.0.0", "sha": "HEAD"}
+        )
+    )
+    assert len(outputs) == 1
+    assert str(outputs[0].version) == "4.0.0"
+    assert outputs[0].commit == repo.head.commit
+
+
+@pytest.mark.parametrize(
+    ("base", "key"),
+    (
+        ({"sha": "HEAD"}, "version"),
+        ({"version": 4}, "version"),
+        ({"version": "4.0"}, "version"),
+        ({"version": "4.0.x"}, "version"),
+        ({"version": "4.0.0", "since": "yesterday"}, "since"),
+        ({"version": "4.0.0", "max_commits": 0}, "max_commits"),
+        ({"version": "4.0.0", "until": "2020-01-01"}, "until"),
+    ),
+)
+def test_invalid(repo: git.Repo, base: dict[str, typing.Any], key: str) -> None:
+    """Test malformed horizons are reported (before walking the history).
+
+    Args:
+        repo:
+            Repository with yearly commits.
+        base:
+            Malformed history horizon.
+        key:
+            Key expected to be reported.
+
+    """
+    with pytest.raises(error.HorizonInvalidError) as e:
+        versions(repo, typing.cast("Base", base), "subprocess")
+    assert e.value.key == key
+
+
+def test_configured(
+    repo: git.Repo,
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test the configured horizon is used and changes the checksum.
+
+    Args:
+        repo:
+            Repository with yearly commits.
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        capsys:
+            Fixture capturing the output.
+
+    """
+    checksum = _config.checksum({})
+    sha = repo.commit("HEAD~2").hexsha
+    (tmp_path / "pyproject.toml").write_text(
+        f'[tool.comver.base]\nversion = "4.0.0"\nsha = "{sha}"\n'
+    )
+
+    with pytest.raises(SystemExit):
+        _cli.main(["calculate", "--sha", "--checksum"])
+    version, head, configured = capsys.readouterr().out.split()
+    assert (version, head) == ("4.1.1", repo.head.commit.hexsha)
+    assert configured == _config.checksum(_config.load()) != checksum
+
+    # The base commit has the base version
+    for arguments in ((version, head, configured), ("4.0.0", sha, configured)):
+        with pytest.raises(SystemExit) as e:
+            _cli.main(["verify", *arguments])
+        assert e.value.code == 0
+
+
+def test_cache(repo: git.Repo) -> None:
+    """Test checkpoints of the horizon are separate from the whole history.
+
+    Args:
+        repo:
+            Repository with yearly commits.
+
+    """
+    base: Base = {"version": "4.0.0", "since": "2023-06-01"}
+    for _ in range(2):
+        assert [
+            str(output.version)
+            for output in Version.from_git(
+                repository=repo, base=base, cache=True, checkpoint_interval=1
+            )
+        ][-1] == "4.1.1"
+        assert [
+            str(output.version)
+            for output in Version.from_git(
+                repository=repo, cache=True, checkpoint_interval=1
+            )
+        ][-1] == "1.1.1"
+
+
+def test_components(tmp_path: pathlib.Path) -> None:
+    """Test the horizon is rejected together with components.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+
+    """
+    (tmp_path / ".comver.toml").write_text(
+        '[base]\nversion = "4.0.0"\n\n[components.core]\npath_includes = ["a"]\n'
+    )
+    with pytest.raises(error.HorizonComponentsError) as e:
+        _config.components(_config.load(tmp_path))
+    assert e.value.components == ["core"]
+
+
+@pytest.mark.parametrize("backend", ("subprocess", "gitpython"))
+@pytest.mark.parametrize("rev", ("HEAD~3", "HEAD~4"))
+def test_unreachable(repo: git.Repo, rev: str, backend: str) -> None:
+    """Test revisions older than the horizon `sha` are rejected.
+
+    Args:
+        repo:
+            Repository with yearly commits.
+        rev:
+            Revision older than the horizon.
+        backend:
+            Backend reading the repository.
+
+    """
+    sha = repo.commit("HEAD~2").hexsha
+    base: Base = {"version": "4.0.0", "sha": sha}
+    with pytest.raises(error.HorizonUnreachableError) as e:
+        list(
+            Version.from_git(
+                repository=repo,
+                base=base,
+                rev=rev,
+                backend=typing.cast("typing.Any", backend),
+            )
+        )
+    assert (e.value.sha, e.value.rev) == (sha, repo.commit(rev).hexsha)
+
+    with pytest.raises(error.HorizonUnreachableError):
+        Version.from_git_refs([rev], repository=repo, base=base)
+
+
+def test_uncached(
+    repo: git.Repo,
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test the moving horizon is never looked up in the cache.
+
+    Args:
+        repo:
+            Repository with yearly commits.
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        capsys:
+            Fixture capturing the output.
+
+    """
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.comver]\ncache = true\n\n[tool.comver.base]\nversion = "4.0.0"\n'
+        f"max_commits = {MAX_COMMITS}\n"
+    )
+    with pytest.raises(error.HorizonUncachedError) as e:
+        Version.at(repo.head.commit.hexsha, repository=repo)
+    assert e.value.max_commits == MAX_COMMITS
+
+    # Verification scans the history instead
+    with pytest.raises(SystemExit):
+        _cli.main(["calculate", "--sha", "--checksum"])
+    arguments = capsys.readouterr().out.split()
+    assert arguments[0] == "4.1.1"
+    with pytest.raises(SystemExit) as exit_:
+        _cli.main(["verify", *arguments])
+    assert exit_.value.code == 0
+
+
+@pytest.mark.parametrize("base", ('since = "2023-06-01"', 'sha = "HEAD~2"'))
+def test_history(
+    repo: git.Repo,
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+    base: str,
+) -> None:
+    """Test the first commit after the horizon is bumped from the base.
+
+    Args:
+        repo:
+            Repository with yearly commits.
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        capsys:
+            Fixture capturing the output.
+        base:
+            Horizon of the `base` table.
+
+    """
+    (tmp_path / "pyproject.toml").write_text(
+        f'[tool.comver.base]\nversion = "4.0.0"\n{base}\n'
+    )
+    with pytest.raises(SystemExit):
+        _cli.main(["history"])
+    records = [
+        json.loads(line) for line in capsys.readouterr().out.splitlines()
+    ]
+    assert [(record["version"], record["bump"]) for record in records[-2:]] == [
+        ("4.1.0", "minor"),
+        ("4.1.1", "patch"),
+    ]
+    assert repo.head.commit.hexsha == records[-1]["sha"]
+    if base.startswith("sha"):
+        # The base commit keeps the base version
+        assert records[0] == {
+            "sha": repo.commit("HEAD~2").hexsha,
+            "version": "4.0.0",
+            "bump": "none",
+        }
@@ -0,0 +1,246 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test versions calculated from streamed (and single) messages."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import subprocess
+import sys
+import typing
+
+import pytest
+
+from comver import _cli, _messages
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+MESSAGES = (
+    "feat: a\n\nWith a body.",
+    "fix: b",
+    "chore: c",
+    "feat!: d",
+    "fix: e",
+)
+
+
+@pytest.mark.parametrize("separator", ("nul", "rs"))
+@pytest.mark.parametrize("compressed", (True, False))
+def test_messages_from(
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+    separator: str,
+    compressed: bool,  # noqa: FBT001
+) -> None:
+    """Test `calculate --messages-from` reading (gzipped) files.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        capsys:
+            Fixture capturing the output.
+        separator:
+            Name of the separator.
+        compressed:
+            Whether the file is gzipped.
+
+    """
+    delimiter = "\0" if separator == "nul" else "\x1e"
+    data = f"{delimiter.join(MESSAGES)}{delimiter}".encode()
+    path = tmp_path / "messages"
+    path.write_bytes(gzip.compress(data) if compressed else data)
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(
+            [
+                "calculate",
+                "--messages-from",
+                str(path),
+                "--separator",
+                separator,
+                "--all",
+            ]
+        )
+    assert e.value.code == 0
+    assert capsys.readouterr().out.split() == [
+        "0.1.0",
+        "0.1.1",
+        "0.1.1",
+        "1.0.0",
+        "1.0.1",
+    ]
+
+
+@pytest.mark.parametrize("chunk", (1, 4, 1 << 16))
+def test_read_chunks(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch, chunk: int
+) -> None:
+    """Test messages spanning many (or sharing single) chunks are read whole.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        monkeypatch:
+            Fixture shrinking the read buffer.
+        chunk:
+            Number of bytes read at once.
+
+    """
+    path = tmp_path / "messages"
+    path.write_bytes("\0\0".join(MESSAGES).encode())
+    monkeypatch.setattr(_messages, "CHUNK", chunk)
+    assert list(_messages.read(str(path))) == list(MESSAGES)
+
+
+def test_stdin(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test `calculate --messages-from -` reading the standard input.
+
+    Args:
+        monkeypatch:
+            Fixture replacing the standard input.
+        capsys:
+            Fixture capturing the output.
+
+    """
+    stdin = io.TextIOWrapper(
+        io.BufferedReader(io.BytesIO("\0".join(MESSAGES).encode()))
+    )
+    monkeypatch.setattr("sys.stdin", stdin)
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(
+            [
+                "calculate",
+                "--messages-from",
+                "-",
+                "--format",
+                "json",
+                "--checksum",
+            ]
+        )
+    assert e.value.code == 0
+    output = json.loads(capsys.readouterr().out)
+    assert output["version"] == "1.0.1"
+    assert "checksum" in output
+
+
+def test_no_git(tmp_path: pathlib.Path) -> None:
+    """Test `GitPython` is never imported.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+
+    """
+    (tmp_path / "messages").write_bytes("\0".join(MESSAGES).encode())
+    code = (
+        "import sys\n"
+        "from comver import _cli\n"
+        "try:\n"
+        f"    _cli.main(['calculate', '--messages-from', {str(tmp_path / 'messages')!r}])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'git.repo' not in sys.modules, 'GitPython imported'\n"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=False,
+        text=True,
+        cwd=tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "1.0.1"
+
+
+@pytest.mark.parametrize(
+    ("message", "unrecognized", "code", "output"),
+    (
+        ("feat: a\n# Comment\n", "error", 0, "minor"),
+        (
+            "fix!: a\n\n# ------------------------ >8 ------------------------\n",
+            "error",
+            0,
+            "major",
+        ),
+        ("chore: a\n", "ignore", 0, "none"),
+        ("chore: a\n", "error", 1, ""),
+    ),
+)
+def test_check_message(  # noqa: PLR0913, PLR0917
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    message: str,
+    unrecognized: str,
+    code: int,
+    output: str,
+) -> None:
+    """Test `check-message` outputs the bump (or rejects the message).
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        monkeypatch:
+            Fixture changing the working directory.
+        capsys:
+            Fixture capturing the output.
+        message:
+            Content of the message file.
+        unrecognized:
+            Configured `unrecognized_message`.
+        code:
+            Expected exit code.
+        output:
+            Expected bump.
+
+    """
+    (tmp_path / "pyproject.toml").write_text(
+        f'[tool.comver]\nunrecognized_message = "{unrecognized}"\n'
+    )
+    (tmp_path / "COMMIT_EDITMSG").write_text(message)
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["check-message", "COMMIT_EDITMSG"])
+    assert e.value.code == code
+    assert capsys.readouterr().out.strip() == output
+
+
+def test_check_message_startup(tmp_path: pathlib.Path) -> None:
+    """Test `check-message` imports neither `GitPython` nor `asyncio`.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+
+    """
+    code = (
+        "import sys\n"
+        "from comver import _cli\n"
+        "try:\n"
+        "    _cli.main(['check-message', '-'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'git.repo' not in sys.modules, 'GitPython imported'\n"
+        "assert 'asyncio' not in sys.modules, 'asyncio imported'\n"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        input="feat(cli): a",
+        capture_output=True,
+        check=False,
+        text=True,
+        cwd=tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "minor"
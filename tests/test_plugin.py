@@ -24,6 +24,8 @@ from hypothesis import strategies as st
 
 import comver
 
+from comver import error
+
 
 @st.composite
 def repository(
@@ -98,6 +100,8 @@ def _hatchling(repository: str, **kwargs: dict[str, list[str] | None]) -> str:
     ).get_version_data()["version"]
 
 
+# Options are provided to the plugins only (see `test_hatchling_options`)
+@pytest.mark.filterwarnings("ignore::comver.error.PluginOptionsWarning")
 @pytest.mark.parametrize("plugin", (comver.plugin.pdm, _hatchling))
 @pytest.mark.parametrize("message_includes", (None, (".*", "whatever")))
 @pytest.mark.parametrize("message_excludes", (None, (r".*\[no version\].*",)))
@@ -211,3 +215,46 @@ def test_smoke_hatchling() -> None:
         comver.plugin.ComverVersionSource
         == comver.plugin.hatch_register_version_source()
     )
+
+
+def test_hatchling_options(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test `[tool.hatch.version]` supports all options (resolved once).
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        monkeypatch:
+            Fixture changing the working directory and patching the walk.
+
+    """
+    repo = git.Repo.init(tmp_path)
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+    repo.git.commit("--allow-empty", "-m", "feat: a")
+    repo.git.commit("--allow-empty", "-m", "perf: b")
+    monkeypatch.chdir(tmp_path)
+
+    config = {
+        "source": "comver",
+        "patch_regexes": ["^perf: "],
+        "major_regexes": ["^feat: "],
+        "unrecognized_message": "error",
+    }
+    source = comver.plugin.ComverVersionSource(
+        root=str(tmp_path), config=config
+    )
+    # Options are not read by the CLI, hence checksums differ
+    with pytest.warns(error.PluginOptionsWarning) as records:
+        assert source.get_version_data() == {"version": "1.0.1"}
+    assert typing.cast(
+        "error.PluginOptionsWarning", records[0].message
+    ).options == ["major_regexes", "patch_regexes", "unrecognized_message"]
+
+    # The same HEAD and rules, the history is not walked again
+    monkeypatch.setattr(
+        comver.Version, "from_git_configured", pytest.fail, raising=True
+    )
+    assert source.get_version_data() == {"version": "1.0.1"}
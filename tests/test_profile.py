@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test `--profile` reports of the CLI."""
+
+from __future__ import annotations
+
+import json
+import typing
+
+import git
+
+import pytest
+
+from comver import _cli
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.fixture
+def repo(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> git.Repo:
+    """Create repository (with path rules) in the working directory.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        monkeypatch:
+            Fixture changing the working directory.
+
+    Returns:
+        Initialized repository.
+
+    """
+    repo = git.Repo.init(tmp_path, initial_branch="main")
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.comver]\npath_excludes = ["^docs/"]\n'
+        'author_name_excludes = ["Bot"]\n'
+    )
+    for path, message, author in (
+        ("src/a", "feat: a", None),
+        ("docs/b", "feat: b", None),
+        ("src/c", "fix: c", "Bot <bot@x.y>"),
+        ("src/d", "chore: d", None),
+    ):
+        file = tmp_path / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(message)
+        repo.git.add(path)
+        repo.git.commit("-m", message, author=author)
+
+    monkeypatch.chdir(tmp_path)
+    return repo
+
+
+def test_profile_json(
+    repo: git.Repo, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test JSON report counts phases, walked and filtered commits.
+
+    Args:
+        repo:
+            Repository to profile.
+        capsys:
+            Fixture capturing the output.
+
+    """
+    path = f"{repo.working_dir}/profile.json"
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["calculate", "--profile", path])
+    assert e.value.code == 0
+    assert capsys.readouterr().out
+
+    with open(path) as handle:  # noqa: PTH123
+        report = json.load(handle)
+    assert report["wall"] > 0
+    assert report["peak_memory"] > 0
+
+    counters = report["counters"]
+    assert counters["commits"] == 4  # noqa: PLR2004
+    assert counters["filtered.author_name"] == 1
+    phases = report["phases"]
+    assert phases["diff"]["calls"] == counters["commits"]
+    assert phases["classification"]["calls"] == counters["commits"] - sum(
+        value for name, value in counters.items() if name.startswith("filt")
+    )
+    assert {"config", "traversal", "author", "path"} <= set(report["phases"])
+
+
+@pytest.mark.usefixtures("repo")
+def test_profile_stderr(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test human readable report of `verify` written to stderr.
+
+    Args:
+        capsys:
+            Fixture capturing the output.
+
+    """
+    with pytest.raises(SystemExit):
+        _cli.main(["calculate", "--sha", "--checksum"])
+    version, sha, checksum = capsys.readouterr().out.split()
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["verify", version, sha, checksum, "--profile"])
+    assert e.value.code == 0
+    captured = capsys.readouterr()
+    assert "traversal" in captured.err
+    assert "commits" in captured.err
+    assert "traversal" not in captured.out
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test checking ranges of pushed commits (`check-range`)."""
+
+from __future__ import annotations
+
+import io
+import typing
+
+import git
+
+import pytest
+
+from comver import _cli
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+ZERO = "0" * 40
+
+
+def commit(repo: git.Repo, message: str, author: str = "Alice") -> str:
+    """Create an empty commit with a given message.
+
+    Args:
+        repo:
+            Repository to commit to.
+        message:
+            Message of the commit.
+        author:
+            Name of the author.
+
+    Returns:
+        Sha of the commit.
+
+    """
+    repo.git.commit(
+        "--allow-empty", "-m", message, f"--author={author} <a@example.com>"
+    )
+    return repo.head.commit.hexsha
+
+
+@pytest.fixture
+def repo(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> git.Repo:
+    """Create repository with `main` and (unmerged) `feature` branches.
+
+    Messages not recognized by the rules are errors and commits
+    of `bot` are not checked.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        monkeypatch:
+            Fixture changing the working directory.
+
+    Returns:
+        Initialized repository.
+
+    """
+    repo = git.Repo.init(tmp_path, initial_branch="main")
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.comver]\n"
+        'unrecognized_message = "error"\n'
+        'author_name_excludes = ["bot"]\n'
+    )
+    commit(repo, "feat: a")
+    repo.git.checkout("-b", "feature")
+    commit(repo, "fix: b")
+    commit(repo, "chore: c", author="bot")
+    commit(repo, "feat: d")
+    repo.git.checkout("main")
+    monkeypatch.chdir(tmp_path)
+    return repo
+
+
+def check(
+    args: list[str], capsys: pytest.CaptureFixture[str]
+) -> tuple[int, str, str]:
+    """Run `check-range`.
+
+    Args:
+        args:
+            Arguments of the subcommand.
+        capsys:
+            Fixture capturing the output.
+
+    Returns:
+        Exit code, standard output and standard error.
+
+    """
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["check-range", *args])
+    captured = capsys.readouterr()
+    return typing.cast("int", e.value.code), captured.out, captured.err
+
+
+@pytest.mark.usefixtures("repo")
+def test_range(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test the explicit range (commits of `bot` are not checked).
+
+    Args:
+        capsys:
+            Fixture capturing the output.
+
+    """
+    code, out, err = check(["main..feature"], capsys)
+    assert code == 0, err
+    assert out == "main..feature minor 0.1.0\n"
+
+
+def test_pre_receive(
+    repo: git.Repo,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test ranges read from stdin (updated, created and deleted refs).
+
+    Args:
+        repo:
+            Repository with `main` and `feature` branches.
+        monkeypatch:
+            Fixture replacing the standard input.
+        capsys:
+            Fixture capturing the output.
+
+    """
+    main = repo.head.commit.hexsha
+    repo.git.checkout("-b", "other")
+    first = commit(repo, "wip")
+    second = commit(repo, "still wip")
+    new = commit(repo, "fix: e")
+    repo.git.checkout("main")
+    repo.git.branch("-D", "other")
+
+    lines = (
+        f"{main} {repo.commit('feature').hexsha} refs/heads/main\n"
+        f"{ZERO} {new} refs/heads/other\n"
+        f"{main} {ZERO} refs/heads/old\n"
+    )
+    monkeypatch.setattr("sys.stdin", io.StringIO(lines))
+    code, out, err = check([], capsys)
+    assert code == 1
+    assert out == "refs/heads/main minor 0.1.0\nrefs/heads/other patch 0.0.1\n"
+    assert [line.split()[0] for line in err.splitlines()] == [first, second]
+
+    monkeypatch.setattr("sys.stdin", io.StringIO(lines))
+    code, out, err = check(["--fail-fast"], capsys)
+    assert code == 1
+    assert out == "refs/heads/main minor 0.1.0\nrefs/heads/other none 0.0.0\n"
+    assert [line.split()[0] for line in err.splitlines()] == [first]
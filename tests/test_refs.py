@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test versions of many refs calculated in a single walk."""
+
+from __future__ import annotations
+
+import itertools
+import typing
+
+import git
+
+import pytest
+
+import comver
+
+from comver import _cli, error
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+DATES = itertools.count(1_700_000_000, 60)
+
+
+def commit(repo: git.Repo, message: str) -> None:
+    """Create an empty commit with a given message (and increasing date).
+
+    Args:
+        repo:
+            Repository to commit to.
+        message:
+            Message of the commit.
+
+    """
+    date = f"@{next(DATES)} +0000"
+    with repo.git.custom_environment(
+        GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date
+    ):
+        repo.git.commit("--allow-empty", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path: pathlib.Path) -> git.Repo:
+    """Create repository with release and feature branches.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+
+    Returns:
+        Initialized repository.
+
+    """
+    repo = git.Repo.init(tmp_path, initial_branch="main")
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+
+    commit(repo, "feat: a")
+    commit(repo, "fix: b")
+    repo.git.branch("release")
+    commit(repo, "feat!: c")
+    repo.git.branch("feature")
+    commit(repo, "fix: d")
+
+    repo.git.checkout("release")
+    commit(repo, "fix: backport")
+    repo.git.checkout("feature")
+    commit(repo, "feat: e")
+    repo.git.checkout("main")
+    repo.git.merge("release", "--no-ff", "-m", "fix: merge release")
+    return repo
+
+
+@pytest.mark.parametrize(
+    "rules",
+    ({}, {"message_excludes": [".*backport.*"]}, {"minor_regexes": ["^fix"]}),
+)
+def test_refs(repo: git.Repo, rules: dict[str, list[str]]) -> None:
+    """Test versions of refs agree with separate walks.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        rules:
+            Rules used for calculation.
+
+    """
+    refs = ["main", "release", "feature", "HEAD~1", "main"]
+    versions = comver.Version.from_git_refs(refs, rules, repository=repo)
+    assert list(versions) == ["main", "release", "feature", "HEAD~1"]
+
+    for ref, output in versions.items():
+        *_, expected = comver.Version.from_git(
+            repository=repo, rev=ref, **rules
+        )
+        assert output == expected
+
+
+def test_calculate(
+    repo: git.Repo,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test `calculate --ref` outputs a line per ref.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        monkeypatch:
+            Fixture changing the working directory.
+        capsys:
+            Fixture capturing the output.
+
+    """
+    monkeypatch.chdir(str(repo.working_tree_dir))
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["calculate", "--ref", "release", "--ref", "feature"])
+    assert e.value.code == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "release 0.1.2",
+        "feature 1.1.0",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("traversal", "expected"),
+    (("all", "1.0.3"), ("first-parent", "1.0.2"), ("merges-only", "0.0.1")),
+)
+def test_traversal(repo: git.Repo, traversal: str, expected: str) -> None:
+    """Test traversal modes (with and without checkpoints).
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        traversal:
+            Traversal mode.
+        expected:
+            Version of `main` walked in the given mode.
+
+    """
+    for cache in (False, True, True):
+        *_, output = comver.Version.from_git(
+            repository=repo,
+            cache=cache,
+            checkpoint_interval=1,
+            traversal=traversal,  # pyright: ignore [reportArgumentType]
+        )
+        assert str(output.version) == expected
+
+    versions = comver.Version.from_git_refs(
+        ["main", "release"],
+        repository=repo,
+        traversal=traversal,  # pyright: ignore [reportArgumentType]
+    )
+    for ref, output in versions.items():
+        separate = list(
+            comver.Version.from_git(
+                repository=repo,
+                rev=ref,
+                traversal=traversal,  # pyright: ignore [reportArgumentType]
+            )
+        )
+        # `release` has no merges, hence nothing is yielded
+        assert output.version == (
+            separate[-1].version if separate else comver.Version()
+        )
+
+
+def test_traversal_unknown(repo: git.Repo) -> None:
+    """Test unknown traversal mode raises an error."""
+    with pytest.raises(error.TraversalUnknownError):
+        list(
+            comver.Version.from_git(
+                repository=repo,
+                traversal="random",  # pyright: ignore [reportArgumentType]
+            )
+        )
@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test regex safety checks, engines, message size caps and scopes."""
+
+from __future__ import annotations
+
+import importlib.util
+import typing
+
+import pytest
+
+import comver
+
+from comver import _config, _regex, error
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.mark.parametrize(
+    ("pattern", "unsafe"),
+    (
+        ("(a+)+$", True),
+        ("(a*b?)*", True),
+        ("(a|a)*$", True),
+        ("(.|x)*y", True),
+        ("(?=(a+)+)", True),
+        ("(a|b)*", False),
+        ("(?>a+)+", False),
+        ("(a++)+", False),
+        ("^feat(\\(.*?\\))?: .*", False),
+        (".*BREAKING CHANGE.*|^(feat|fix)(\\(.*?\\))?!: .*", False),
+        ("[", False),
+    ),
+)
+def test_reason(pattern: str, unsafe: bool) -> None:  # noqa: FBT001
+    """Test detection of super-linear patterns.
+
+    Args:
+        pattern:
+            Checked regex.
+        unsafe:
+            Whether the regex should be reported.
+
+    """
+    assert (_regex.safety.reason(pattern) is not None) == unsafe
+
+
+def test_load(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test unsafe regexes (also of components) are reported on load.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        monkeypatch:
+            Fixture changing the working directory.
+
+    """
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.comver]\n"
+        'major_regexes = ["(a+)+$", "^feat!"]\n'
+        "[tool.comver.components.core]\n"
+        'path_includes = ["(.|x)*core"]\n'
+    )
+    monkeypatch.chdir(tmp_path)
+    with pytest.warns(error.RegexUnsafeWarning) as records:
+        _config.load()
+    options = sorted(
+        typing.cast("error.RegexUnsafeWarning", r.message).option
+        for r in records
+    )
+    assert options == ["components.core.path_includes", "major_regexes"]
+
+
+def test_max_message_size() -> None:
+    """Test messages are truncated (with a warning) before matching."""
+    message = "fix: a\n\n" + "x" * 100 + "\nBREAKING CHANGE: b"
+    assert comver.Version.from_message(
+        message, major_regexes=["(?s:.*)BREAKING"]
+    ) == comver.Version(1, 0, 0)
+
+    with pytest.warns(error.MessageTruncatedWarning, match="'fix: a'"):
+        versions = list(
+            comver.Version.from_messages(
+                [message, "fix: c"],
+                major_regexes=["(?s:.*)BREAKING"],
+                max_message_size=50,
+            )
+        )
+    assert versions == [comver.Version(0, 0, 1), comver.Version(0, 0, 2)]
+
+
+def test_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test `re2` engine (unavailable if not installed).
+
+    Args:
+        monkeypatch:
+            Fixture setting the environment variable.
+
+    """
+    monkeypatch.setenv("COMVER_REGEX_ENGINE", "re2")
+    if importlib.util.find_spec("re2") is None:
+        with pytest.raises(error.RegexEngineUnavailableError):
+            comver.Version.from_message("feat: a")
+    else:
+        assert comver.Version.from_message("feat: a") == comver.Version(0, 1)
+
+    monkeypatch.setenv("COMVER_REGEX_ENGINE", "pcre")
+    with pytest.raises(error.RegexEngineUnavailableError):
+        comver.Version.from_message("feat: a")
+
+
+@pytest.mark.parametrize(
+    ("message", "header", "body", "trailers"),
+    (
+        ("feat: a", "feat: a", "", ""),
+        ("feat: a\n\nb\n\nc", "feat: a", "b\n\nc", ""),
+        (
+            "feat: a\n\nb\n\nRefs: #1\nBREAKING CHANGE: c\n",
+            "feat: a",
+            "b",
+            "Refs: #1\nBREAKING CHANGE: c",
+        ),
+        (
+            "feat: a\n\nBREAKING-CHANGE: c\n  continued",
+            "feat: a",
+            "",
+            "BREAKING-CHANGE: c\n  continued",
+        ),
+        (
+            "feat: a\n\nb\n\nRefs: #1\nnot a trailer",
+            "feat: a",
+            "b\n\nRefs: #1\nnot a trailer",
+            "",
+        ),
+    ),
+)
+def test_sections(message: str, header: str, body: str, trailers: str) -> None:
+    """Test splitting of messages into sections.
+
+    Args:
+        message:
+            The message.
+        header:
+            Expected first line.
+        body:
+            Expected body.
+        trailers:
+            Expected trailers.
+
+    """
+    sections = _regex.scope.Sections(message)
+    assert sections["header"] == header
+    assert sections["body"] == body
+    assert sections["trailers"] == trailers
+    assert sections["full"] == sections[None] == message
+
+
+def test_scopes() -> None:
+    """Test message rules scan only their scoped sections."""
+    message = "fix: a\n\nfeat: mentioned\n\nBREAKING CHANGE: b"
+    major = ["(?s:.*)BREAKING CHANGE: "]
+
+    assert comver.Version.from_message(
+        message, minor_regexes=["(?s:.*)feat: "]
+    ) == comver.Version(0, 1)
+    assert comver.Version.from_message(
+        message,
+        major_regexes=major,
+        minor_regexes=["(?s:.*)feat: "],
+        scopes={"major_regexes": "header", "minor_regexes": "header"},
+    ) == comver.Version(0, 0, 1)
+    assert comver.Version.from_message(
+        message, major_regexes=major, scopes={"major_regexes": "trailers"}
+    ) == comver.Version(1)
+    assert comver.Version.from_message(
+        message,
+        message_excludes=["feat"],
+        scopes={"message_excludes": "trailers"},
+    ) == comver.Version(0, 0, 1)
+
+    with pytest.raises(error.ScopeUnknownError):
+        comver.Version.from_message(message, scopes={"major_regexes": "tail"})  # pyright: ignore [reportArgumentType]
+    with pytest.raises(error.ScopeUnknownError):
+        comver.Version.from_message(message, scopes={"path_includes": "body"})
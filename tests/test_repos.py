@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test versions of many repositories calculated concurrently."""
+
+from __future__ import annotations
+
+import io
+import json
+import typing
+
+import git
+
+import pytest
+
+from comver import _cli
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+
+def create(path: pathlib.Path, messages: list[str], config: str = "") -> str:
+    """Create repository with empty commits.
+
+    Args:
+        path:
+            Directory of the repository.
+        messages:
+            Messages of the consecutive commits.
+        config:
+            Content of `.comver.toml` (if any, committed with the first
+            commit).
+
+    Returns:
+        Path of the repository.
+
+    """
+    repo = git.Repo.init(path)
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+    if config:
+        (path / ".comver.toml").write_text(config)
+        repo.index.add([".comver.toml"])
+    for message in messages:
+        repo.git.commit("--allow-empty", "-m", message)
+    return str(path)
+
+
+def test_repos(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test `calculate --repos` with per repository configuration.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        monkeypatch:
+            Fixture replacing the standard input.
+        capsys:
+            Fixture capturing the output.
+
+    """
+    plain = create(tmp_path / "plain", ["feat: a", "fix: b"])
+    configured = create(
+        tmp_path / "configured",
+        ["feat: a", "fix: b"],
+        'minor_regexes = ["^fix"]\n',
+    )
+    bare = str(tmp_path / "bare")
+    git.Repo.clone_from(plain, bare, bare=True)
+    configured_bare = str(tmp_path / "configured-bare")
+    git.Repo.clone_from(configured, configured_bare, bare=True)
+    missing = str(tmp_path / "missing")
+
+    monkeypatch.setattr(
+        "sys.stdin",
+        io.StringIO(
+            f"# Comment\n{plain}\n\n{configured}\n{bare}\n"
+            f"{configured_bare}\n{missing}"
+        ),
+    )
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["calculate", "--repos", "-", "--sha", "--jobs", "2"])
+    assert e.value.code == 1
+
+    outputs = {
+        output["repository"]: output
+        for output in map(json.loads, capsys.readouterr().out.splitlines())
+    }
+    assert outputs.keys() == {plain, configured, bare, configured_bare, missing}
+    assert outputs[plain]["version"] == "0.1.1"
+    assert outputs[configured]["version"] == "0.1.0"
+    assert outputs[bare]["sha"] == outputs[plain]["sha"]
+    # Configuration of bare repositories is read from the HEAD tree
+    assert outputs[configured_bare]["version"] == "0.1.0"
+    assert "version" not in outputs[missing]
+    assert "error" in outputs[missing]
+
+
+def test_repos_success(
+    tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test `calculate --repos` exits with `0` if all repositories succeeded.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        capsys:
+            Fixture capturing the output.
+
+    """
+    paths = [create(tmp_path / str(i), ["feat!: a"] * i) for i in range(4)]
+    (tmp_path / "repos.txt").write_text("\n".join(paths[1:]))
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(
+            ["calculate", "--repos", str(tmp_path / "repos.txt"), "--checksum"]
+        )
+    assert e.value.code == 0
+
+    outputs = [
+        json.loads(line) for line in capsys.readouterr().out.splitlines()
+    ]
+    assert sorted(output["version"] for output in outputs) == [
+        "1.0.0",
+        "2.0.0",
+        "3.0.0",
+    ]
+    assert all("checksum" in output for output in outputs)
+
+
+def test_repos_base(
+    tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test `calculate --repos` applies the history horizon of repositories.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        capsys:
+            Fixture capturing the output.
+
+    """
+    path = create(
+        tmp_path / "based",
+        ["feat: a", "fix: b"],
+        '[base]\nversion = "4.0.0"\nmax_commits = 1\n',
+    )
+
+    (tmp_path / "repos.txt").write_text(path)
+
+    with pytest.raises(SystemExit) as e:
+        _cli.main(["calculate", "--repos", str(tmp_path / "repos.txt")])
+    assert e.value.code == 0
+    assert json.loads(capsys.readouterr().out)["version"] == "4.0.1"
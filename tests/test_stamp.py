@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test versions stamped for builds without the git history."""
+
+from __future__ import annotations
+
+import json
+import pathlib
+import shutil
+
+import git
+
+import pytest
+
+import comver
+
+from comver import _cli, _config, _stamp, error
+
+
+@pytest.fixture
+def project(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> git.Repo:
+    """Create stamped project (`0.1.0` version).
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        monkeypatch:
+            Fixture changing the working directory.
+
+    Returns:
+        Repository of the project.
+
+    """
+    directory = tmp_path / "project"
+    repo = git.Repo.init(directory)
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+    (directory / "pyproject.toml").write_text(
+        '[tool.comver]\nmessage_excludes = ["skip"]\n'
+    )
+    repo.git.commit("--allow-empty", "-m", "fix: a")
+    repo.git.commit("--allow-empty", "-m", "feat: b")
+    repo.git.commit("--allow-empty", "-m", "feat: c [skip]")
+    monkeypatch.chdir(directory)
+    with pytest.raises(SystemExit):
+        _cli.main(["stamp"])
+    return repo
+
+
+def test_stamp(project: git.Repo) -> None:
+    """Test the stamp contents (as output by `calculate --sha --checksum`).
+
+    Args:
+        project:
+            Repository of the stamped project.
+
+    """
+    stamp = json.loads(
+        pathlib.Path(project.working_dir, _stamp.FILE).read_text()
+    )
+    assert stamp == {
+        "version": "0.1.0",
+        "sha": project.head.commit.hexsha,
+        "head": project.head.commit.hexsha,
+        "checksum": _config.checksum(_config.load()),
+    }
+
+
+def test_without_git(
+    project: git.Repo,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test plugins use the stamp (if the configuration matches).
+
+    Args:
+        project:
+            Repository of the stamped project.
+        tmp_path:
+            Temporary directory provided by `pytest`.
+        monkeypatch:
+            Fixture changing the working directory.
+
+    """
+    sdist = tmp_path / "sdist"
+    sdist.mkdir()
+    for name in ("pyproject.toml", _stamp.FILE):
+        shutil.copy(f"{project.working_dir}/{name}", sdist)
+    monkeypatch.chdir(sdist)
+
+    assert comver.plugin.pdm() == "0.1.0"
+    assert comver.plugin.ComverVersionSource(
+        root=str(sdist), config={"source": "comver"}
+    ).get_version_data() == {"version": "0.1.0"}
+
+    # Other rules would give other version, the history is required
+    with (
+        pytest.warns(error.PluginOptionsWarning),
+        pytest.raises(git.InvalidGitRepositoryError),
+    ):
+        comver.plugin.pdm(message_excludes=["fix"])
+
+
+def test_stale(project: git.Repo) -> None:
+    """Test the stamp is not used if the repository moved past it.
+
+    Args:
+        project:
+            Repository of the stamped project.
+
+    """
+    assert comver.plugin.pdm() == "0.1.0"
+    project.git.commit("--allow-empty", "-m", "feat: d")
+    assert comver.plugin.pdm() == "0.2.0"
+
+
+def test_head(project: git.Repo) -> None:
+    """Test staleness is checked against the stamped `HEAD`.
+
+    Args:
+        project:
+            Repository of the stamped project.
+
+    """
+    stamp = _stamp.Stamp.read()
+    assert stamp is not None
+
+    # Commit of the version is not `HEAD` (e.g. excluded by paths)
+    head = project.head.commit.hexsha
+    _stamp.Stamp(
+        "9.9.9", project.commit("HEAD~1").hexsha, head, stamp.checksum
+    ).write()
+    assert comver.plugin.pdm() == "9.9.9"
+
+    # Stamped `HEAD` unknown to the repository (e.g. a shallow clone)
+    _stamp.Stamp("9.9.9", stamp.sha, "0" * 40, stamp.checksum).write()
+    assert comver.plugin.pdm() == "0.1.0"
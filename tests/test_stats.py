@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: © 2025 open-nudge <https://github.com/open-nudge>
+# SPDX-FileContributor: szymonmaszke <github@maszke.co>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# pyright: reportUnusedCallResult=false
+
+"""Test statistics collected through the Python API."""
+
+from __future__ import annotations
+
+import inspect
+import typing
+
+import git
+
+import pytest
+
+import comver
+
+from comver import _profile
+from comver.stats import Stats
+
+if typing.TYPE_CHECKING:
+    import pathlib
+
+
+@pytest.fixture
+def repo(tmp_path: pathlib.Path) -> git.Repo:
+    """Create repository with commits of two authors.
+
+    Args:
+        tmp_path:
+            Temporary directory provided by `pytest`.
+
+    Returns:
+        Initialized repository.
+
+    """
+    repo = git.Repo.init(tmp_path, initial_branch="main")
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Alice")
+        writer.set_value("user", "email", "alice@example.com")
+
+    for message in ("feat: a", "fix: b", "chore: c"):
+        repo.git.commit("--allow-empty", "-m", message)
+    repo.git.commit("--allow-empty", "-m", "feat: d", author="Bot <bot@x.y>")
+    return repo
+
+
+def test_from_git(repo: git.Repo) -> None:
+    """Test counters and spans of `from_git`.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+
+    """
+    spans: list[str] = []
+    stats = Stats(on_span=lambda name, _, __: spans.append(name))
+    versions = list(
+        comver.Version.from_git(
+            repository=repo,
+            author_name_excludes=["Bot"],
+            message_excludes=["^chore"],
+            path_includes=[".*"],
+            backend="subprocess",
+            stats=stats,
+        )
+    )
+
+    assert len(versions) == 3  # noqa: PLR2004
+    assert stats.counters["commits"] == 4  # noqa: PLR2004
+    assert stats.counters["filtered.author_name"] == 1
+    assert stats.counters["filtered.message"] == 1
+    assert stats.counters["regex.author_name"] == 4  # noqa: PLR2004
+    assert stats.counters["regex.message"] == 3  # noqa: PLR2004
+    assert stats.counters["regex.semantic"] == 2  # noqa: PLR2004
+    assert stats.counters["bytes"] > 0
+    assert "regex.author_email" not in stats.counters
+    assert stats.spans["diff"].calls == 4  # noqa: PLR2004
+    assert stats.spans["classification"].calls == 3  # noqa: PLR2004
+    assert spans.count("diff") == 4  # noqa: PLR2004
+    assert set(stats.report()["phases"]) == set(spans)
+
+
+def test_cache(repo: git.Repo) -> None:
+    """Test cache hits and misses.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+
+    """
+    stats = Stats()
+    for _ in range(2):
+        list(comver.Version.from_git(repository=repo, cache=True, stats=stats))
+    assert stats.counters["cache.misses"] == 1
+    assert stats.counters["cache.hits"] == 1
+
+
+def test_detached(repo: git.Repo) -> None:
+    """Test statistics are collected only while the iterator runs.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+
+    """
+    stats = Stats()
+    for _ in comver.Version.from_git(repository=repo, stats=stats):
+        assert _profile._CURRENT.get() is None  # noqa: SLF001
+        _profile.count("commits")
+
+    assert stats.counters["commits"] == 4  # noqa: PLR2004
+
+    stats = Stats()
+    messages = ["feat: a", "chore: b", "fix: c"]
+    assert list(comver.Version.from_messages(messages, stats=stats))
+    assert stats.counters["regex.semantic"] == 3  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    "function",
+    (
+        comver.Version.from_git,
+        comver.Version.from_git_configured,
+        comver.Version.from_messages,
+    ),
+)
+def test_signature(function: typing.Callable[..., typing.Any]) -> None:
+    """Test `stats` is a keyword-only argument of the observed functions.
+
+    Args:
+        function:
+            Function collecting the statistics.
+
+    """
+    parameter = inspect.signature(function).parameters["stats"]
+    assert parameter.kind is inspect.Parameter.KEYWORD_ONLY
+    assert parameter.default is None
+
+
+def test_configured(repo: git.Repo, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test statistics are passed through the configured variant.
+
+    Args:
+        repo:
+            Repository to calculate versions for.
+        monkeypatch:
+            Fixture changing the working directory to the repository.
+
+    """
+    monkeypatch.chdir(repo.working_dir)
+    stats = Stats()
+    list(comver.Version.from_git_configured(repository=repo, stats=stats))
+    assert stats.counters["commits"] == 4  # noqa: PLR2004